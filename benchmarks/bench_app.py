@@ -0,0 +1,301 @@
+"""
+Hot-path benchmarks of the routine app, run headless, results written as JSON.
+
+    python benchmarks/bench_app.py --sizes 10 1000 100000 --output bench.json
+
+Store, language, session and fonctionbase benchmarks only need the standard library.
+Page benchmarks also need Kivy; they run with the mock GL backend and no visible window,
+and are reported as skipped when Kivy cannot start.
+Compare two runs with: python benchmarks/bench_app.py --compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Headless Kivy: must be set before any kivy import
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+os.environ.setdefault("KIVY_GL_BACKEND", "mock")
+
+import fonctionbase  # noqa: E402
+from routinedb import importer_donnees, SQLiteStore  # noqa: E402
+from routinelang import Catalog  # noqa: E402
+from routinemodel import Routine  # noqa: E402
+from routineplan import compile_plan  # noqa: E402
+from routinesession import RoutineSession  # noqa: E402
+from routinestats import LibraryStats  # noqa: E402
+from routinestore import JournalStore  # noqa: E402
+from routinetimer import countdown_text  # noqa: E402
+
+LANGUAGE_PATH = os.path.join(ROOT, "necessary", "language.json")
+
+
+def synthetic_library(count, seed=0):
+    """routinesV3.json data with `count` routines of 1 to 8 mixed timed/units exercises."""
+    rng = random.Random(seed)
+    routines = {}
+    for i in range(count):
+        name = f"Routine {i:06d}"
+        exercises = []
+        for j in range(rng.randint(1, 8)):
+            timed = rng.random() < 0.7
+            exercises.append({
+                "name": f"Exercise {j}",
+                "duration": rng.randint(10, 90) if timed else 0,
+                "repetitions": rng.randint(1, 5),
+                "rest": rng.choice([0, 10, 15, 30]),
+                "units": None if timed else rng.randint(5, 30),
+            })
+        routines[name] = {"name": name, "fonctions": exercises}
+    return {"first_time": False, "language": "English", "routines": routines}
+
+
+def measure(function, repeat, setup=None, number=1):
+    """Run function `number` times per sample; return per-call timings in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def bench_store(workdir, data, repeat):
+    results = {}
+    path = os.path.join(workdir, "routinesV3.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    remove(path + ".cache")
+
+    results["charger_routines_cold"] = measure(
+        lambda: JournalStore(path).load(), repeat, setup=lambda: remove(path + ".cache")
+    )
+    JournalStore(path).load()  # Leaves a parse cache behind
+    results["charger_routines_cached"] = measure(lambda: JournalStore(path).load(), repeat)
+
+    store = JournalStore(path)
+    store.load()
+    results["sauvegarder_routines"] = measure(store.compact, repeat)
+
+    # One mutation plus its durable journal append, as done by each UI action
+    ops = max(1, min(50, len(store.data["routines"]) // 2))
+    results["reorder_round_trip"] = measure(lambda: store.move_routine(0, 1), repeat, number=ops)
+    names = iter(list(store.data["routines"])[::-1])
+    deletable = min(ops, max(0, len(store.data["routines"]) - 1) // max(1, repeat))
+    if deletable:
+        results["delete_round_trip"] = measure(lambda: store.delete_routine(next(names)), repeat, number=deletable)
+
+    db_path = os.path.join(workdir, "routines.db")
+    importer_donnees(data, db_path)
+
+    def load_sqlite():
+        sqlite_store = SQLiteStore(db_path)
+        sqlite_store.load()
+        sqlite_store.close()
+    results["charger_routines_sqlite"] = measure(load_sqlite, repeat)
+    return results
+
+
+def bench_library(data, repeat):
+    routines = {name: Routine.from_v3(r) for name, r in data["routines"].items()}
+    return {"library_stats": measure(lambda: LibraryStats(routines), repeat)}
+
+
+def bench_session(data, repeat):
+    """Per-tick cost of the runner body: advance the session and format the countdown digits."""
+    routine = max(data["routines"].values(), key=lambda r: len(r["fonctions"]))
+    now = [0.0]
+    session = RoutineSession(compile_plan(routine), clock=lambda: now[0])
+    session.start()
+
+    def tick():
+        now[0] += 1.0
+        session.advance()
+        if session.finished:
+            now[0] = 0.0
+            session.__init__(session.plan, clock=session.clock)
+            session.start()
+        if session.countdown is not None:
+            countdown_text(session.countdown.remaining())
+    return {"update_routine_tick": measure(tick, repeat, number=1000)}
+
+
+def bench_language(repeat):
+    catalog = Catalog(LANGUAGE_PATH)
+    languages = catalog.languages
+
+    def switch_all():
+        for language in languages:
+            catalog.set_language(language)
+            catalog.text("home_page")
+            catalog.format("rest_title", next="Next")
+    result = measure(switch_all, repeat)
+    result["languages"] = len(languages)
+    return {"language_switch_all": result}
+
+
+def bench_fonctionbase(workdir, data, repeat):
+    legacy = {name: Routine.from_v3(r).to_legacy() for name, r in data["routines"].items()}
+    folder = os.path.join(workdir, "fonctionbase")
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, "routines.json"), "w") as f:
+        json.dump(legacy, f, indent=4)
+    previous = os.getcwd()
+    os.chdir(folder)  # fonctionbase reads routines.json from the working directory
+    try:
+        return {"fonctionbase_charger_routines": measure(fonctionbase.charger_routines, repeat)}
+    finally:
+        os.chdir(previous)
+
+
+def start_app(workdir, data):
+    """Build a RoutineApp without running its event loop; return it, or the reason it cannot start."""
+    try:
+        import kivy  # noqa: F401
+        from routineapp import RoutineApp
+    except Exception as e:  # Kivy missing, or no usable window provider
+        return None, f"{type(e).__name__}: {e}"
+    path = os.path.join(workdir, "gui", "routinesV3.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+    os.chdir(ROOT)  # Fonts and images are looked up relative to the repo
+    app = RoutineApp()
+    app.FILE_PATH = path
+    app.SAVE_WINDOW = 3600  # Keep disk writes out of the page timings
+    app.build()
+    app._startup_load_data(0)
+    app._startup_fonts(0)
+    return app, None
+
+
+def bench_pages(workdir, data, repeat):
+    app, reason = start_app(workdir, data)
+    if app is None:
+        return {"skipped": reason}
+    results = {}
+    names = list(app.routines)
+
+    def build_home():
+        app.home_page = None
+        app.set_root_content(app.page_accueil())
+    results["page_accueil"] = measure(build_home, repeat)
+    results["page_accueil_sync"] = measure(lambda: app.set_root_content(app.page_accueil()), repeat)
+    largest = max(names, key=lambda name: len(app.routines[name].exercises))
+    results["page_routine"] = measure(lambda: app.set_root_content(app.page_routine(largest)), repeat)
+
+    app.set_root_content(app.page_accueil())
+    if len(names) > 1:
+        results["deplacer_routine"] = measure(lambda: app.deplacer_routine(0, 1), repeat, number=10)
+
+    app.lancer_routine(largest)
+    results["update_routine_gui_tick"] = measure(lambda: app.update_routine(1.0), repeat, number=100)
+    app.set_root_content(app.page_accueil())
+    app.save_queue.close()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, repeat):
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {},
+    }
+    report["results"]["language"] = bench_language(repeat)
+    for size in sizes:
+        data = synthetic_library(size)
+        workdir = tempfile.mkdtemp(prefix=f"routine-bench-{size}-")
+        try:
+            results = {}
+            results.update(bench_store(workdir, data, repeat))
+            results.update(bench_library(data, repeat))
+            results.update(bench_session(data, repeat))
+            results.update(bench_fonctionbase(workdir, data, repeat))
+            results["pages"] = bench_pages(workdir, data, repeat)
+            report["results"][str(size)] = results
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return report
+
+
+def compare(old_path, new_path, threshold=0.10):
+    """Print benchmarks whose median changed by more than `threshold` between two reports."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    def flatten(results, prefix=""):
+        for key, value in results.items():
+            if isinstance(value, dict) and "median_ms" in value:
+                yield prefix + key, value["median_ms"]
+            elif isinstance(value, dict):
+                yield from flatten(value, f"{prefix}{key}.")
+
+    before = dict(flatten(old["results"]))
+    for name, after in flatten(new["results"]):
+        if name in before and before[name] > 0:
+            change = (after - before[name]) / before[name]
+            if abs(change) > threshold:
+                print(f"{name}: {before[name]:.3f} ms -> {after:.3f} ms ({change:+.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    report = run(args.sizes, args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
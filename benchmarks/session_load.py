@@ -0,0 +1,106 @@
+"""
+Load test: many simulated routine sessions driven in real time by one SessionScheduler on one core.
+
+    python benchmarks/session_load.py --sessions 10000 --seconds 20
+
+Prints one JSON object: segment changes handled, CPU time used and how late segments were entered.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routineplan import compile_plan  # noqa: E402
+from routineserver import SessionScheduler  # noqa: E402
+
+
+def synthetic_routine(rng, index):
+    """A timed routine of short segments, so every session changes segment every few seconds."""
+    return {
+        "name": f"load {index}",
+        "fonctions": [
+            {"name": f"exercise {j}", "duration": rng.randint(2, 6), "repetitions": rng.randint(1, 4),
+             "rest": rng.randint(0, 3), "units": None}
+            for j in range(rng.randint(3, 8))
+        ],
+    }
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run(sessions, seconds, seed):
+    rng = random.Random(seed)
+    scheduler = SessionScheduler()
+    lateness = []  # Seconds between a segment's deadline and the moment it was entered
+    entered = {}  # Session id -> last segment index seen, to ignore pause/resume notifications
+    finished = [0]  # Finished sessions leave the scheduler, so they are counted here
+
+    def measure(session):
+        if session.finished:
+            finished[0] += 1
+        countdown = session.countdown
+        if entered.get(session.id) != session.index and countdown is not None and not session.paused:
+            lateness.append(scheduler.clock() - countdown.start)
+        entered[session.id] = session.index
+
+    plans = [compile_plan(synthetic_routine(rng, i)) for i in range(sessions)]
+    start = scheduler.clock()
+    for plan in plans:
+        # Stagger starts over one second, like screens started by hand
+        scheduler.add(plan, start=start + rng.random())
+    for session in scheduler.sessions.values():
+        session.listeners.insert(0, measure)
+        entered[session.id] = session.index
+    lateness.clear()
+
+    cpu_start = time.process_time()
+    changes = 0
+    end = start + seconds
+    while True:
+        now = scheduler.clock()
+        if now >= end:
+            break
+        changes += scheduler.run_due(now)
+        if scheduler.sessions and rng.random() < 0.05:  # Occasional commands from the floor
+            session_id = rng.choice(list(scheduler.sessions))
+            scheduler.command(session_id, "toggle_pause")
+        deadline = scheduler.next_deadline()
+        time.sleep(max(0.0, min(end, deadline if deadline is not None else end) - scheduler.clock()))
+    cpu = time.process_time() - cpu_start
+
+    return {
+        "sessions": sessions,
+        "seconds": seconds,
+        "sessions_advanced": changes,
+        "segments_entered": len(lateness),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_share": round(cpu / seconds, 4),
+        "lateness_ms": {
+            "p50": round(percentile(lateness, 0.50) * 1000, 3),
+            "p99": round(percentile(lateness, 0.99) * 1000, 3),
+            "max": round(max(lateness, default=0.0) * 1000, 3),
+        },
+        "finished": finished[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.sessions, args.seconds, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import asyncio
+import sys
+import threading
+
+from fonctionbase import charger_routines
+from routineplan import MANUAL, REST, compile_plan
+from routinetimer import Countdown
+
+COMMANDES = ("pause", "reprendre", "passer", "fait", "quitter")
+
+
+class Seance:
+    """
+    Exécution non bloquante d'une routine sur une boucle asyncio.
+    - Les décomptes visent une échéance : pas de dérive, et ils s'interrompent dès qu'une commande arrive.
+    - Commandes : pause, reprendre, passer (repos ou décompte en cours), fait (exercice à unités), quitter.
+    - Plusieurs séances peuvent tourner sur la même boucle (une par poste d'un circuit).
+    """
+
+    def __init__(self, routine, nom=None, afficher=print):
+        self.plan = compile_plan(routine)
+        self.nom = nom or self.plan.name
+        self.afficher = afficher
+        self.index = 0  # Étape du plan en cours
+        self.countdown = None  # Décompte de l'étape en cours (None pour une étape à unités)
+        self.en_pause = False
+        self.terminee = False
+        self._suivant = False  # Demande de passer à l'étape suivante
+        self._reveil = None  # asyncio.Event créé dans la boucle, réveille le décompte sur commande
+
+    def _dire(self, texte):
+        self.afficher(f"[{self.nom}] {texte}")
+
+    async def executer(self):
+        """Exécute chaque étape du plan, en enchaînant les échéances des décomptes."""
+        self._reveil = asyncio.Event()
+        self._dire(f"Début de la routine : {self.plan.name}")
+        fin = None  # Échéance du dernier décompte
+        for self.index, etape in enumerate(self.plan):
+            if self.terminee:
+                break
+            if etape.kind == REST:
+                self._dire(f"  Temps de repos : {etape.duration} secondes")
+                fin = await self._decompte(etape.duration, fin)
+                continue
+
+            if etape.repetition == 1:
+                self._dire(f"Exercice {etape.exercise_index + 1}/{etape.exercise_count} : {etape.name}")
+
+            if etape.kind == MANUAL:
+                self._dire(f"  Répétition {etape.repetition}/{etape.repetitions} : {etape.units} unités (« fait » lorsque terminé)")
+                await self._attendre_suivant()
+                fin = None
+            else:
+                self._dire(f"  Répétition {etape.repetition}/{etape.repetitions} : {etape.duration} secondes")
+                fin = await self._decompte(etape.duration, fin)
+
+        self._dire("Routine arrêtée." if self.terminee else "Routine terminée !")
+        self.terminee = True
+
+    async def _dormir(self, delai):
+        """Attend `delai` secondes (indéfiniment si None), ou jusqu'à la prochaine commande."""
+        self._reveil.clear()
+        try:
+            await asyncio.wait_for(self._reveil.wait(), delai)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _decompte(self, duree, debut=None):
+        """Décompte annulable ; retourne son échéance, ou None s'il a été interrompu."""
+        self.countdown = Countdown(duree, start=debut)
+        if self.en_pause:
+            self.countdown.pause()
+        affiche = None
+        while not (self.countdown.expired() or self._suivant or self.terminee):
+            if not self.countdown.paused:
+                secondes = self.countdown.remaining_seconds()
+                if secondes != affiche:
+                    self._dire(f"  {secondes}...")
+                    affiche = secondes
+            await self._dormir(None if self.countdown.paused else self.countdown.time_to_next_second())
+
+        interrompu = self._suivant or self.terminee
+        fin = self.countdown.deadline
+        self.countdown = None
+        self._suivant = False
+        if interrompu:
+            return None  # L'étape suivante part de maintenant
+        self._dire("  Temps écoulé !")
+        return fin
+
+    async def _attendre_suivant(self):
+        while not (self._suivant or self.terminee):
+            await self._dormir(None)
+        self._suivant = False
+
+    def _reveiller(self):
+        if self._reveil is not None:
+            self._reveil.set()
+
+    # --- Commandes ---
+
+    def pause(self):
+        self.en_pause = True
+        if self.countdown:
+            self.countdown.pause()
+            self._dire("  En pause.")
+        self._reveiller()
+
+    def reprendre(self):
+        self.en_pause = False
+        if self.countdown:
+            self.countdown.resume()
+            self._dire("  Reprise.")
+        self._reveiller()
+
+    def passer(self):
+        """Écourte le décompte en cours (repos ou exercice minuté)."""
+        if self.countdown:
+            self._suivant = True
+            self._reveiller()
+
+    def fait(self):
+        """Valide l'exercice à unités en cours."""
+        if self.countdown is None and not self.terminee:
+            self._suivant = True
+            self._reveiller()
+
+    def quitter(self):
+        self.terminee = True
+        self._reveiller()
+
+    def commande(self, mot):
+        """Applique une commande texte ; retourne False si elle est inconnue."""
+        if mot not in COMMANDES:
+            return False
+        getattr(self, mot)()
+        return True
+
+
+def appliquer_commande(seances, ligne, afficher=print):
+    """
+    Applique une ligne de commande : « commande » pour toutes les séances,
+    ou « numéro commande » pour une seule (numéros à partir de 1).
+    """
+    mots = ligne.split()
+    if not mots:
+        return
+    cibles = seances
+    if len(mots) == 2 and mots[0].isdigit() and 1 <= int(mots[0]) <= len(seances):
+        cibles = [seances[int(mots[0]) - 1]]
+        mots = mots[1:]
+    if len(mots) != 1 or not all(seance.commande(mots[0]) for seance in cibles):
+        afficher(f"Commande inconnue. Commandes : {', '.join(COMMANDES)} (précédées d'un numéro de séance si besoin).")
+
+
+def _lire_lignes(boucle, file, flux):
+    """Thread de lecture : l'entrée standard bloque ici, jamais sur la boucle."""
+    for ligne in flux:
+        boucle.call_soon_threadsafe(file.put_nowait, ligne)
+    boucle.call_soon_threadsafe(file.put_nowait, None)  # Fin de l'entrée
+
+
+async def executer_seances(seances, flux=sys.stdin, afficher=print):
+    """Exécute plusieurs séances en parallèle ; les commandes sont lues sur `flux` en même temps."""
+    file = asyncio.Queue()
+    lecteur = threading.Thread(
+        target=_lire_lignes, args=(asyncio.get_running_loop(), file, flux), name="lecture-commandes", daemon=True
+    )
+    lecteur.start()
+
+    async def commandes():
+        while True:
+            ligne = await file.get()
+            if ligne is None:
+                # Plus aucune commande ne viendra : une étape à unités ou une pause attendrait pour toujours
+                restantes = [seance for seance in seances if not seance.terminee]
+                if restantes:
+                    afficher("Fin de l'entrée des commandes : arrêt des séances en cours.")
+                for seance in restantes:
+                    seance.quitter()
+                return
+            appliquer_commande(seances, ligne, afficher)
+
+    lecture = asyncio.ensure_future(commandes())
+    await asyncio.gather(*(seance.executer() for seance in seances))
+    lecture.cancel()
+
+
+def main(noms):
+    routines = charger_routines()
+    inconnues = [nom for nom in noms if nom not in routines]
+    if not noms or inconnues:
+        print("Usage : python fonctionasync.py <routine> [<routine> ...]")
+        if inconnues:
+            print(f"Routines introuvables : {', '.join(inconnues)}")
+        print(f"Routines disponibles : {', '.join(routines) or 'aucune'}")
+        return 1
+    seances = [Seance(routines[nom], f"{i} {nom}" if len(noms) > 1 else nom) for i, nom in enumerate(noms, 1)]
+    print(f"Commandes : {', '.join(COMMANDES)}" + (" (précédées du numéro de séance pour n'en viser qu'une)" if len(seances) > 1 else ""))
+    asyncio.run(executer_seances(seances))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
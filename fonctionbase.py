@@ -1,24 +1,31 @@
-import time
 import json
 import os
+from routinemodel import Exercise, Routine as RoutineModel
+from routineplan import REST, WORK, compile_plan
+from routinestats import LibraryStats
+from routinetimer import run_countdown
+
+class Fonction(Exercise):
+    """Exercice du modèle partagé, avec les noms d'attributs historiques."""
+    __slots__ = ()
 
-class Fonction:
     def __init__(self, nom, duree=None, repetitions=1, repos=0, unites=None, dureetot=None):
-        self.nom = nom
         if duree is not None and duree < 0:
             raise ValueError("La durée doit être positive.")
         if repetitions < 0 or repos < 0:
             raise ValueError("Les répétitions et le repos doivent être positifs.")
         if unites is not None and unites < 0:
             raise ValueError("Le nombre d'unités doit être positif.")
-        
-        self.duree = duree
-        self.repetitions = repetitions
-        self.repos = repos
-        self.unites = unites
-        
-        # Calculer dureetot à l'initialisation
-        self.dureetot = self.duree * self.repetitions + self.repos * self.repetitions
+        super().__init__(nom, duree, repetitions, repos, unites)
+
+    nom = property(lambda self: self.name, lambda self, v: setattr(self, "name", v))
+    duree = property(lambda self: self.duration, lambda self, v: setattr(self, "duration", v))
+    repos = property(lambda self: self.rest, lambda self, v: setattr(self, "rest", v))
+    unites = property(lambda self: self.units, lambda self, v: setattr(self, "units", v))
+
+    @property
+    def dureetot(self):
+        return self.to_legacy()["dureetot"]
     
     def __str__(self):
         if self.unites is not None:
@@ -31,10 +38,16 @@ class Fonction:
         return self.unites is None
 
 
-class Routine:
-    def __init__(self, nom, liste_fonctions=[]):
-        self.nom = nom
-        self.fonctions = liste_fonctions
+class Routine(RoutineModel):
+    """Routine du modèle partagé, avec les noms d'attributs historiques."""
+    __slots__ = ()
+    exercise_class = Fonction
+
+    def __init__(self, nom, liste_fonctions=None):
+        super().__init__(nom, liste_fonctions)  # Nouvelle liste par routine (plus de liste par défaut partagée)
+
+    nom = property(lambda self: self.name, lambda self, v: setattr(self, "name", v))
+    fonctions = property(lambda self: self.exercises, lambda self, v: setattr(self, "exercises", v))
     
     def __str__(self):
         return f"{self.nom} :\n" + "\n".join([str(f) for f in self.fonctions])
@@ -49,53 +62,49 @@ class Routine:
         """
         Calcule la durée totale de la routine.
         - Ignore la durée des exercices basés sur des unités, mais prend en compte le temps de repos.
+        - Pas de repos après la dernière répétition du dernier exercice.
         """
-        total = 0
-        for f in self.fonctions:
-            total += f.dureetot
-        f = self.fonctions[-1]
-        total -= f.repos  # Retirer le temps de repos après le dernier exercice
-        return total
+        return LibraryStats({self.nom: self}).total[0]
 
 
     def executer(self):
         """
-        Exécute chaque exercice de la routine.
+        Exécute chaque étape du plan de la routine.
         - Si l'exercice est basé sur un timer, lance un décompte.
         - Si basé sur des unités, attend une confirmation manuelle.
         """
         print(f"Début de la routine : {self.nom}")
-        for index, fonction in enumerate(self.fonctions, start=1):
-            print(f"\nExercice {index}/{len(self.fonctions)} : {fonction.nom}")
-            
-            for repetition in range(1, fonction.repetitions + 1):
-                if fonction.est_base_sur_timer():
-                    print(f"  Répétition {repetition}/{fonction.repetitions} : {fonction.duree} secondes")
-                    self._lancer_timer(fonction.duree)
-                else:
-                    print(f"  Répétition {repetition}/{fonction.repetitions} : {fonction.unites} unités")
-                    input("  Appuyez sur Entrée lorsque terminé.")
-                
-                # Repos après la répétition 
-                if (index < len(self.fonctions) and repetition == fonction.repetitions or repetition < fonction.repetitions) and fonction.repos != 0:
-                    print(f"  Temps de repos : {fonction.repos} secondes")
-                    self._lancer_timer(fonction.repos)
-
-        
+        fin = None  # Échéance du dernier décompte, pour enchaîner sans dérive
+        for etape in compile_plan(self):
+            if etape.kind == REST:
+                print(f"  Temps de repos : {etape.duration} secondes")
+                fin = self._lancer_timer(etape.duration, fin)
+                continue
+
+            if etape.repetition == 1:
+                print(f"\nExercice {etape.exercise_index + 1}/{etape.exercise_count} : {etape.name}")
+
+            if etape.kind == WORK:
+                print(f"  Répétition {etape.repetition}/{etape.repetitions} : {etape.duration} secondes")
+                fin = self._lancer_timer(etape.duration, fin)
+            else:
+                print(f"  Répétition {etape.repetition}/{etape.repetitions} : {etape.units} unités")
+                input("  Appuyez sur Entrée lorsque terminé.")
+                fin = None
+
         print("\nRoutine terminée !")
 
 
-    def _lancer_timer(self, duree):
-        """Affiche un décompte pour le timer."""
-        for i in range(duree, 0, -1):
-            print(f"  {i}...", end="\r")
-            time.sleep(1)
+    def _lancer_timer(self, duree, debut=None):
+        """Affiche un décompte pour le timer et retourne son échéance."""
+        fin = run_countdown(duree, lambda i: print(f"  {i}...", end="\r"), start=debut)
         print("  Temps écoulé !")
+        return fin
 
 # Sauvegarde les routines dans un fichier JSON
 def sauvegarder_routines(routines, fichier="routines.json"):
     with open(fichier, "w") as f:
-        json.dump(routines, f, default=lambda o: o.__dict__, indent=4)
+        json.dump({nom: routine.to_legacy() for nom, routine in routines.items()}, f, indent=4)
 
 # Charge les routines depuis un fichier JSON
 def charger_routines():
@@ -106,12 +115,7 @@ def charger_routines():
     with open('routines.json', 'r') as file:
         data = json.load(file)
     
-    routines = {}
-    for nom, details in data.items():
-        fonctions = [Fonction(**f) for f in details["fonctions"]]  # Crée des objets Fonction sans 'dureetot'
-        routines[nom] = Routine(nom, fonctions)
-    
-    return routines
+    return {nom: Routine.from_legacy(details) for nom, details in data.items()}
 
 
 def menu_principal():
@@ -203,4 +207,5 @@ def menu_gestion(routine, routines):
             break
 
 # Appel du menu principal pour lancer le programme
-menu_principal()
+if __name__ == "__main__":
+    menu_principal()
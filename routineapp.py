@@ -1,38 +1,57 @@
 import os
-import json
 import sys
+import time
+import weakref
+
+IMPORT_START = time.perf_counter()  # Start of the "imports" startup stage
+
+import routineprofile
+from routineprofile import profiled
+
+# --profile / ROUTINEAPP_PROFILE: read before Kivy parses the command line
+PROFILE_PATH = routineprofile.enable_from(sys.argv)
+
+from kivy.config import Config
+
+# Disable default multitouch behavior on desktop (e.g. prevents red dot on right-click)
+# Set before the window is created so it actually applies
+Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
+
+# Only what the class definitions and the first frame need is imported here;
+# page-specific widgets (Popup, ScrollView, DropDown...) are imported where they are used
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.textinput import TextInput
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.popup import Popup
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.clock import Clock
-from kivy.config import Config
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.image import Image
 from kivy.core.window import Window
-from kivy.graphics import Color, RoundedRectangle, Line, Rectangle
+from kivy.graphics import BorderImage, Color, Rectangle
 from kivy.uix.widget import Widget
-from kivy.uix.dropdown import DropDown
 from kivy.uix.behaviors import FocusBehavior
 from kivy.properties import BooleanProperty
-from kivy.uix.anchorlayout import AnchorLayout
 from kivy.properties import StringProperty
-
-# Disable default multitouch behavior on desktop (e.g. prevents red dot on right-click)
-Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
-
-def resource_path(relative_path):
-    """Return absolute path to resource, compatible with PyInstaller or normal execution."""
-    try:
-        # If bundled with PyInstaller
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # In normal execution
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from kivy.logger import Logger
+from routineassets import AssetManager, orientation
+from routineexchange import ExchangeError, iter_export_file, iter_import_file
+from routinelang import Catalog
+from routinemodel import Exercise, Routine
+from routineplan import MANUAL, REST, compile_plan
+from routinesession import RoutineSession
+from routinestats import LibraryStats, format_duration
+from routinestore import JournalStore, SaveQueue
+from routinetelemetry import SessionTelemetry
+from routinetimer import TimerEngine, countdown_text
+
+IMPORT_END = time.perf_counter()
+
+# Report window subscriptions that survive a page change (ROUTINEAPP_DEBUG_SUBSCRIPTIONS=1)
+DEBUG_SUBSCRIPTIONS = os.environ.get("ROUTINEAPP_DEBUG_SUBSCRIPTIONS") == "1"
+WATCHED_WINDOW_EVENTS = ("size", "on_resize", "on_key_down", "mouse_pos")
 
 class AutoResizeLabel(Label):
     """Label that adjusts its text size to fit the parent widget's width."""
@@ -97,48 +116,177 @@ class MyTextInput(TextInput):
         if len(self.text) < self.max_length or substring == "":
             super().insert_text(substring, from_undo=from_undo)
             
+class PageScope:
+    """Window and Clock subscriptions owned by one page, released when the page is replaced."""
+
+    def __init__(self):
+        self.bindings = []  # (dispatcher, callbacks) pairs
+        self.events = []  # Clock events
+        self.cleanups = []  # Extra callbacks run on release
+
+    def bind(self, dispatcher, **callbacks):
+        dispatcher.bind(**callbacks)
+        self.bindings.append((dispatcher, callbacks))
+
+    def schedule_once(self, callback, timeout=0):
+        event = Clock.schedule_once(callback, timeout)
+        self.events.append(event)
+        return event
+
+    def schedule_interval(self, callback, interval):
+        event = Clock.schedule_interval(callback, interval)
+        self.events.append(event)
+        return event
+
+    def add_cleanup(self, callback):
+        self.cleanups.append(callback)
+
+    def count(self, dispatcher, name):
+        """Number of `name` subscriptions this scope holds on `dispatcher`."""
+        return sum(1 for d, callbacks in self.bindings if d is dispatcher and name in callbacks)
+
+    def release(self):
+        for dispatcher, callbacks in self.bindings:
+            dispatcher.unbind(**callbacks)
+        for event in self.events:
+            event.cancel()
+        for callback in self.cleanups:
+            callback()
+        self.bindings, self.events, self.cleanups = [], [], []
+
+
+def window_observer_counts():
+    """Count the callbacks bound to the watched Window events."""
+    return {name: len(Window.get_property_observers(name)) for name in WATCHED_WINDOW_EVENTS}
+
+
 class FocusableForm(BoxLayout):
     def __init__(self, **kwargs):
         """BoxLayout that manages focus switching with TAB and triggering with ENTER."""
         super().__init__(**kwargs)
         self.widgets_list = []  # Stores widgets that can receive focus
-        Window.bind(on_key_down=self._on_key_down)  # Listen for keyboard input
+
+    def on_enter(self, scope):
+        """Listen for keyboard input while the page is displayed."""
+        scope.bind(Window, on_key_down=self._on_key_down)
 
     def register_focusable(self, widget):
-        """Register a widget as focusable with TAB."""
-        self.widgets_list.append(widget)
+        """Register a widget, or a RecycledList whose visible rows take its place, as focusable with TAB."""
+        if widget not in self.widgets_list:
+            self.widgets_list.append(widget)
+
+    def unregister_focusable(self, widget):
+        """Remove a widget from TAB navigation."""
+        if widget in self.widgets_list:
+            self.widgets_list.remove(widget)
+
+    def focus_order(self):
+        """
+        Displayed, enabled focusable widgets in TAB order, as (widget, list, row index).
+        A RecycledList contributes the widgets of its visible rows, sorted by data index.
+        """
+        order = []
+        for w in self.widgets_list:
+            if isinstance(w, RecycledList):
+                order.extend((widget, w, index) for index, widget in w.focusables())
+            else:
+                order.append((w, None, None))
+        return [entry for entry in order if hasattr(entry[0], 'focus') and not getattr(entry[0], 'disabled', False)
+                and entry[0].get_root_window()]
 
     def _on_key_down(self, window, key, scancode, codepoint, modifiers):
         """Handle TAB to cycle focus and ENTER to trigger buttons."""
+        if not self.get_root_window():
+            return False  # Form kept alive but not displayed (e.g. cached home page)
+
         if key == 9:  # TAB key
-            # Only consider widgets that are enabled and have focus capability
-            enabled_widgets = [w for w in self.widgets_list if hasattr(w, 'focus') and not getattr(w, 'disabled', False)]
+            order = self.focus_order()
 
             # Find the currently focused widget
-            focused = next((i for i, w in enumerate(enabled_widgets) if w.focus), None)
+            focused = next((i for i, (w, _, _) in enumerate(order) if w.focus), None)
 
             if focused is None:
                 # No widget has focus: focus the first active button if available
-                first_button = next((w for w in enabled_widgets if isinstance(w, Button)), None)
+                first_button = next((w for w, _, _ in order if isinstance(w, Button)), None)
                 if first_button:
                     first_button.focus = True
                 return True
 
             # Move focus to the next or previous widget based on SHIFT key
-            enabled_widgets[focused].focus = False
-            next_index = (focused - 1 if 'shift' in modifiers else focused + 1) % len(enabled_widgets)
-            enabled_widgets[next_index].focus = True
+            step = -1 if 'shift' in modifiers else 1
+            widget, rows, index = order[focused]
+            widget.focus = False
+            following = focused + step
+            leaving = not 0 <= following < len(order) or order[following][1] is not rows
+            if rows is not None and leaving and 0 <= index + step < len(rows.data):
+                # Past the visible rows of a list: scroll its next row into view rather than skip the rest
+                rows.focus_row(index + step, last=step < 0)
+                return True
+
+            widget, rows, index = order[following % len(order)]
+            widget.focus = True
+            if rows is not None:
+                rows.show_row(index)
             return True
 
         elif key == 13:  # ENTER key
             # Trigger the focused button if any
-            focused_btn = next((w for w in self.widgets_list if isinstance(w, Button) and w.focus), None)
+            focused_btn = next((w for w, _, _ in self.focus_order() if isinstance(w, Button) and w.focus), None)
             if focused_btn:
                 focused_btn.trigger_action(duration=0)
                 return True
 
         return False
 
+class HoverManager:
+    """
+    Single Window.mouse_pos listener shared by every HoverBehavior widget.
+    - Widgets are held through weak references, so replaced pages can be freed.
+    - Only the branch of the widget tree under the cursor is walked (spatial culling),
+      so detached or off-screen widgets cost nothing.
+    """
+
+    def __init__(self):
+        self.targets = weakref.WeakSet()  # Every live hoverable widget
+        self._hovered = weakref.WeakSet()  # Widgets currently under the cursor
+        Window.bind(mouse_pos=self.on_mouse_pos)
+
+    @property
+    def count(self):
+        """Number of hover targets currently registered."""
+        return len(self.targets)
+
+    def register(self, widget):
+        self.targets.add(widget)
+
+    def on_mouse_pos(self, window, pos):
+        """Update hovered state of the widgets entering or leaving the cursor."""
+        under = set()
+        self._collect(window, pos, under)
+
+        for widget in list(self._hovered):
+            if widget not in under:
+                widget.hovered = False
+                widget.on_hover(False)
+        for widget in under:
+            if widget not in self._hovered:
+                widget.hovered = True
+                widget.on_hover(True)
+        self._hovered = weakref.WeakSet(under)
+
+    def _collect(self, parent, pos, found):
+        """Descend only into children whose bounds contain the cursor."""
+        for child in parent.children:
+            if not child.collide_point(*child.to_widget(*pos)):
+                continue
+            if child in self.targets:
+                found.add(child)
+            self._collect(child, pos, found)
+
+
+hover_manager = HoverManager()
+
+
 class HoverBehavior:
     hovered = BooleanProperty(False)  # Tracks whether the mouse is over the widget
     border_point = None  # Optional: used for additional hover logic (not implemented here)
@@ -146,22 +294,54 @@ class HoverBehavior:
     def __init__(self, **kwargs):
         """Base class to detect mouse hover over a widget."""
         super().__init__(**kwargs)
-        Window.bind(mouse_pos=self.on_mouse_pos)  # Bind mouse movement to handler
-
-    def on_mouse_pos(self, *args):
-        """Update hovered state based on mouse position."""
-        if not self.get_root_window():
-            return  # Ignore if widget is not displayed
-
-        pos = args[1]
-        inside = self.collide_point(*self.to_widget(*pos))  # Check if mouse is inside widget bounds
-        self.hovered = inside
-        self.on_hover(inside)  # Trigger hover callback
+        hover_manager.register(self)  # One shared mouse listener for all widgets
 
     def on_hover(self, hovered):
         """Called when hover state changes; override to customize behavior."""
         pass
 
+BUTTON_RADIUS = 30  # Corner radius of StyledButton, in pixels
+BUTTON_BORDER_WIDTH = 1.5
+_button_textures = None  # (fill, border) nine-patch textures shared by every StyledButton
+
+
+def rounded_patch(size, radius, ring_width=None):
+    """
+    RGBA bytes of a white anti-aliased rounded square: filled, or only its outline of `ring_width`.
+    The rows and columns between the corners are identical, so it stretches as a nine-patch.
+    """
+    pixels = bytearray(size * size * 4)
+    low, high = radius, size - radius
+    for y in range(size):
+        cy = min(max(y + 0.5, low), high)
+        for x in range(size):
+            cx = min(max(x + 0.5, low), high)
+            d = ((x + 0.5 - cx) ** 2 + (y + 0.5 - cy) ** 2) ** 0.5  # Distance to the inner rectangle
+            if ring_width is None:
+                coverage = radius - d + 0.5
+            else:
+                coverage = ring_width / 2 - abs(d - (radius - ring_width / 2)) + 0.5
+            i = (y * size + x) * 4
+            pixels[i:i + 3] = b"\xff\xff\xff"
+            pixels[i + 3] = int(255 * min(1.0, max(0.0, coverage)))
+    return bytes(pixels)
+
+
+def button_textures():
+    """Create the shared fill and border textures on first use (a GL context is needed)."""
+    global _button_textures
+    if _button_textures is None:
+        from kivy.graphics.texture import Texture
+        size = 2 * BUTTON_RADIUS + 4  # Corners plus a few stretchable texels
+        textures = []
+        for ring_width in (None, BUTTON_BORDER_WIDTH):
+            texture = Texture.create(size=(size, size), colorfmt="rgba")
+            texture.blit_buffer(rounded_patch(size, BUTTON_RADIUS, ring_width), colorfmt="rgba", bufferfmt="ubyte")
+            textures.append(texture)
+        _button_textures = tuple(textures)
+    return _button_textures
+
+
 class StyledButton(FocusBehavior, HoverBehavior, Button):
     def __init__(self, opacity=0.6, **kwargs):
         """Custom button with hover/focus visual feedback and rounded border."""
@@ -174,24 +354,26 @@ class StyledButton(FocusBehavior, HoverBehavior, Button):
         self.background_normal = ''
         self.background_color = (0, 0, 0, 0)  # Fully transparent default background
 
-        # Draw custom background and border
+        # Background and border: two nine-patches of textures shared by all buttons,
+        # so moving or resizing only rewrites their rectangles, nothing is tessellated
+        fill, border = button_textures()
+        r = BUTTON_RADIUS
         with self.canvas.before:
             self.bg_color = Color(0.7, 0.7, 0.7, self.opacity_normal)
-            self.bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[30])
-            self.border_color = Color(0, 0, 0, 1)
-            self.border_line = Line(width=1.5)
+            self.bg_rect = BorderImage(texture=fill, border=(r, r, r, r), auto_scale="both_lower",
+                                       pos=self.pos, size=self.size)
+            Color(0, 0, 0, 1)
+            self.border_rect = BorderImage(texture=border, border=(r, r, r, r), auto_scale="both_lower",
+                                           pos=self.pos, size=self.size)
 
         # Update visuals on relevant changes
         self.bind(pos=self.update_graphics, size=self.update_graphics,
                   focus=self.on_focus, hovered=self.on_hover)
 
     def update_graphics(self, *args):
-        """Update shape and position of background and border."""
-        self.bg_rect.pos = self.pos
-        self.bg_rect.size = self.size
-        self.border_line.rounded_rectangle = (
-            self.x, self.y, self.width, self.height, 30
-        )
+        """Move the background and border nine-patches with the button."""
+        self.bg_rect.pos = self.border_rect.pos = self.pos
+        self.bg_rect.size = self.border_rect.size = self.size
 
     def on_focus(self, instance, value):
         """Adjust opacity when focus changes."""
@@ -212,49 +394,571 @@ class StyledButton(FocusBehavior, HoverBehavior, Button):
         else:
             self.bg_color.a = self.opacity_normal
 
+_glyph_atlases = {}  # (font_name, font_size, charset) -> {char: texture region}
+
+
+def glyph_atlas(font_name, font_size, charset):
+    """
+    Rasterise `charset` once, as one texture, and return a texture region per character.
+    Shared by every countdown drawn with the same font and size.
+    """
+    key = (font_name, font_size, charset)
+    atlas = _glyph_atlases.get(key)
+    if atlas is None:
+        from kivy.core.text import Label as CoreLabel
+        label = CoreLabel(text=" ".join(charset), font_name=font_name, font_size=font_size)
+        label.refresh()
+        texture = label.texture
+        atlas = {}
+        for i, char in enumerate(charset):
+            # Offset of each character: extent of everything written before it
+            x = label.get_extents(" ".join(charset[:i]) + " ")[0] if i else 0
+            width = label.get_extents(char)[0]
+            atlas[char] = texture.get_region(x, 0, width, texture.height)
+        _glyph_atlases[key] = atlas
+    return atlas
+
+
+class GlyphCountdown(Widget):
+    """
+    Digit-only countdown drawn from a glyph atlas.
+    - One rectangle per character; a new value only re-targets the rectangles whose character moved or changed.
+    - Nothing is rasterised after the atlas is built, so a tenths display costs a few quad updates per tick.
+    """
+
+    DIGITS = "0123456789."
+
+    def __init__(self, font_name, font_size, suffix="", **kwargs):
+        super().__init__(**kwargs)
+        charset = "".join(dict.fromkeys(self.DIGITS + suffix))
+        self.atlas = glyph_atlas(font_name, font_size, charset)
+        self.text = ""
+        self.slots = []  # [Rectangle, char, x] per drawn character
+        self.bind(pos=self.redraw, size=self.redraw)
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.redraw()
+
+    def clear(self):
+        self.set_text("")
+
+    def redraw(self, *args):
+        chars = [char for char in self.text if char in self.atlas]
+        while len(self.slots) < len(chars):
+            with self.canvas:
+                self.slots.append([Rectangle(size=(0, 0)), None, None])
+        x = self.center_x - sum(self.atlas[char].width for char in chars) / 2
+        for i, slot in enumerate(self.slots):
+            if i >= len(chars):
+                if slot[1] is not None:  # Hide slots left over from a longer value
+                    slot[0].size = (0, 0)
+                    slot[1] = None
+                continue
+            region = self.atlas[chars[i]]
+            if slot[1] != chars[i] or slot[2] != x:
+                rect = slot[0]
+                rect.texture = region
+                rect.size = region.size
+                rect.pos = (x, self.center_y - region.height / 2)
+                slot[1], slot[2] = chars[i], x
+            x += region.width
+
+
+class RecycledList(RecycleView):
+    """Scrollable list that only keeps widgets for the visible rows and rebinds data while scrolling."""
+
+    def __init__(self, viewclass, row_height, spacing=10, padding=0, **kwargs):
+        from kivy.uix.recycleboxlayout import RecycleBoxLayout
+        super().__init__(**kwargs)
+        self.row_height = row_height
+        self.spacing = spacing
+        layout = RecycleBoxLayout(
+            orientation="vertical",
+            default_size=(None, row_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=spacing,
+            padding=padding
+        )
+        layout.bind(minimum_height=layout.setter("height"))
+        self.add_widget(layout)
+        self.viewclass = viewclass
+
+    def focusables(self):
+        """(data index, widget) of the focusable widgets of the rows currently bound, in data order."""
+        views = self.view_adapter.views
+        return [(index, widget) for index in sorted(views) for widget in views[index].focusables]
+
+    def show_row(self, index):
+        """Scroll just enough for row `index` to be fully visible."""
+        layout = self.layout_manager
+        scrollable = layout.height - self.height
+        if scrollable <= 0:
+            return
+        top = layout.padding[1] + index * (self.row_height + self.spacing)  # From the top of the list
+        viewport_top = (1 - self.scroll_y) * scrollable
+        if top < viewport_top:
+            viewport_top = top
+        elif top + self.row_height > viewport_top + self.height:
+            viewport_top = top + self.row_height - self.height
+        else:
+            return
+        self.scroll_y = min(max(1 - viewport_top / scrollable, 0), 1)
+
+    def focus_row(self, index, last=False):
+        """Scroll row `index` into view and focus its first (or `last`) focusable widget."""
+        self.show_row(index)
+        self.refresh_from_viewport()
+        self.refresh_views()  # Bind the rows now rather than next frame
+        row = self.view_adapter.views.get(index)
+        if row is not None:
+            row.focusables[-1 if last else 0].focus = True
+
+
+class RoutineRow(RecycleDataViewBehavior, BoxLayout):
+    """Pooled row of the home list, rebound to a routine name by the RecycledList."""
+
+    def __init__(self, **kwargs):
+        from kivy.uix.dropdown import DropDown
+        super().__init__(spacing=10, **kwargs)
+        app = self.app = App.get_running_app()
+        self.name = ""
+        self.duration = ""
+        self.index = 0
+
+        # Main routine button
+        self.open_btn = StyledButton(text="", size_hint=(0.55, 1))
+        self.open_btn.bind(on_press=lambda *args: app.set_root_content(app.page_routine(self.name)))
+        self.add_widget(self.open_btn)
+        self.focusables = (self.open_btn,)  # TAB order within the row
+
+        # Total duration badge
+        self.badge = Label(text="", size_hint=(0.15, 1))
+        self.add_widget(self.badge)
+
+        # Up/down movement buttons
+        up_btn = StyledButton(text="↑", font_name="Arial", size_hint=(0.1, 1))
+        up_btn.bind(on_press=lambda *args: app.deplacer_routine(self.index, -1))
+        self.add_widget(up_btn)
+
+        down_btn = StyledButton(text="↓", font_name="Arial", size_hint=(0.1, 1))
+        down_btn.bind(on_press=lambda *args: app.deplacer_routine(self.index, 1))
+        self.add_widget(down_btn)
+
+        # Dropdown options: rename, copy, delete
+        self.dropdown = DropDown(auto_width=False)
+        self.rename_btn = self._option_button(lambda: app.set_root_content(app.page_renommer_routine(self.name)))
+        self.copy_btn = self._option_button(lambda: app.set_root_content(app.copy_routine(self.name)))
+        self.delete_btn = self._option_button(lambda: app.confirmer_suppression_routine(self.name))
+
+        # Button opening the options dropdown
+        more_btn = StyledButton(text="...", size_hint=(0.1, 1))
+        more_btn.bind(on_release=self.open_options)
+        self.add_widget(more_btn)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this pooled row to the routine at `index`."""
+        self.index = index
+        super().refresh_view_attrs(rv, index, data)
+        self.refresh_texts()
+
+    def _option_button(self, action):
+        btn = StyledButton(text="", size_hint=(None, None), height=50, opacity=1)
+        btn.bind(on_release=lambda instance: (action(), self.dropdown.dismiss()))
+        self.dropdown.add_widget(btn)
+        return btn
+
+    def open_options(self, btn):
+        """Open the options at 30% of the current window width."""
+        width = Window.width * 0.3
+        self.dropdown.width = width
+        for option in (self.rename_btn, self.copy_btn, self.delete_btn):
+            option.width = width
+        self.dropdown.open(btn)
+
+    def refresh_texts(self):
+        """Rewrite texts for the bound routine and the current language."""
+        texts = self.app.catalog.section("home_page")
+        self.open_btn.text = self.app.adjust_button_text(self.name)
+        self.badge.text = self.duration
+        self.rename_btn.text = texts[2]
+        self.copy_btn.text = texts[3]
+        self.delete_btn.text = texts[1]
+
+
+class ExerciseRow(RecycleDataViewBehavior, BoxLayout):
+    """Pooled row of a routine page: description plus up, down and modify buttons."""
+
+    def __init__(self, **kwargs):
+        super().__init__(spacing=10, **kwargs)
+        app = App.get_running_app()
+        self.routine = ""
+        self.index = 0
+
+        self.label = Label(text="", size_hint=(0.5, 1), halign="center", valign="middle")
+        self.label.bind(size=lambda instance, value: setattr(instance, 'text_size', value))
+        self.add_widget(self.label)
+
+        up_btn = StyledButton(text="↑", font_name="Arial", size_hint=(0.1, 1))
+        up_btn.bind(on_press=lambda *args: app.deplacer_exercice(self.routine, self.index, -1))
+        self.add_widget(up_btn)
+
+        down_btn = StyledButton(text="↓", font_name="Arial", size_hint=(0.1, 1))
+        down_btn.bind(on_press=lambda *args: app.deplacer_exercice(self.routine, self.index, 1))
+        self.add_widget(down_btn)
+
+        modify_btn = StyledButton(text="\N{pencil}", font_name='SegoeUIEmoji', size_hint=(0.1, 1))
+        modify_btn.bind(on_press=lambda *args: app.set_root_content(app.page_modifier_exercice(self.routine, self.index)))
+        self.add_widget(modify_btn)
+
+        self.focusables = (up_btn, down_btn, modify_btn)  # TAB order within the row
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this pooled row to exercise `index`."""
+        self.index = index
+        self.routine = data["routine"]
+        self.label.text = data["text"]
+        return super().refresh_view_attrs(rv, index, data)
+
+
+class HomePage(FloatLayout):
+    """
+    Main home page, kept alive between visits:
+    - a dropdown menu for language selection,
+    - a button to add a new routine,
+    - a help button,
+    - a scrollable list of routines with options (rename, copy, delete).
+    Reorder, delete and copy only touch the affected rows; a language change only rewrites texts.
+    """
+
+    def __init__(self, app, **kwargs):
+        from kivy.uix.dropdown import DropDown
+        super().__init__(**kwargs)
+        self.app = app
+
+        # Main vertical container with focus management
+        self.form = FocusableForm(orientation="vertical", spacing=10, padding=10, size_hint=(1, 1))
+
+        # --- Top bar: language selection + add routine + help ---
+        top_buttons = BoxLayout(orientation="horizontal", size_hint=(1, 0.1), spacing=10)
+
+        # Main button showing current language and opening dropdown menu
+        app.main_lang_btn = StyledButton(text="", size_hint=(0.1, 1))
+        app.update_lang_button_text()
+
+        dropdown = DropDown()
+        app.dropdown_buttons = []  # List of language buttons in the dropdown
+
+        def on_lang_select(btn_instance):
+            # Language change: update, save, and relabel the page in place
+            selected_lang = btn_instance.full_text
+            app.current_language = selected_lang
+            app.store.set_value("language", selected_lang)
+            app.update_lang_button_text()
+            app.update_dropdown_language_buttons()
+            dropdown.dismiss()
+            self.refresh_texts()
+
+        for lang in app.catalog.languages:
+            btn = StyledButton(text="", size_hint_y=None, height=44, opacity=1)
+            btn.full_text = lang
+            btn.bind(on_release=on_lang_select)
+            dropdown.add_widget(btn)
+            app.dropdown_buttons.append(btn)
+
+        app.update_dropdown_language_buttons()
+        app.main_lang_btn.bind(on_release=lambda btn: Clock.schedule_once(lambda dt: dropdown.open(btn), 0.01))
+        top_buttons.add_widget(app.main_lang_btn)
+
+        # "Add a routine" button
+        self.add_btn = StyledButton(text="", size_hint=(0.7, 1))
+        self.add_btn.bind(on_press=lambda *args: app.set_root_content(app.page_ajouter_routine()))
+        top_buttons.add_widget(self.add_btn)
+
+        # Import/export button
+        share_btn = StyledButton(text="↕", font_name="Arial", size_hint=(0.1, 1))
+        share_btn.bind(on_press=lambda *args: app.set_root_content(app.page_echange()))
+        top_buttons.add_widget(share_btn)
+
+        # Help "?" button
+        helpbtn = StyledButton(text="?", size_hint=(0.1, 1))
+        helpbtn.bind(on_press=lambda *args: app.set_root_content(app.help_page()))
+        top_buttons.add_widget(helpbtn)
+
+        self.form.add_widget(top_buttons)
+
+        # --- Recycled list of routines: only visible rows have widgets ---
+        self.routine_list = RecycledList(RoutineRow, row_height=50, size_hint=(1, 0.8))
+        self.routine_list.data = self.entries()
+        self.form.add_widget(self.routine_list)
+        self.add_widget(self.form)
+
+        # Register buttons for tab navigation
+        self.form.register_focusable(app.main_lang_btn)
+        self.form.register_focusable(self.add_btn)
+        self.form.register_focusable(share_btn)
+        self.form.register_focusable(self.routine_list)
+        self.refresh_texts()
+
+    def on_enter(self, scope):
+        """Subscribe to keyboard and resizing while the page is displayed."""
+        self.form.on_enter(scope)
+        scope.bind(Window, on_resize=self.app.on_window_resize)
+
+    def refresh_texts(self):
+        """Relabel the page after a language change, without rebuilding it."""
+        self.add_btn.text = self.app.catalog.text("home_page", 0)
+        self.routine_list.refresh_from_data()  # Only visible rows are rebound
+
+    def swap_rows(self, index, new_index):
+        """Swap two neighbouring entries; only their rows are rebound."""
+        data = self.routine_list.data
+        data[index], data[new_index] = data[new_index], data[index]
+
+    def remove_row(self, name):
+        data = self.routine_list.data
+        del data[next(i for i, entry in enumerate(data) if entry["name"] == name)]
+
+    def entries(self):
+        """List data: every routine name with its total duration badge, computed for the whole library at once."""
+        stats = LibraryStats(self.app.routines)
+        return [{"name": name, "duration": format_duration(total)} for name, total in zip(stats.names, stats.total)]
+
+    def sync(self):
+        """Reconcile the list with the routines after edits made on other pages (add, copy, rename, exercises)."""
+        entries = self.entries()
+        data = self.routine_list.data
+        if entries == data:
+            return
+        if entries[:len(data)] == data:
+            data.extend(entries[len(data):])  # Add, copy
+        else:
+            self.routine_list.data = entries
+
+
+class StartupTrace:
+    """Milliseconds spent in each startup stage, logged once the app is interactive."""
+
+    def __init__(self, start):
+        self.start = self.last = start
+        self.stages = []  # (stage, milliseconds)
+
+    def mark(self, stage, now=None):
+        """End `stage` now (or at the given perf_counter time)."""
+        now = time.perf_counter() if now is None else now
+        self.stages.append((stage, (now - self.last) * 1000))
+        self.last = now
+
+    def report(self):
+        stages = ", ".join(f"{stage} {ms:.0f} ms" for stage, ms in self.stages)
+        Logger.info(f"RoutineApp: startup {stages} (total {(self.last - self.start) * 1000:.0f} ms)")
+
+
+class ProfileOverlay(Label):
+    """
+    Live frame time, FPS, Clock events and tick jitter; only exists when profiling is on.
+    Hidden until toggled with F12, and only refreshed while shown.
+    """
+
+    REFRESH = 0.5  # Seconds between refreshes
+
+    def __init__(self, app, **kwargs):
+        super().__init__(
+            text="", size_hint=(None, None), size=(330, 110), pos_hint={"right": 1, "top": 1},
+            halign="left", valign="top", font_size=14, color=(1, 1, 0, 1), **kwargs
+        )
+        self.bind(size=lambda instance, value: setattr(instance, "text_size", value))
+        self.app = app
+        self.event = None
+
+    @property
+    def shown(self):
+        return self.event is not None
+
+    def toggle(self, parent):
+        if self.shown:
+            self.event.cancel()
+            self.event = None
+            parent.remove_widget(self)
+        else:
+            parent.add_widget(self)
+            self.refresh()
+            self.event = Clock.schedule_interval(self.refresh, self.REFRESH)
+
+    def refresh(self, *args):
+        stats = routineprofile.profiler.summary()
+        jitter = stats.get("tick_jitter")
+        saves = stats.get("save")
+        self.text = "\n".join((
+            f"frame {Clock.frametime * 1000:.1f} ms  ({Clock.get_fps():.0f} fps)",
+            f"clock events {len(Clock.get_events())}",
+            f"timer wakeups {self.app.timer_engine.wakeups}, last late {self.app.timer_engine.lateness * 1000:.1f} ms",
+            f"tick jitter max {jitter['max_ms']:.1f} ms" if jitter else "tick jitter -",
+            f"saves {saves['count']}, max {saves['max_ms']:.1f} ms" if saves else "saves -",
+        ))
+
+
 class RoutineApp(App):
     FILE_PATH = "necessary/routinesV3.json"
+    DB_PATH = "necessary/routines.db"
+    STORE_BACKEND = os.environ.get("ROUTINEAPP_STORE", "json")  # "json" or "sqlite"
+    SAVE_WINDOW = 0.5  # Seconds during which successive edits are merged into one write
+    BACKGROUND_RESCALE_DELAY = 0.3  # Seconds between background rescales during a window drag
+    COUNTDOWN_FONT_SIZE = 64
+    DISPLAY_STEP = 0.1 if os.environ.get("ROUTINEAPP_TENTHS") == "1" else 1.0  # Countdown resolution, in seconds
+
+    LANGUAGE_PATH = "necessary/language.json"
 
-    with open("necessary/language.json", 'r', encoding='utf-8') as f:
-        dictlanguage = json.load(f)
+    @property
+    def current_language(self):
+        return self.catalog.language
+
+    @current_language.setter
+    def current_language(self, language):
+        self.catalog.set_language(language)
 
     def build(self):
-        """Initialize the interface using routines and language data."""
-        self.routines_data = self.charger_routines()
-        self.routines = self.routines_data.get("routines", {})
-        self.current_language = self.routines_data["language"]
+        """
+        Show the background immediately, then finish startup over the next frames:
+        data load, first page, interactive.
+        """
+        self.startup_trace = StartupTrace(IMPORT_START)
+        self.startup_trace.mark("imports", IMPORT_END)
+
+        self.store = None
+        self.save_queue = None
+        self.timer_engine = TimerEngine(Clock.schedule_once)  # Wakes running routines only at their next event
+        self.current_page = None
+        self.page_scope = PageScope()  # Subscriptions of the displayed page
+        self.home_page = None  # Built on first visit, then updated in place
+        self.stop_echange = None  # Stops the running export or import, if any
 
         self.root = FloatLayout()
+        self.assets = AssetManager()  # Fonts and backgrounds, loaded once
         self.background_image = Image(allow_stretch=True, keep_ratio=False)
+        self.background_orientation = None
+        self.rescale_background = Clock.create_trigger(self._rescale_background, self.BACKGROUND_RESCALE_DELAY)
         self.root.add_widget(self.background_image)
 
         self.content_container = BoxLayout()
         self.root.add_widget(self.content_container)
 
+        # App-lifetime subscriptions: bound once, never per page
+        self.main_lang_btn = None  # Created with the home page
+        Window.bind(size=self.update_background_image)
+        self.update_background_image()
+        Window.bind(size=self.update_lang_button_text)
+        Window.bind(size=self.update_dropdown_language_buttons)
+        self.profile_overlay = None
+        if routineprofile.profiler:
+            self.profile_overlay = ProfileOverlay(self)
+            Window.bind(on_key_down=self.on_profile_key)
+        self.subscription_baseline = window_observer_counts()
+
+        self.startup_trace.mark("build")
+        Clock.schedule_once(self._startup_load_data)
+        return self.root
+
+    @profiled("clock")
+    def _startup_load_data(self, dt):
+        """Startup stage 2 (after the first frame): translations and routines."""
+        self.startup_trace.mark("first frame")
+
+        # Translations are read here, not on import; all languages are checked once
+        self.catalog = Catalog(self.LANGUAGE_PATH)
+        for problem in self.catalog.validate():
+            Logger.warning(f"RoutineApp: language.json: {problem}")
+
+        self.routines_data = self.charger_routines()
+        self.routines = self.routines_data["routines"]
+        self.save_queue = SaveQueue(self.store, window=self.SAVE_WINDOW)  # Writes happen off the UI thread
+        self.current_language = self.routines_data["language"]
+
+        self.startup_trace.mark("data load")
+        Clock.schedule_once(self._startup_fonts)
+
+    @profiled("clock")
+    def _startup_fonts(self, dt):
+        """Startup stage 3: register the bundled fonts once, by name."""
+        self.assets.register_fonts()
+
+        self.startup_trace.mark("fonts")
+        Clock.schedule_once(self._startup_first_page)
+
+    @profiled("clock")
+    def _startup_first_page(self, dt):
+        """Startup stage 4: build and show the first page."""
         if self.routines_data.get("first_time", True):
             self.set_root_content(self.page_bienvenue())
-            self.routines_data["first_time"] = False
-            self.sauvegarder_routines()
+            self.store.set_value("first_time", False)
         else:
             self.set_root_content(self.page_accueil())
 
-        Window.bind(size=self.update_background_image)
-        self.update_background_image()
-        Window.bind(size=self.update_lang_button_text)
-        Window.bind(size=lambda *args: self.update_dropdown_language_buttons())
-
-        return self.root
+        self.startup_trace.mark("first page")
+        Clock.schedule_once(self._startup_interactive)
+
+    @profiled("clock")
+    def _startup_interactive(self, dt):
+        """Startup stage 5: the first page has been drawn, the app answers input."""
+        self.startup_trace.mark("interactive")
+        self.startup_trace.report()
+
+    def on_pause(self):
+        """Make pending edits durable before the OS may kill the app."""
+        if self.save_queue:
+            self.save_queue.flush()
+        return True
+
+    def on_stop(self):
+        """Flush pending edits and stop the save worker."""
+        if self.save_queue:
+            self.save_queue.close()
+        if routineprofile.profiler:
+            Logger.info(f"RoutineApp: profile written to {routineprofile.profiler.export(PROFILE_PATH)}")
+
+    def on_profile_key(self, window, key, *args):
+        """F12 shows or hides the profiling overlay."""
+        if key == 293:
+            self.profile_overlay.toggle(self.root)
+            return True
+        return False
 
+    @profiled("page")
     def set_root_content(self, new_content):
-        """Replace the central content with a new widget."""
+        """
+        Replace the central content with a new page.
+        - The old page's subscriptions are released (leave), the new page subscribes (enter).
+        """
+        if self.current_page is not None and hasattr(self.current_page, "on_leave"):
+            self.current_page.on_leave()
+        self.page_scope.release()
+
         self.content_container.clear_widgets()
         self.content_container.add_widget(new_content)
-
+        self.current_page = new_content
+
+        self.page_scope = PageScope()
+        if hasattr(new_content, "on_enter"):
+            new_content.on_enter(self.page_scope)
+        if DEBUG_SUBSCRIPTIONS:
+            self.report_leaked_subscriptions()
+
+    def report_leaked_subscriptions(self):
+        """Log Window subscriptions that are neither app-lifetime nor owned by the current page."""
+        for name, count in window_observer_counts().items():
+            leaked = count - self.subscription_baseline.get(name, 0) - self.page_scope.count(Window, name)
+            if leaked > 0:
+                callbacks = ", ".join(getattr(cb, "__qualname__", repr(cb)) for cb in Window.get_property_observers(name))
+                Logger.warning(f"RoutineApp: {leaked} leaked Window '{name}' subscription(s): {callbacks}")
+
+    @profiled("page")
     def page_bienvenue(self):
         """Display the welcome page."""
         layout = FloatLayout()
         box = BoxLayout(orientation="vertical", padding=10)
-        label = Label(text=self.dictlanguage[self.current_language]["welcome_page"],
+        label = Label(text=self.catalog.text("welcome_page"),
                       font_size=24, halign="center", valign="middle")
         label.bind(size=label.setter('text_size'))
         box.add_widget(label)
@@ -263,16 +967,31 @@ class RoutineApp(App):
         return layout
 
     def update_background_image(self, *args):
-        """Adjust background image based on orientation."""
-        img = 'fondportraitbienvenue.jpg' if Window.height > Window.width else 'fondpaysagebienvenue.png'
-        self.background_image.source = resource_path(f'necessary/images/{img}')
+        """
+        Swap the background texture only when the orientation flips.
+        Other resizes stretch the current texture; a texture scaled to the new size is picked
+        at most once per BACKGROUND_RESCALE_DELAY while the window is being dragged.
+        """
+        kind = orientation(*Window.size)
+        if kind != self.background_orientation:
+            self.background_orientation = kind
+            self._rescale_background()
+        else:
+            self.rescale_background()
+
+    def _rescale_background(self, *args):
+        texture = self.assets.background(*Window.size)
+        if texture is not self.background_image.texture:
+            self.background_image.texture = texture
 
     def update_lang_button_text(self, *args):
         """Shorten or display the full language button text."""
+        if self.main_lang_btn is None:
+            return
         lang = self.routines_data["language"]
         self.main_lang_btn.text = lang[:2] if Window.width < Window.height else lang
 
-    def update_dropdown_language_buttons(self):
+    def update_dropdown_language_buttons(self, *args):
         """Update the labels of the language dropdown buttons."""
         if not hasattr(self, 'dropdown_buttons'):
             return
@@ -287,194 +1006,41 @@ class RoutineApp(App):
 
     def on_window_resize(self, instance, width, height):
         """Adjust the text of routine buttons upon window resizing."""
-        if hasattr(self, "routine_buttons"):
-            for btn, name in self.routine_buttons:
-                btn.text = self.adjust_button_text(name)
+        if self.home_page is not None:
+            self.home_page.routine_list.refresh_from_data()
 
     def changer_langue(self, langue):
         """Change the app language and save the settings."""
-        with open(self.FILE_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        data["language"] = langue
-        with open(self.FILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        self.store.set_value("language", langue)
         self.current_language = langue
+        if self.home_page is not None:
+            self.home_page.refresh_texts()
         self.set_root_content(self.page_accueil())
 
+    @profiled("page")
     def page_accueil(self):
-        """
-        Create the main home page including:
-        - a dropdown menu for language selection,
-        - a button to add a new routine,
-        - a help button,
-        - a scrollable list of routines with options (rename, copy, delete),
-        - handles resizing and keyboard navigation.
-        """
-        layout = FloatLayout()
-
-        # Main vertical container with focus management
-        content = FocusableForm(orientation="vertical", spacing=10, padding=10, size_hint=(1, 1))
-
-        # --- Top bar: language selection + add routine + help ---
-        top_buttons = BoxLayout(orientation="horizontal", size_hint=(1, 0.1), spacing=10)
-
-        # Main button showing current language and opening dropdown menu
-        self.main_lang_btn = StyledButton(text="", size_hint=(0.1, 1))
-        self.update_lang_button_text()
-
-        dropdown = DropDown()
-        self.dropdown_buttons = []  # List of language buttons in the dropdown
-
-        for lang in self.dictlanguage:
-            btn = StyledButton(text="", size_hint_y=None, height=44, opacity=1)
-            btn.full_text = lang
-
-            def on_lang_select(btn_instance, dropdown=dropdown):
-                # Language change: update, save, and reload home page
-                selected_lang = btn_instance.full_text
-                self.routines_data["language"] = selected_lang
-                self.current_language = selected_lang
-                self.sauvegarder_routines()
-                self.update_lang_button_text()
-                self.update_dropdown_language_buttons()
-                dropdown.dismiss()
-                Clock.schedule_once(lambda dt: self.set_root_content(self.page_accueil()), 0.1)
-
-            btn.bind(on_release=on_lang_select)
-            dropdown.add_widget(btn)
-            self.dropdown_buttons.append(btn)
-
-        self.update_dropdown_language_buttons()
-        self.main_lang_btn.bind(on_release=lambda btn: Clock.schedule_once(lambda dt: dropdown.open(btn), 0.01))
-        top_buttons.add_widget(self.main_lang_btn)
-
-        # "Add a routine" button
-        btn2 = StyledButton(text=self.dictlanguage[self.current_language]["home_page"][0], size_hint=(0.8, 1))
-        btn2.bind(on_press=lambda *args: self.set_root_content(self.page_ajouter_routine()))
-        top_buttons.add_widget(btn2)
-
-        # Help "?" button
-        helpbtn = StyledButton(text="?", size_hint=(0.1, 1))
-        helpbtn.bind(on_press=lambda *args: self.set_root_content(self.help_page()))
-        top_buttons.add_widget(helpbtn)
-
-        content.add_widget(top_buttons)
-
-        # --- Scroll view containing the routines list ---
-        scroll = ScrollView(size_hint=(1, 0.8))
-        routine_layout = BoxLayout(orientation="vertical", size_hint_y=None, spacing=10)
-        routine_layout.bind(minimum_height=routine_layout.setter("height"))
-
-        self.routine_buttons = []  # Store routine buttons to handle resizing
-
-        routines_list = list(self.routines.items())
-        for index, (name, _) in enumerate(routines_list):
-            routine_box = BoxLayout(size_hint_y=None, height=50, spacing=10)
-
-            # Main routine button
-            btn = StyledButton(text=self.adjust_button_text(name), size_hint=(0.7, 1))
-            btn.bind(on_press=lambda instance, r=name: self.set_root_content(self.page_routine(r)))
-            routine_box.add_widget(btn)
-            content.register_focusable(btn)
-
-            self.routine_buttons.append((btn, name))
-
-            # Up/down movement buttons
-            up_btn = StyledButton(text="↑", font_name="necessary/arial.ttf", size_hint=(0.1, 1))
-            up_btn.bind(on_press=lambda instance, i=index: self.deplacer_routine(i, -1))
-            routine_box.add_widget(up_btn)
-
-            down_btn = StyledButton(text="↓", font_name="necessary/arial.ttf", size_hint=(0.1, 1))
-            down_btn.bind(on_press=lambda instance, i=index: self.deplacer_routine(i, 1))
-            routine_box.add_widget(down_btn)
-
-            # Dropdown options: rename, copy, delete (30% of window width)
-            dropdown2 = DropDown(auto_width=False)
-            dropdown_width = Window.width * 0.3
-            dropdown2.width = dropdown_width
-
-            rename_btn = StyledButton(
-                text=self.dictlanguage[self.current_language]["home_page"][2],
-                size_hint=(None, None),
-                size=(dropdown_width, 50),
-                opacity=1
-            )
-            rename_btn.bind(on_release=lambda instance, r=name, dd=dropdown2: (
-                self.set_root_content(self.page_renommer_routine(r)),
-                dd.dismiss()
-            ))
-            dropdown2.add_widget(rename_btn)
-
-            copy_btn = StyledButton(
-                text=self.dictlanguage[self.current_language]["home_page"][3],
-                size_hint=(None, None),
-                size=(dropdown_width, 50),
-                opacity=1
-            )
-            copy_btn.bind(on_release=lambda instance, r=name, dd=dropdown2: (
-                self.set_root_content(self.copy_routine(r)),
-                dd.dismiss()
-            ))
-            dropdown2.add_widget(copy_btn)
-
-            delete_btn = StyledButton(
-                text=self.dictlanguage[self.current_language]["home_page"][1],
-                size_hint=(None, None),
-                size=(dropdown_width, 50),
-                opacity=1
-            )
-            delete_btn.bind(on_release=lambda instance, r=name, dd=dropdown2: (
-                self.confirmer_suppression_routine(r),
-                dd.dismiss()
-            ))
-            dropdown2.add_widget(delete_btn)
-
-            # Button opening the options dropdown
-            more_btn = StyledButton(text="...", size_hint=(0.1, 1))
-            more_btn.bind(on_release=lambda btn, dd=dropdown2: dd.open(btn))
-            routine_box.add_widget(more_btn)
-
-            routine_layout.add_widget(routine_box)
-
-        # Adapt dropdown options width on window resize
-        def update_dropdown_width(*args):
-            new_width = Window.width * 0.3
-            dropdown2.width = new_width
-            rename_btn.size = (new_width, 50)
-            delete_btn.size = (new_width, 50)
-
-        Window.bind(on_resize=update_dropdown_width)
-
-        scroll.add_widget(routine_layout)
-        content.add_widget(scroll)
-
-        layout.add_widget(content)
-
-        # Register buttons for tab navigation
-        content.register_focusable(self.main_lang_btn)
-        content.register_focusable(btn2)
-
-        # Manage global resizing
-        Window.unbind(on_resize=self.on_window_resize)
-        Window.bind(on_resize=self.on_window_resize)
-
-        return layout
+        """Return the home page, created once then kept in sync with the routines."""
+        if self.home_page is None:
+            self.home_page = HomePage(self)
+        else:
+            self.home_page.sync()
+        return self.home_page
     
     def copy_routine(self, name):
         """Copy a routine and add it with '(copy)' suffix."""
         routine = self.routines[name]
-        new_routine_name = f"{routine['name']} (copy)"
-        new_routine = {"name": new_routine_name, "fonctions": routine["fonctions"][:]}
-        self.routines[new_routine_name] = new_routine
-        self.sauvegarder_routines()
+        new_routine_name = f"{routine.name} (copy)"
+        self.store.put_routine(new_routine_name, routine.copy(new_routine_name))
         return self.page_accueil()
     
+    @profiled("page")
     def help_page(self):
         """Create the help page layout with scrollable instructions and return button."""
+        from kivy.uix.scrollview import ScrollView
         layout = FocusableForm(orientation="vertical", spacing=10, padding=10)
 
         # Title label
-        title = self.dictlanguage[self.current_language]["helppage"][1]
+        title = self.catalog.text("helppage", 1)
         title_label = AutoResizeLabel(
             text=title,
             font_size=30,
@@ -487,7 +1053,7 @@ class RoutineApp(App):
         layout.add_widget(title_label)
 
         # Help text inside a scrollview
-        help_text = self.dictlanguage[self.current_language]["helppage"][0]
+        help_text = self.catalog.text("helppage", 0)
         scroll = ScrollView(size_hint=(1, 1))
         help_label = AutoResizeLabel(
             text=help_text,
@@ -505,7 +1071,7 @@ class RoutineApp(App):
 
         # Return button
         back_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["routine_page"][6],  # "Back"
+            text=self.catalog.text("routine_page", 6),  # "Back"
             size_hint=(1, None),
             height=50
         )
@@ -515,22 +1081,117 @@ class RoutineApp(App):
 
         return layout
 
+    @profiled("page")
+    def page_echange(self):
+        """Page to export the library to, or import routines from, a newline-delimited JSON file."""
+        texts = self.catalog.section("exchange")
+        layout = FocusableForm(orientation="vertical", spacing=10, padding=10)
+        layout.add_widget(Widget(size_hint=(1, 0.1)))
+
+        title = Label(text=texts[0], font_size=30, size_hint=(1, None), height=40, halign="center", valign="middle")
+        title.bind(size=title.setter('text_size'))
+        layout.add_widget(title)
+
+        label = Label(text=texts[1], size_hint=(1, None), height=30, halign="center", valign="middle")
+        label.bind(size=label.setter('text_size'))
+        layout.add_widget(label)
+
+        path_input = MyTextInput(
+            text=os.path.join(os.path.dirname(os.path.abspath(self.FILE_PATH)), "routines.ndjson"),
+            max_length=260
+        )
+        layout.register_focusable(path_input)
+        layout.add_widget(path_input)
+
+        status = Label(text="", size_hint=(1, None), height=30, halign="center", valign="middle")
+        status.bind(size=status.setter('text_size'))
+        layout.add_widget(status)
+        layout.add_widget(Widget())
+
+        btn_layout = BoxLayout(size_hint=(1, 0.2), spacing=10)
+        export_btn = StyledButton(text=texts[2])
+        export_btn.bind(on_press=lambda *args: self.exporter_routines(path_input.text.strip(), status))
+        import_btn = StyledButton(text=texts[3])
+        import_btn.bind(on_press=lambda *args: self.importer_routines(path_input.text.strip(), status))
+        back_btn = StyledButton(text=texts[4])
+        back_btn.bind(on_press=lambda *args: self.set_root_content(self.page_accueil()))
+        for btn in (export_btn, import_btn, back_btn):
+            layout.register_focusable(btn)
+            btn_layout.add_widget(btn)
+        layout.add_widget(btn_layout)
+        return layout
+
+    def exporter_routines(self, path, status):
+        texts = self.catalog.section("exchange")
+
+        def show(progress):
+            written, total = progress
+            status.text = f"{written}/{total} {texts[5]}"
+        self.executer_echange(iter_export_file(self.routines_data, path), status, show)
+
+    def importer_routines(self, path, status):
+        """Merge a file into the library; names already taken get a " (2)" suffix."""
+        texts = self.catalog.section("exchange")
+
+        def show(report):
+            status.text = (f"{report.progress:.0%} - {report.imported + report.renamed} {texts[6]}, "
+                           f"{report.renamed} {texts[7]}, {report.invalid} {texts[8]}")
+        self.executer_echange(iter_import_file(self.store, path), status, show)
+
+    def executer_echange(self, steps, status, show):
+        """
+        Run an export or import one chunk per frame, so the page keeps answering while it shows progress.
+        Leaving the page stops it; an import keeps the routines merged so far.
+        """
+        texts = self.catalog.section("exchange")
+        if self.stop_echange is not None:
+            self.stop_echange()  # One export or import at a time
+        status.text = texts[11]
+        event = None
+
+        def step(dt):
+            nonlocal event
+            event = None
+            try:
+                show(next(steps))
+            except StopIteration:
+                return
+            except ExchangeError:
+                status.text = texts[9]
+                return
+            except FileNotFoundError:
+                status.text = texts[10]
+                return
+            except OSError as e:
+                status.text = e.strerror or str(e)
+                return
+            event = Clock.schedule_once(step)
+
+        def stop():
+            if event is not None:
+                event.cancel()
+            steps.close()
+            if self.stop_echange is stop:
+                self.stop_echange = None
+
+        event = Clock.schedule_once(step)
+        self.stop_echange = stop
+        self.page_scope.add_cleanup(stop)
+
     def deplacer_routine(self, index, direction):
         """Move a routine up or down in the list."""
-        routines_list = list(self.routines.items())
         new_index = index + direction
-        if 0 <= new_index < len(routines_list):
-            routines_list[index], routines_list[new_index] = routines_list[new_index], routines_list[index]
-            self.routines = {name: data for name, data in routines_list}
-            self.sauvegarder_routines()
-            self.set_root_content(self.page_accueil())
+        if 0 <= new_index < len(self.routines):
+            self.store.move_routine(index, new_index)
+            self.home_page.swap_rows(index, new_index)
 
     def confirmer_suppression_routine(self, name):
         """Show a confirmation popup to delete a routine."""
+        from kivy.uix.popup import Popup
         popup_layout = BoxLayout(orientation="vertical", spacing=10, padding=10)
         popup_layout.add_widget(
             AutoResizeLabel(
-                text=f"{self.dictlanguage[self.current_language]['confirmation'][1]} {name} ?",
+                text=f"{self.catalog.text('confirmation', 1)} {name} ?",
                 halign="center",
                 valign="middle",
                 font_size=20
@@ -539,14 +1200,14 @@ class RoutineApp(App):
         btn_layout = BoxLayout(size_hint=(1, None), height=50, spacing=10)
 
         popup = Popup(
-            title=self.dictlanguage[self.current_language]["confirmation"][0],
+            title=self.catalog.text("confirmation", 0),
             content=popup_layout,
             size_hint=(0.8, 0.4)
         )
 
-        yes_btn = StyledButton(text=self.dictlanguage[self.current_language]["confirmation"][2])
+        yes_btn = StyledButton(text=self.catalog.text("confirmation", 2))
         yes_btn.bind(on_press=lambda *args: self.supprimer_routine(name, popup))
-        no_btn = StyledButton(text=self.dictlanguage[self.current_language]["confirmation"][3])
+        no_btn = StyledButton(text=self.catalog.text("confirmation", 3))
         no_btn.bind(on_press=popup.dismiss)
 
         btn_layout.add_widget(yes_btn)
@@ -558,18 +1219,18 @@ class RoutineApp(App):
     def supprimer_routine(self, name, popup):
         """Delete a routine and close the confirmation popup."""
         if name in self.routines:
-            del self.routines[name]
-            self.sauvegarder_routines()
+            self.store.delete_routine(name)
+            self.home_page.remove_row(name)
         popup.dismiss()
-        self.set_root_content(self.page_accueil())
 
+    @profiled("page")
     def page_ajouter_routine(self, error_message=""):
         """Create layout to add a new routine with optional error message."""
         layout = FocusableForm(orientation="vertical", spacing=10, padding=10)
         layout.add_widget(Widget(size_hint=(1, 0.1)))
 
         label = Label(
-            text=self.dictlanguage[self.current_language]["add_routine"][0],
+            text=self.catalog.text("add_routine", 0),
             font_size=30,
             size_hint=(1, None),
             height=40,
@@ -602,20 +1263,19 @@ class RoutineApp(App):
 
         btn_layout = BoxLayout(size_hint=(1, 0.2), spacing=10)
 
-        finish_btn = StyledButton(text=self.dictlanguage[self.current_language]["add_routine"][1])
+        finish_btn = StyledButton(text=self.catalog.text("add_routine", 1))
         layout.register_focusable(finish_btn)
-        cancel_btn = StyledButton(text=self.dictlanguage[self.current_language]["add_routine"][2])
+        cancel_btn = StyledButton(text=self.catalog.text("add_routine", 2))
         layout.register_focusable(cancel_btn)
 
         def validate_add(instance):
             name = routine_name_input.text.strip()
             if not name:
-                self.set_root_content(self.page_ajouter_routine(self.dictlanguage[self.current_language]["add_routine"][3]))  # "Empty name!"
+                self.set_root_content(self.page_ajouter_routine(self.catalog.text("add_routine", 3)))  # "Empty name!"
             elif name in self.routines:
-                self.set_root_content(self.page_ajouter_routine(self.dictlanguage[self.current_language]["add_routine"][4]))  # "Routine already exists!"
+                self.set_root_content(self.page_ajouter_routine(self.catalog.text("add_routine", 4)))  # "Routine already exists!"
             else:
-                self.routines[name] = {"name": name, "fonctions": []}
-                self.sauvegarder_routines()
+                self.store.put_routine(name, Routine(name))
                 self.set_root_content(self.page_accueil())
 
         finish_btn.bind(on_press=validate_add)
@@ -628,6 +1288,7 @@ class RoutineApp(App):
 
         return layout
 
+    @profiled("page")
     def page_routine(self, name):
         """Display routine page with list of exercises and control buttons."""
         routine = self.routines[name]
@@ -636,7 +1297,7 @@ class RoutineApp(App):
 
         # Centered title label with auto-resize
         title_label = AutoResizeLabel(
-            text=f"{self.dictlanguage[self.current_language]['routine_page'][0]} {routine['name']}",
+            text=f"{self.catalog.text('routine_page', 0)} {routine.name}",
             font_size=22,
             size_hint=(1, None),
             height=40,
@@ -650,73 +1311,27 @@ class RoutineApp(App):
 
         layout.add_widget(Widget(size_hint=(1, None), height=10))
 
-        # ScrollView containing exercises
-        scroll = ScrollView(size_hint=(1, 0.70))
-        exercice_layout = BoxLayout(orientation="vertical", size_hint_y=None, spacing=20, padding=[0, 5])
-        exercice_layout.bind(minimum_height=exercice_layout.setter("height"))
-
-        for index, ex in enumerate(routine["fonctions"]):
-            ex_layout = BoxLayout(size_hint_y=None, height=70, spacing=10)
-
-            # Build exercise description text
-            if ex["duration"]:
-                text = (
-                    f"{ex['name']}\n"
-                    f"{ex['repetitions']} {self.dictlanguage[self.current_language]['routine_page'][1]}, "
-                    f"{ex['duration']}{self.dictlanguage[self.current_language]['routine_page'][2]}"
-                )
-            else:
-                text = (
-                    f"{ex['name']}\n"
-                    f"{ex['repetitions']} {self.dictlanguage[self.current_language]['routine_page'][1]}, "
-                    f"{ex['units']} {self.dictlanguage[self.current_language]['routine_page'][3]}"
-                )
-
-            label = Label(
-                text=text,
-                size_hint=(0.5, 1),
-                halign="center",
-                valign="middle"
-            )
-            label.bind(
-                size=lambda instance, value: setattr(instance, 'text_size', value)
-            )
-            ex_layout.add_widget(label)
-
-            # Buttons for each exercise: up, down, modify
-            up_btn = StyledButton(text="↑", font_name="necessary/arial.ttf", size_hint=(0.1, 1))
-            up_btn.bind(on_press=lambda instance, i=index: self.deplacer_exercice(name, i, -1))
-            layout.register_focusable(up_btn)
-            ex_layout.add_widget(up_btn)
-
-            down_btn = StyledButton(text="↓", font_name="necessary/arial.ttf", size_hint=(0.1, 1))
-            down_btn.bind(on_press=lambda instance, i=index: self.deplacer_exercice(name, i, 1))
-            layout.register_focusable(down_btn)
-            ex_layout.add_widget(down_btn)
-
-            modify_btn = StyledButton(text="\N{pencil}", font_name='necessary/SegoeUIEmoji.TTF', size_hint=(0.1, 1))
-            modify_btn.bind(on_press=lambda instance, i=index: self.set_root_content(self.page_modifier_exercice(name, i)))
-            layout.register_focusable(modify_btn)
-            ex_layout.add_widget(modify_btn)
-
-            exercice_layout.add_widget(ex_layout)
-
-        scroll.add_widget(exercice_layout)
-        layout.add_widget(scroll)
+        # Recycled list of exercises: only visible rows have widgets
+        self.exercise_list = RecycledList(ExerciseRow, row_height=70, spacing=20, padding=[0, 5], size_hint=(1, 0.70))
+        self.exercise_list.data = [
+            {"routine": name, "text": self.exercise_text(ex)} for ex in routine.exercises
+        ]
+        layout.add_widget(self.exercise_list)
+        layout.register_focusable(self.exercise_list)
 
         # Bottom buttons: launch, modify, back
         btn_layout = BoxLayout(size_hint=(1, 0.15), spacing=10)
 
-        has_exercises = len(routine["fonctions"]) > 0
-        launch_btn = StyledButton(text=self.dictlanguage[self.current_language]["routine_page"][4], size_hint=(0.4, None), height=50, disabled=not has_exercises)
+        has_exercises = len(routine.exercises) > 0
+        launch_btn = StyledButton(text=self.catalog.text("routine_page", 4), size_hint=(0.4, None), height=50, disabled=not has_exercises)
         layout.register_focusable(launch_btn)
         launch_btn.bind(on_press=lambda *args: self.lancer_routine(name))
 
-        modify_btn = StyledButton(text=self.dictlanguage[self.current_language]["routine_page"][5], size_hint=(0.4, None), height=50)
+        modify_btn = StyledButton(text=self.catalog.text("routine_page", 5), size_hint=(0.4, None), height=50)
         layout.register_focusable(modify_btn)
         modify_btn.bind(on_press=lambda *args: self.set_root_content(self.page_modifier_routine(name)))
 
-        back_btn = StyledButton(text=self.dictlanguage[self.current_language]["routine_page"][6], size_hint=(0.4, None), height=50)
+        back_btn = StyledButton(text=self.catalog.text("routine_page", 6), size_hint=(0.4, None), height=50)
         layout.register_focusable(back_btn)
         back_btn.bind(on_press=lambda *args: self.set_root_content(self.page_accueil()))
 
@@ -728,6 +1343,17 @@ class RoutineApp(App):
 
         return layout
 
+    def exercise_text(self, ex):
+        """Build the two-line description of an exercise."""
+        if ex.timed:
+            return self.catalog.format(
+                "exercise_duration", name=ex.name, repetitions=ex.repetitions, duration=ex.duration
+            )
+        return self.catalog.format(
+            "exercise_units", name=ex.name, repetitions=ex.repetitions, units=ex.units
+        )
+
+    @profiled("page")
     def page_renommer_routine(self, nom):
         """Return layout to rename a routine."""
         layout = FocusableForm(orientation="vertical", spacing=10, padding=10)
@@ -737,7 +1363,7 @@ class RoutineApp(App):
 
         # Centered title
         label = Label(
-            text=self.dictlanguage[self.current_language].get("rename_routine", "Rename the routine"),
+            text=self.catalog.get("rename_routine", "Rename the routine"),
             font_size=30,
             size_hint=(1, None),
             height=40,
@@ -749,7 +1375,7 @@ class RoutineApp(App):
 
         # Text input for routine name
         routine_name_input = MyTextInput(
-            text=self.routines[nom]["name"],
+            text=self.routines[nom].name,
             size_hint=(1, None),
             height=40,
             max_length=20
@@ -774,28 +1400,20 @@ class RoutineApp(App):
             """Validate and apply the new routine name."""
             nouveau_nom = routine_name_input.text.strip()
             if not nouveau_nom:
-                error_label.text = self.dictlanguage[self.current_language]["add_routine"][3]
+                error_label.text = self.catalog.text("add_routine", 3)
             elif nouveau_nom in self.routines and nouveau_nom != nom:
-                error_label.text = self.dictlanguage[self.current_language]["add_routine"][4]
+                error_label.text = self.catalog.text("add_routine", 4)
             else:
-                # Preserve order when renaming
-                routines_ordonnees = list(self.routines.items())
-                index = [i for i, (k, _) in enumerate(routines_ordonnees) if k == nom][0]
-                _, ancienne_valeur = routines_ordonnees.pop(index)
-                ancienne_valeur["name"] = nouveau_nom
-                routines_ordonnees.insert(index, (nouveau_nom, ancienne_valeur))
-
-                self.routines = dict(routines_ordonnees)
-                self.sauvegarder_routines()
+                self.store.rename_routine(nom, nouveau_nom)  # Preserves order
                 self.set_root_content(self.page_accueil())
 
         # Buttons layout
         btn_layout = BoxLayout(size_hint=(1, 0.2), spacing=10)
-        valider_btn = StyledButton(text=self.dictlanguage[self.current_language]["add_routine"][1])
+        valider_btn = StyledButton(text=self.catalog.text("add_routine", 1))
         layout.register_focusable(valider_btn)
         valider_btn.bind(on_press=valider_renommage)
 
-        retour_btn = StyledButton(text=self.dictlanguage[self.current_language]["add_routine"][2])
+        retour_btn = StyledButton(text=self.catalog.text("add_routine", 2))
         layout.register_focusable(retour_btn)
         retour_btn.bind(on_press=lambda *args: self.set_root_content(self.page_accueil()))
 
@@ -806,10 +1424,12 @@ class RoutineApp(App):
         return layout
 
 
+    @profiled("page")
     def page_modifier_exercice(self, nom, index):
         """Return layout to edit an exercise."""
+        from kivy.uix.scrollview import ScrollView
         routine = self.routines[nom]
-        ex = routine["fonctions"][index]
+        ex = routine.exercises[index]
         layout = FocusableForm(orientation="vertical", spacing=5, padding=[10, 10, 10, 10])
 
         scroll = ScrollView(size_hint=(1, 0.85))
@@ -818,7 +1438,7 @@ class RoutineApp(App):
 
         content.add_widget(Widget(size_hint=(1, None), height=20))
         content.add_widget(AutoResizeLabel(
-            text=f"{self.dictlanguage[self.current_language]['change_routine'][19]} {ex['name']}",
+            text=f"{self.catalog.text('change_routine', 19)} {ex.name}",
             font_size=22,
             size_hint=(1, None),
             height=40,
@@ -835,11 +1455,11 @@ class RoutineApp(App):
 
         content.add_widget(Widget(size_hint=(1, None), height=10))
 
-        exercice_name_input = add_field(self.dictlanguage[self.current_language]["change_routine"][1], ex["name"])
+        exercice_name_input = add_field(self.catalog.text("change_routine", 1), ex.name)
 
-        is_duration = "duration" in ex and ex["duration"]
-        valeur_init = ex["duration"] if is_duration else ex.get("units", "")
-        exercice_valeur_input = add_field(self.dictlanguage[self.current_language]["change_routine"][8], str(valeur_init), 5)
+        is_duration = ex.timed
+        valeur_init = ex.duration if is_duration else ex.units
+        exercice_valeur_input = add_field(self.catalog.text("change_routine", 8), str(valeur_init), 5)
 
         selected_type = {"value": "duration" if is_duration else "unit"}
 
@@ -854,11 +1474,11 @@ class RoutineApp(App):
         type_btn_layout = BoxLayout(size_hint=(1, None), height=50, spacing=10)
 
         duree_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["change_routine"][2],
+            text=self.catalog.text("change_routine", 2),
             size_hint=(0.5, None), height=40
         )
         unite_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["change_routine"][5],
+            text=self.catalog.text("change_routine", 5),
             size_hint=(0.5, None), height=40
         )
 
@@ -874,14 +1494,14 @@ class RoutineApp(App):
         layout.register_focusable(duree_btn)
         layout.register_focusable(unite_btn)
 
-        exercice_reps_input = add_field(self.dictlanguage[self.current_language]["change_routine"][3], str(ex.get("repetitions", "")), 4)
-        exercice_repos_input = add_field(self.dictlanguage[self.current_language]["change_routine"][4], str(ex.get("rest", "")), 4)
+        exercice_reps_input = add_field(self.catalog.text("change_routine", 3), str(ex.repetitions), 4)
+        exercice_repos_input = add_field(self.catalog.text("change_routine", 4), str(ex.rest), 4)
 
         scroll.add_widget(content)
         layout.add_widget(scroll)
 
         btn_layout = BoxLayout(size_hint=(1, 0.15), spacing=10)
-        enregistrer_btn = StyledButton(text=self.dictlanguage[self.current_language]["change_routine"][20], size_hint=(0.45, None), height=50)
+        enregistrer_btn = StyledButton(text=self.catalog.text("change_routine", 20), size_hint=(0.45, None), height=50)
 
         enregistrer_btn.bind(on_press=lambda *args: self.enregistrer_modification_exercice(
             nom, index,
@@ -892,7 +1512,7 @@ class RoutineApp(App):
             exercice_valeur_input.text if selected_type["value"] == "unit" else ""
         ))
 
-        retour_btn = StyledButton(text=self.dictlanguage[self.current_language]["change_routine"][7], size_hint=(0.45, None), height=50)
+        retour_btn = StyledButton(text=self.catalog.text("change_routine", 7), size_hint=(0.45, None), height=50)
         retour_btn.bind(on_press=lambda *args: self.set_root_content(self.page_routine(nom)))
 
         remove_btn = StyledButton(text="X", size_hint=(0.1, None), height=50)
@@ -911,37 +1531,44 @@ class RoutineApp(App):
     
     def deplacer_exercice(self, routine_nom, index, direction):
         """Move an exercise up or down in the list."""
-        exercices = self.routines[routine_nom]["fonctions"]
+        exercices = self.routines[routine_nom].exercises
         if 0 <= index + direction < len(exercices):
-            exercices.insert(index + direction, exercices.pop(index))
-            self.sauvegarder_routines()
-            self.set_root_content(self.page_routine(routine_nom))
+            self.store.move_exercise(routine_nom, index, index + direction)
+            # Swap the two entries: only their rows are rebound
+            data = self.exercise_list.data
+            data[index], data[index + direction] = data[index + direction], data[index]
 
     def supprimer_exercice(self, routine_nom, index):
         """Delete an exercise from the routine."""
-        del self.routines[routine_nom]["fonctions"][index]
-        self.sauvegarder_routines()
+        del self.routines[routine_nom].exercises[index]
+        self.store.put_routine(routine_nom, self.routines[routine_nom])
         self.set_root_content(self.page_routine(routine_nom))
 
+    @profiled("page")
     def lancer_routine(self, nom):
         """Start running the routine."""
-        self.paused = False
         self.routine = self.routines[nom]
-        self.current_exercise_index = 0
-        self.current_repetition = 1
-        self.is_resting = False
-        self.remaining_time = self.routine["fonctions"][0]["duration"] or 0
+        # Session state lives outside the App; this page only renders it
+        self.session = RoutineSession(compile_plan(self.routine))
+        self.session.listeners.append(self.afficher_exercice)
+        self.telemetry = SessionTelemetry(self.session, nom)  # Per-segment timing, saved when the run ends
 
         self.routine_layout = FocusableForm(orientation="vertical", spacing=10, padding=10)
+        # Static part: exercise name and repetition, or rest and what comes next
         self.timer_label = AutoResizeLabel(
-            text=self.dictlanguage[self.current_language]["start_routine"][0],
+            text=self.catalog.text("start_routine", 0),
             font_size=24, halign='center', valign='middle'
         )
         self.routine_layout.add_widget(self.timer_label)
+        # Changing part: the countdown digits, drawn from a pre-rasterised glyph atlas
+        self.countdown_display = GlyphCountdown(
+            font_name="Arial", font_size=self.COUNTDOWN_FONT_SIZE, suffix=self.catalog.text("update_routine", 2)
+        )
+        self.routine_layout.add_widget(self.countdown_display)
 
         # Done button
         self.fait_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["start_routine"][1], size_hint=(1, 0.2)
+            text=self.catalog.text("start_routine", 1), size_hint=(1, 0.2)
         )
         self.fait_btn.bind(on_press=self.marquer_fait)
         self.fait_btn.disabled = True
@@ -950,7 +1577,7 @@ class RoutineApp(App):
 
         # Pause button
         self.pause_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["start_routine"][2], size_hint=(1, 0.2)
+            text=self.catalog.text("start_routine", 2), size_hint=(1, 0.2)
         )
         self.pause_btn.bind(on_press=self.toggle_pause)
         self.routine_layout.add_widget(self.pause_btn)
@@ -958,7 +1585,7 @@ class RoutineApp(App):
 
         # Skip rest button
         self.skip_rest_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["start_routine"][3], size_hint=(1, 0.2)
+            text=self.catalog.text("start_routine", 3), size_hint=(1, 0.2)
         )
         self.skip_rest_btn.bind(on_press=self.pass_rest_time)
         self.skip_rest_btn.disabled = True
@@ -967,105 +1594,96 @@ class RoutineApp(App):
 
         # Stop button
         stop_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["start_routine"][4], size_hint=(1, 0.2)
+            text=self.catalog.text("start_routine", 4), size_hint=(1, 0.2)
         )
         stop_btn.bind(on_press=lambda *args: self.set_root_content(self.page_routine(nom)))
         self.routine_layout.add_widget(stop_btn)
         self.routine_layout.register_focusable(stop_btn)
 
         self.set_root_content(self.routine_layout)
-        Clock.schedule_interval(self.update_routine, 1.0)
+        self.runner_visible = True
+        self.timer_engine.start(self.update_routine)
+        self.page_scope.bind(Window, on_minimize=self.on_runner_hidden, on_restore=self.on_runner_shown)
+        self.page_scope.add_cleanup(self.report_wakeups)
+        self.page_scope.add_cleanup(self.sauvegarder_telemetrie)
+        self.page_scope.add_cleanup(self.timer_engine.stop)  # Leaving the page cancels the timer
+        self.page_scope.add_cleanup(self.session.listeners.clear)  # The session stops rendering into this page
+        self.session.start()
 
     def toggle_pause(self, instance):
         """Toggle pause/resume state."""
-        self.paused = not self.paused
+        self.session.toggle_pause()
         instance.text = (
-            self.dictlanguage[self.current_language]["toggle_pause"][0]
-            if self.paused else
-            self.dictlanguage[self.current_language]["toggle_pause"][1]
+            self.catalog.text("toggle_pause", 0)
+            if self.session.paused else
+            self.catalog.text("toggle_pause", 1)
         )
 
     def pass_rest_time(self, instance):
         """Skip the current rest period."""
-        self.is_resting = False
-        self.remaining_time = 0
-        self.skip_rest_btn.disabled = True  # Disable skip button after use
-
-        # Advance to next repetition or exercise
-        self.current_repetition += 1
-        if self.current_repetition > self.routine["fonctions"][self.current_exercise_index]["repetitions"]:
-            self.current_exercise_index += 1
-            self.current_repetition = 1
-        self.afficher_exercice()
+        self.session.skip_rest()
 
+    @profiled("clock")
     def update_routine(self, dt):
-        """Update timer and routine state every second."""
-        if self.paused:
-            return
+        """Wakeup at the session's next event: advance it, refresh the countdown, schedule the next one."""
+        routineprofile.sample("tick_jitter", self.timer_engine.lateness)  # How late this wakeup ran
+        self.session.advance()  # Catches up on every segment whose deadline passed during a stall
+        self.afficher_decompte()
+        self.planifier_reveil()
 
-        if self.current_exercise_index >= len(self.routine["fonctions"]):
-            self.timer_label.text = self.dictlanguage[self.current_language]["update_routine"][0]
-            Clock.unschedule(self.update_routine)
-            return
+    def planifier_reveil(self):
+        """
+        Arm a single wakeup at the next event: the next displayed second while the page is visible,
+        the segment end while minimised, nothing while paused or waiting for "Done".
+        """
+        self.timer_engine.arm(self.session.next_wakeup(visible=self.runner_visible, step=self.DISPLAY_STEP))
+
+    def on_runner_hidden(self, *args):
+        self.runner_visible = False
+        self.planifier_reveil()
+
+    def on_runner_shown(self, *args):
+        self.runner_visible = True
+        self.afficher_decompte()
+        self.planifier_reveil()
+
+    def report_wakeups(self):
+        """Log how often the running routine woke the app."""
+        Logger.info(
+            f"RoutineApp: {self.timer_engine.wakeups} timer wakeups "
+            f"({self.timer_engine.wakeups_per_minute():.1f}/min) while running the routine"
+        )
 
-        exercise = self.routine["fonctions"][self.current_exercise_index]
-
-        if self.is_resting:
-            self.skip_rest_btn.disabled = False  # Enable skip rest button
-            self.fait_btn.disabled = True  # Disable done button during rest
-            if self.remaining_time > 0:
-                # Déterminer l'exercice suivant
-                if self.current_repetition < exercise["repetitions"]:
-                    next_ex = exercise["name"]
-                elif self.current_exercise_index + 1 < len(self.routine["fonctions"]):
-                    next_ex = self.routine["fonctions"][self.current_exercise_index + 1]["name"]
-
-                self.timer_label.text = (
-                    f"{self.dictlanguage[self.current_language]['update_routine'][1]} "
-                    f"{self.remaining_time}{self.dictlanguage[self.current_language]['update_routine'][2]}\n"
-                    f" -> {next_ex}"
-                )
-                self.remaining_time -= 1
-            else:
-                self.is_resting = False
-                self.current_repetition += 1
-                if self.current_repetition > exercise["repetitions"]:
-                    self.current_exercise_index += 1
-                    self.current_repetition = 1
-                self.afficher_exercice()
-        else:
-            if exercise["duration"]:
-                if self.remaining_time > 0:
-                    self.timer_label.text = (
-                        f"{exercise['name']}\n"
-                        f"{self.dictlanguage[self.current_language]['update_routine'][3]} "
-                        f"{self.current_repetition}/{exercise['repetitions']} - "
-                        f"{self.remaining_time}{self.dictlanguage[self.current_language]['update_routine'][2]}"
-                    )
-                    self.remaining_time -= 1
-                else:
-                    last_exercise = self.current_exercise_index == len(self.routine["fonctions"]) - 1
-                    last_repetition = self.current_repetition == exercise["repetitions"]
-
-                    if not last_exercise or not last_repetition:
-                        self.is_resting = True
-                        self.remaining_time = exercise["rest"]
-                    else:
-                        # End of routine
-                        self.timer_label.text = self.dictlanguage[self.current_language]["update_routine"][0]
-                        Clock.unschedule(self.update_routine)
-            else:
-                self.timer_label.text = (
-                    f"{exercise['name']} - "
-                    f"{self.dictlanguage[self.current_language]['update_routine'][3]} "
-                    f"{self.current_repetition}/{exercise['repetitions']} - "
-                    f"{exercise['units']} "
-                    f"{self.dictlanguage[self.current_language]['update_routine'][4]}"
-                )
-                self.fait_btn.disabled = False
+    def afficher_decompte(self):
+        """Redraw the countdown digits of the current timed segment (the title is left alone)."""
+        session = self.session
+        if session.segment is None or session.countdown is None:
+            return  # Finished, or waiting for the "Done" button
+        remaining = session.countdown.remaining()
+        self.countdown_display.set_text(
+            countdown_text(remaining, self.DISPLAY_STEP) + self.catalog.text("update_routine", 2)
+        )
+
+    def finir_routine(self):
+        """Show the end message and release the timer."""
+        self.timer_label.text = self.catalog.text("update_routine", 0)
+        self.countdown_display.clear()
+        self.fait_btn.disabled = True
+        self.skip_rest_btn.disabled = True
+        self.timer_engine.disarm()
+        self.sauvegarder_telemetrie()
+
+    def sauvegarder_telemetrie(self):
+        """Append the run's timing log next to the routines file (once per run)."""
+        try:
+            self.telemetry.save(f"{self.FILE_PATH}.timing")
+        except OSError as e:
+            Logger.warning(f"RoutineApp: could not save timing log: {e}")
 
+    @profiled("page")
     def page_modifier_routine(self, nom):
         """Build UI to modify a routine."""
+        from kivy.uix.scrollview import ScrollView
         routine = self.routines[nom]
         layout = FocusableForm(orientation="vertical", spacing=5, padding=[10, 10, 10, 10])
 
@@ -1078,7 +1696,7 @@ class RoutineApp(App):
 
         # Title label
         content.add_widget(AutoResizeLabel(
-            text=f"{self.dictlanguage[self.current_language]['change_routine'][0]} {routine['name']}",
+            text=f"{self.catalog.text('change_routine', 0)} {routine.name}",
             font_size=22,
             size_hint=(1, None),
             height=40,
@@ -1095,10 +1713,10 @@ class RoutineApp(App):
 
         content.add_widget(Widget(size_hint=(1, None), height=10))
 
-        exercice_name_input = add_field(self.dictlanguage[self.current_language]["change_routine"][1])
+        exercice_name_input = add_field(self.catalog.text("change_routine", 1))
 
         # Value field (duration or units)
-        content.add_widget(Label(text=self.dictlanguage[self.current_language]["change_routine"][8], size_hint=(1, None), height=25))
+        content.add_widget(Label(text=self.catalog.text("change_routine", 8), size_hint=(1, None), height=25))
         exercice_valeur_input = MyTextInput(size_hint=(1, None), max_length=5, height=40)
         content.add_widget(exercice_valeur_input)
         layout.register_focusable(exercice_valeur_input)
@@ -1115,12 +1733,12 @@ class RoutineApp(App):
         type_btn_layout = BoxLayout(size_hint=(1, None), height=50, spacing=10)
 
         duree_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["change_routine"][2],
+            text=self.catalog.text("change_routine", 2),
             size_hint=(0.5, None),
             height=40
         )
         unite_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["change_routine"][5],
+            text=self.catalog.text("change_routine", 5),
             size_hint=(0.5, None),
             height=40
         )
@@ -1137,14 +1755,14 @@ class RoutineApp(App):
         layout.register_focusable(duree_btn)
         layout.register_focusable(unite_btn)
 
-        exercice_reps_input = add_field(self.dictlanguage[self.current_language]["change_routine"][3], 4)
-        exercice_repos_input = add_field(self.dictlanguage[self.current_language]["change_routine"][4], 4)
+        exercice_reps_input = add_field(self.catalog.text("change_routine", 3), 4)
+        exercice_repos_input = add_field(self.catalog.text("change_routine", 4), 4)
 
         scroll.add_widget(content)
         layout.add_widget(scroll)
 
         btn_layout = BoxLayout(size_hint=(1, 0.15), spacing=10)
-        ajouter_btn = StyledButton(text=self.dictlanguage[self.current_language]["change_routine"][6], size_hint=(0.5, None), height=50)
+        ajouter_btn = StyledButton(text=self.catalog.text("change_routine", 6), size_hint=(0.5, None), height=50)
 
         ajouter_btn.bind(on_press=lambda *args: self.ajouter_exercice(
             nom,
@@ -1157,7 +1775,7 @@ class RoutineApp(App):
 
         layout.register_focusable(ajouter_btn)
 
-        retour_btn = StyledButton(text=self.dictlanguage[self.current_language]["change_routine"][7], size_hint=(0.5, None), height=50)
+        retour_btn = StyledButton(text=self.catalog.text("change_routine", 7), size_hint=(0.5, None), height=50)
         retour_btn.bind(on_press=lambda *args: self.set_root_content(self.page_routine(nom)))
         layout.register_focusable(retour_btn)
 
@@ -1173,7 +1791,7 @@ class RoutineApp(App):
 
         # Check if name is empty
         if not ex_nom.strip():
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][9])  # Empty name
+            errors.append(self.catalog.text("change_routine", 9))  # Empty name
 
         # Duration and units validation: at least one must be valid
         duree_val = None
@@ -1188,9 +1806,9 @@ class RoutineApp(App):
                 if duree_val > 0:
                     duree_ok = True
                 else:
-                    errors.append(self.dictlanguage[self.current_language]["change_routine"][10])  # Duration ≤ 0
+                    errors.append(self.catalog.text("change_routine", 10))  # Duration ≤ 0
             except (ValueError, TypeError):
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][14])  # Invalid duration
+                errors.append(self.catalog.text("change_routine", 14))  # Invalid duration
 
         # Validate units
         if unites:
@@ -1198,42 +1816,41 @@ class RoutineApp(App):
                 unites_val = int(unites)
                 unites_ok = True
             except (ValueError, TypeError):
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][13])  # Invalid units
+                errors.append(self.catalog.text("change_routine", 13))  # Invalid units
 
         if not duree and not unites:
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][17])  # No duration/units specified
+            errors.append(self.catalog.text("change_routine", 17))  # No duration/units specified
 
         # Validate repetitions
         try:
             repetitions_val = int(repetitions)
             if repetitions_val <= 0:
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][11])  # Repetitions ≤ 0
+                errors.append(self.catalog.text("change_routine", 11))  # Repetitions ≤ 0
         except (ValueError, TypeError):
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][15])  # Invalid repetitions
+            errors.append(self.catalog.text("change_routine", 15))  # Invalid repetitions
 
         # Validate rest
         try:
             repos_val = int(repos)
             if repos_val < 0:
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][12])  # Rest < 0
+                errors.append(self.catalog.text("change_routine", 12))  # Rest < 0
         except (ValueError, TypeError):
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][16])  # Invalid rest
+            errors.append(self.catalog.text("change_routine", 16))  # Invalid rest
 
         # Add exercise if no errors
         if not errors:
-            exercice = {
-                "name": ex_nom.strip(),
-                "duration": duree_val if duree_ok else 0,
-                "repetitions": repetitions_val,
-                "rest": repos_val,
-                "units": unites_val if unites_ok else None
-            }
-            self.routines[routine_nom]["fonctions"].append(exercice)
-            self.sauvegarder_routines()
+            exercice = Exercise(
+                ex_nom.strip(),
+                duration=duree_val if duree_ok else 0,
+                repetitions=repetitions_val,
+                rest=repos_val,
+                units=unites_val if unites_ok else None,
+            )
+            self.store.put_exercise(routine_nom, len(self.routines[routine_nom].exercises), exercice)
             self.set_root_content(self.page_routine(routine_nom))
         else:
             if len(errors) >= 3:
-                error_message = self.dictlanguage[self.current_language]["change_routine"][18]
+                error_message = self.catalog.text("change_routine", 18)
             else:
                 error_message = "\n".join(errors)
             self.show_error_popup(error_message, routine_nom)
@@ -1244,7 +1861,7 @@ class RoutineApp(App):
 
         # Check empty name
         if not ex_nom.strip():
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][9])  # Empty name
+            errors.append(self.catalog.text("change_routine", 9))  # Empty name
 
         duree_val = None
         unites_val = None
@@ -1258,9 +1875,9 @@ class RoutineApp(App):
                 if duree_val > 0:
                     duree_ok = True
                 else:
-                    errors.append(self.dictlanguage[self.current_language]["change_routine"][10])  # Duration ≤ 0
+                    errors.append(self.catalog.text("change_routine", 10))  # Duration ≤ 0
             except (ValueError, TypeError):
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][14])  # Invalid duration
+                errors.append(self.catalog.text("change_routine", 14))  # Invalid duration
 
         # Validate units
         if unites:
@@ -1268,43 +1885,42 @@ class RoutineApp(App):
                 unites_val = int(unites)
                 unites_ok = True
             except (ValueError, TypeError):
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][13])  # Invalid units
+                errors.append(self.catalog.text("change_routine", 13))  # Invalid units
 
         # Check duration or units present
         if not duree and not unites:
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][17])  # No duration/unit
+            errors.append(self.catalog.text("change_routine", 17))  # No duration/unit
 
         # Validate repetitions
         try:
             repetitions_val = int(repetitions)
             if repetitions_val <= 0:
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][11])  # Repetitions ≤ 0
+                errors.append(self.catalog.text("change_routine", 11))  # Repetitions ≤ 0
         except (ValueError, TypeError):
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][15])  # Invalid repetitions
+            errors.append(self.catalog.text("change_routine", 15))  # Invalid repetitions
 
         # Validate rest
         try:
             repos_val = int(repos)
             if repos_val < 0:
-                errors.append(self.dictlanguage[self.current_language]["change_routine"][12])  # Negative rest
+                errors.append(self.catalog.text("change_routine", 12))  # Negative rest
         except (ValueError, TypeError):
-            errors.append(self.dictlanguage[self.current_language]["change_routine"][16])  # Invalid rest
+            errors.append(self.catalog.text("change_routine", 16))  # Invalid rest
 
         # Save changes if no errors
         if not errors:
-            exercice = {
-                "name": ex_nom.strip(),
-                "duration": duree_val if duree_ok else 0,
-                "repetitions": repetitions_val,
-                "rest": repos_val,
-                "units": unites_val if unites_ok else None
-            }
-            self.routines[routine_nom]["fonctions"][index] = exercice
-            self.sauvegarder_routines()
+            exercice = Exercise(
+                ex_nom.strip(),
+                duration=duree_val if duree_ok else 0,
+                repetitions=repetitions_val,
+                rest=repos_val,
+                units=unites_val if unites_ok else None,
+            )
+            self.store.put_exercise(routine_nom, index, exercice)
             self.set_root_content(self.page_routine(routine_nom))
         else:
             if len(errors) >= 3:
-                error_message = self.dictlanguage[self.current_language]["change_routine"][18]
+                error_message = self.catalog.text("change_routine", 18)
             else:
                 error_message = "\n".join(errors)
             self.show_error_popup(error_message, routine_nom)
@@ -1312,6 +1928,8 @@ class RoutineApp(App):
 
     def show_error_popup(self, error_message, routine_nom):
         """Show error popup with a 'Return' button."""
+        from kivy.uix.anchorlayout import AnchorLayout
+        from kivy.uix.popup import Popup
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
 
         # Centered label container
@@ -1330,7 +1948,7 @@ class RoutineApp(App):
 
         # Return button
         retour_btn = StyledButton(
-            text=self.dictlanguage[self.current_language]["change_routine"][7],  # "Return"
+            text=self.catalog.text("change_routine", 7),  # "Return"
             size_hint=(1, None),
             height=50
         )
@@ -1348,50 +1966,48 @@ class RoutineApp(App):
         popup.open()
 
     def charger_routines(self):
-        """Load routines from file or return default data."""
-        if os.path.exists(self.FILE_PATH):
-            with open(self.FILE_PATH, 'r') as f:
-                return json.load(f)
-        return {"first_time": True, "language": "English", "routines": {}}
-
-
-    def sauvegarder_routines(self):
-        """Save current routines data to file."""
-        self.routines_data["routines"] = self.routines
-        with open(self.FILE_PATH, 'w') as f:
-            json.dump(self.routines_data, f, indent=4)
+        """Load routines from the configured store, or return default data."""
+        if self.STORE_BACKEND == "sqlite":
+            from routinedb import SQLiteStore, importer_donnees
+            if not os.path.exists(self.DB_PATH) and os.path.exists(self.FILE_PATH):
+                # First SQLite launch: migrate the existing JSON library once
+                importer_donnees(JournalStore(self.FILE_PATH).load(), self.DB_PATH)
+            self.store = SQLiteStore(self.DB_PATH)
+        else:
+            self.store = JournalStore(self.FILE_PATH)
+        return self.store.load()
 
 
-    def afficher_exercice(self):
-        """Display current exercise or stop if finished."""
-        if self.current_exercise_index >= len(self.routine["fonctions"]):
-            self.timer_label.text = self.dictlanguage[self.current_language]["update_routine"][0]
-            Clock.unschedule(self.update_routine)
+    def afficher_exercice(self, session):
+        """Session listener: render the segment just entered (or the end of the routine), then reschedule."""
+        if session.finished:
+            self.finir_routine()
             return
 
-        exercise = self.routine["fonctions"][self.current_exercise_index]
-        self.fait_btn.disabled = True
+        segment = session.segment
+        self.fait_btn.disabled = segment.kind != MANUAL
+        self.skip_rest_btn.disabled = segment.kind != REST
 
-        if exercise["duration"]:
-            self.remaining_time = exercise["duration"]
+        if segment.kind == MANUAL:
+            self.timer_label.text = self.catalog.format(
+                "units", name=segment.name, repetition=segment.repetition,
+                repetitions=segment.repetitions, units=segment.units
+            )
+            self.countdown_display.clear()
+        elif segment.kind == REST:
+            next_ex = session.plan.next_up(session.index)
+            self.timer_label.text = self.catalog.format("rest_title", next=next_ex.name)
+            self.afficher_decompte()
         else:
-            self.timer_label.text = f"{exercise['name']} - {self.dictlanguage[self.current_language]['update_routine'][3]} {self.current_repetition}/{exercise['repetitions']} - {exercise['units']} {self.dictlanguage[self.current_language]['update_routine'][4]}"
-            self.fait_btn.disabled = False
-
+            self.timer_label.text = self.catalog.format(
+                "work_title", name=segment.name, repetition=segment.repetition, repetitions=segment.repetitions
+            )
+            self.afficher_decompte()
+        self.planifier_reveil()  # Pause, "Done" and skips change the next event
 
     def marquer_fait(self, instance):
-        """Mark current exercise done and start rest or finish routine."""
-        self.fait_btn.disabled = True
-        if self.current_exercise_index < len(self.routine["fonctions"]) - 1:  # Avoid last rest
-            self.is_resting = True
-            self.remaining_time = self.routine["fonctions"][self.current_exercise_index]["rest"]
-        else:
-            if self.current_repetition < self.routine["fonctions"][self.current_exercise_index]["repetitions"]:
-                self.is_resting = True
-                self.remaining_time = self.routine["fonctions"][self.current_exercise_index]["rest"]
-            else:
-                self.timer_label.text = self.dictlanguage[self.current_language]["update_routine"][0]
-                Clock.unschedule(self.update_routine)
+        """Mark current exercise done and move to the next segment (rest or exercise)."""
+        self.session.mark_done()
 
 # Lauch the app    
 if __name__ == "__main__":
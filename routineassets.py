@@ -0,0 +1,103 @@
+import collections
+import os
+import sys
+
+# Bundled fonts, registered with Kivy under these names
+FONTS = {
+    "Arial": "necessary/arial.ttf",
+    "SegoeUIEmoji": "necessary/SegoeUIEmoji.TTF",
+}
+BACKGROUNDS = {
+    "portrait": "necessary/images/fondportraitbienvenue.jpg",
+    "landscape": "necessary/images/fondpaysagebienvenue.png",
+}
+SIZE_STEP = 256  # Scaled backgrounds are made for window sizes rounded up to this many pixels
+
+
+def resource_path(relative_path):
+    """Return absolute path to resource, compatible with PyInstaller or normal execution."""
+    try:
+        # If bundled with PyInstaller
+        base_path = sys._MEIPASS
+    except AttributeError:
+        # In normal execution
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+def orientation(width, height):
+    return "portrait" if height > width else "landscape"
+
+
+class AssetManager:
+    """
+    Fonts and background images of the app, loaded once.
+    - Fonts are registered with Kivy by name on the first register_fonts() call.
+    - Each background is decoded once, on first use.
+    - Backgrounds scaled to the window (size rounded up to SIZE_STEP, never above the source)
+      are kept in an LRU of `capacity` entries, so resizing back and forth redraws nothing.
+    Kivy is imported on use: textures need a GL context.
+    """
+
+    def __init__(self, capacity=4, fonts=FONTS, backgrounds=BACKGROUNDS):
+        self.capacity = capacity
+        self.fonts = fonts
+        self.backgrounds = backgrounds
+        self.fonts_registered = False
+        self.decodes = 0  # Images decoded from disk
+        self.scales = 0  # Scaled textures drawn
+        self._sources = {}  # orientation -> full-size texture
+        self._scaled = collections.OrderedDict()  # (orientation, width, height) -> Fbo holding the scaled texture
+
+    def register_fonts(self):
+        if self.fonts_registered:
+            return
+        from kivy.core.text import LabelBase
+        for name, path in self.fonts.items():
+            LabelBase.register(name=name, fn_regular=resource_path(path))
+        self.fonts_registered = True
+
+    def source(self, kind):
+        """Full-size texture of the `kind` ("portrait" or "landscape") background."""
+        texture = self._sources.get(kind)
+        if texture is None:
+            from kivy.core.image import Image as CoreImage
+            texture = CoreImage(resource_path(self.backgrounds[kind])).texture
+            self._sources[kind] = texture
+            self.decodes += 1
+        return texture
+
+    def background(self, width, height):
+        """Background texture for a window of this size."""
+        kind = orientation(width, height)
+        source = self.source(kind)
+        size = (self._bucket(width, source.width), self._bucket(height, source.height))
+        if size == tuple(source.size):
+            return source
+        key = (kind,) + size
+        fbo = self._scaled.get(key)
+        if fbo is None:
+            fbo = self._scale(source, size)
+            self._scaled[key] = fbo
+            if len(self._scaled) > self.capacity:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(key)
+        return fbo.texture
+
+    @staticmethod
+    def _bucket(length, limit):
+        return min(limit, -(-int(length) // SIZE_STEP) * SIZE_STEP)
+
+    def _scale(self, source, size):
+        """
+        Draw `source` into an offscreen buffer of `size`.
+        The Fbo is kept rather than only its texture: Kivy redraws it if the GL context is lost.
+        """
+        from kivy.graphics import Fbo, Rectangle
+        fbo = Fbo(size=size)
+        with fbo:
+            Rectangle(texture=source, size=size)
+        fbo.draw()
+        self.scales += 1
+        return fbo
@@ -0,0 +1,49 @@
+import hashlib
+import json
+import marshal
+import os
+
+CACHE_VERSION = 2  # Bump when the cached layout changes
+
+
+def _source_key(path, raw):
+    """Cache key of a source file: format version, mtime, size and content hash."""
+    stat = os.stat(path)
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    return (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest)
+
+
+def load_json_cached(path, cache_path=None):
+    """
+    Load a JSON file through a marshal snapshot stored next to it.
+    - When the source is unchanged, the parsed data comes straight from the snapshot.
+    - Otherwise the JSON is parsed as usual and the snapshot rebuilt (best effort).
+    """
+    cache_path = cache_path or f"{path}.cache"
+    with open(path, "rb") as f:
+        raw = f.read()
+    key = _source_key(path, raw)
+
+    try:
+        with open(cache_path, "rb") as f:
+            snapshot = memoryview(f.read())
+        # Layout: 4-byte key length, marshalled key, marshalled data.
+        # Always parsed from memory: marshal.load() on a file object reads in tiny chunks.
+        key_length = int.from_bytes(snapshot[:4], "little")
+        if marshal.loads(snapshot[4:4 + key_length]) == key:
+            return marshal.loads(snapshot[4 + key_length:])
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # Missing or unreadable snapshot: fall back to JSON
+
+    data = json.loads(raw.decode("utf-8"))
+    try:
+        tmp_path = f"{cache_path}.tmp"
+        key_bytes = marshal.dumps(key)
+        with open(tmp_path, "wb") as f:
+            f.write(len(key_bytes).to_bytes(4, "little"))
+            f.write(key_bytes)
+            f.write(marshal.dumps(data))
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        pass  # Read-only location: keep working without a snapshot
+    return data
@@ -0,0 +1,218 @@
+import json
+import sqlite3
+import sys
+
+from routinemodel import Exercise, Routine, RoutineMap, to_json
+from routinestore import JournalStore, RoutineStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL  -- JSON encoded
+);
+CREATE TABLE IF NOT EXISTS routines (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS routines_name ON routines (name);
+CREATE INDEX IF NOT EXISTS routines_position ON routines (position);
+CREATE TABLE IF NOT EXISTS exercises (
+    routine_id INTEGER NOT NULL REFERENCES routines (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    duration INTEGER NOT NULL DEFAULT 0,
+    repetitions INTEGER NOT NULL,
+    rest INTEGER NOT NULL DEFAULT 0,
+    units INTEGER,
+    PRIMARY KEY (routine_id, position)
+);
+"""
+
+
+class SQLiteStore(RoutineStore):
+    """
+    Routines stored as rows in a local SQLite file.
+    - Routines and exercises carry explicit position columns, so reorder, rename, delete
+      and copy touch a handful of rows instead of serialising the whole library.
+    - Editing or moving one exercise (put_exercise, move_exercise) touches only its rows.
+    - Same load/mutate/commit surface as JournalStore, so SaveQueue works unchanged.
+    """
+
+    def __init__(self, path, autocommit=True):
+        super().__init__(autocommit)
+        self.path = path
+        # Only ever used under the I/O lock, possibly from the SaveQueue worker thread
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def load(self):
+        """Read settings, routines and exercises in position order."""
+        with self._io_lock:
+            db = self.connection
+            data = {key: json.loads(value) for key, value in db.execute("SELECT key, value FROM settings")}
+            for key, value in self.DEFAULT_DATA.items():
+                data.setdefault(key, value)
+
+            routines = RoutineMap()
+            by_id = {}
+            for routine_id, name in db.execute("SELECT id, name FROM routines ORDER BY position"):
+                routines[name] = by_id[routine_id] = Routine(name)
+            rows = db.execute(
+                "SELECT routine_id, name, duration, repetitions, rest, units FROM exercises "
+                "ORDER BY routine_id, position"
+            )
+            for routine_id, name, duration, repetitions, rest, units in rows:
+                by_id[routine_id].exercises.append(Exercise(name, duration, repetitions, rest, units))
+            data["routines"] = routines
+        self.data = data
+        return data
+
+    def commit(self):
+        """Apply pending operations in one transaction; return how many were written."""
+        with self._io_lock:
+            with self.lock:
+                ops, self.pending = self.pending, []
+                # Routine contents are read now, while mutations are blocked
+                ops = [json.loads(json.dumps(op, default=to_json)) if op[0] in ("put", "exercise") else op for op in ops]
+            if not ops:
+                return 0
+            with self.connection:
+                for op in ops:
+                    getattr(self, f"_sql_{op[0]}")(*op[1:])
+            return len(ops)
+
+    def compact(self):
+        """Write anything pending and reclaim free pages."""
+        self.commit()
+        with self._io_lock:
+            self.connection.execute("VACUUM")
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+    # --- One method per operation, each touching O(1) routine rows ---
+
+    def _routine_id(self, name):
+        row = self.connection.execute("SELECT id FROM routines WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _sql_set(self, key, value):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+
+    def _exercise_row(self, routine_id, position, ex):
+        return (routine_id, position, ex["name"], ex.get("duration") or 0, ex["repetitions"],
+                ex.get("rest") or 0, ex.get("units"))
+
+    def _sql_put(self, name, routine):
+        routine_id = self._routine_id(name)
+        if routine_id is None:
+            cursor = self.connection.execute(
+                "INSERT INTO routines (name, position) "
+                "VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM routines))",
+                (name,),
+            )
+            routine_id = cursor.lastrowid
+        else:
+            self.connection.execute("DELETE FROM exercises WHERE routine_id = ?", (routine_id,))
+        self.connection.executemany(
+            "INSERT INTO exercises (routine_id, position, name, duration, repetitions, rest, units) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [self._exercise_row(routine_id, position, ex) for position, ex in enumerate(routine["fonctions"])],
+        )
+
+    def _sql_delete(self, name):
+        self.connection.execute("DELETE FROM routines WHERE name = ?", (name,))
+
+    def _sql_rename(self, old, new):
+        self.connection.execute("UPDATE routines SET name = ? WHERE name = ?", (new, old))
+
+    def _sql_swap(self, first, second):
+        positions = dict(self.connection.execute(
+            "SELECT name, position FROM routines WHERE name IN (?, ?)", (first, second)
+        ))
+        if len(positions) == 2:
+            self.connection.executemany(
+                "UPDATE routines SET position = ? WHERE name = ?",
+                [(positions[second], first), (positions[first], second)],
+            )
+
+    def _sql_exercise(self, name, index, exercise):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO exercises (routine_id, position, name, duration, repetitions, rest, units) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._exercise_row(self._routine_id(name), index, exercise),
+        )
+
+    def _sql_swap_exercises(self, name, first, second):
+        # (routine_id, position) is the primary key: go through a free position
+        routine_id = self._routine_id(name)
+        self.connection.executemany(
+            "UPDATE exercises SET position = ? WHERE routine_id = ? AND position = ?",
+            [(-1, routine_id, first), (first, routine_id, second), (second, routine_id, -1)],
+        )
+
+
+def est_format_legacy(data):
+    """Return True for a fonctionbase routines.json mapping (name -> {"nom", "fonctions"})."""
+    return bool(data) and all(isinstance(v, dict) and "nom" in v and "fonctions" in v for v in data.values())
+
+
+def convertir_legacy(data):
+    """Convert a fonctionbase routines.json mapping to the routinesV3.json layout."""
+    routines = {}
+    for nom, details in data.items():
+        routines[nom] = {
+            "name": details.get("nom", nom),
+            "fonctions": [
+                {
+                    "name": f["nom"],
+                    "duration": f.get("duree") or 0,
+                    "repetitions": f.get("repetitions", 1),
+                    "rest": f.get("repos") or 0,
+                    "units": f.get("unites"),
+                }
+                for f in details.get("fonctions", [])
+            ],
+        }
+    return {"routines": routines}
+
+
+def importer_donnees(data, db_path):
+    """
+    One-shot migration of loaded JSON data into a SQLite file.
+    - Accepts the routinesV3.json layout or the fonctionbase routines.json layout.
+    """
+    if est_format_legacy(data):
+        data = convertir_legacy(data)
+    store = SQLiteStore(db_path, autocommit=False)
+    store.load()
+    for key, value in data.items():
+        if key not in ("routines", "generation"):
+            store.set_value(key, value)
+    for name, routine in data.get("routines", {}).items():
+        store.put_routine(name, routine)
+    store.close()  # A single transaction for the whole library
+
+
+def migrer_json(json_path, db_path):
+    """
+    Migrate a routinesV3.json or fonctionbase routines.json file into a SQLite file.
+    - routinesV3.json is loaded through its JournalStore, so edits still in the journal are migrated too.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not est_format_legacy(data):
+        data = JournalStore(json_path).load()
+    importer_donnees(data, db_path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python routinedb.py <routinesV3.json|routines.json> <routines.db>")
+        sys.exit(1)
+    migrer_json(sys.argv[1], sys.argv[2])
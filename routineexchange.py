@@ -0,0 +1,305 @@
+import argparse
+import json
+import os
+import sys
+
+from routinemodel import Routine
+
+FORMAT = "routineapp-routines"
+VERSION = 1
+CHUNK = 200  # Lines handled between two progress reports
+MAX_PROBLEMS = 100  # Invalid lines kept in an ImportReport; later ones are only counted
+DUPLICATE_POLICIES = ("rename", "skip", "replace")
+
+
+class ExchangeError(ValueError):
+    """The file is not a routine exchange file this version can read."""
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def check_routine(data):
+    """Return why a decoded line is not a valid routine, or None."""
+    if not isinstance(data, dict):
+        return "not an object"
+    name = data.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return "missing name"
+    exercises = data.get("fonctions")
+    if not isinstance(exercises, list):
+        return "missing exercise list"
+    for i, ex in enumerate(exercises, 1):
+        if not isinstance(ex, dict) or not isinstance(ex.get("name"), str) or not ex["name"].strip():
+            return f"exercise {i}: missing name"
+        duration, repetitions = ex.get("duration") or 0, ex.get("repetitions")
+        rest, units = ex.get("rest") or 0, ex.get("units")
+        if not _is_number(duration) or duration < 0:
+            return f"exercise {i}: invalid duration"
+        if not isinstance(repetitions, int) or isinstance(repetitions, bool) or repetitions < 1:
+            return f"exercise {i}: invalid repetitions"
+        if not _is_number(rest) or rest < 0:
+            return f"exercise {i}: invalid rest"
+        if units is not None and (not isinstance(units, int) or isinstance(units, bool) or units < 1):
+            return f"exercise {i}: invalid units"
+        if not duration and units is None:
+            return f"exercise {i}: no duration or units"
+    return None
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ImportReport:
+    """Running totals of an import, yielded after each chunk so callers can show progress."""
+
+    def __init__(self, total_bytes=0):
+        self.language = None  # Language of the exporting library, from the header
+        self.total_bytes = total_bytes
+        self.read_bytes = 0
+        self.lines = 0
+        self.imported = 0  # Added under their own name
+        self.renamed = 0  # Added under a new name, theirs being taken
+        self.replaced = 0
+        self.skipped = 0
+        self.invalid = 0
+        self.problems = []  # (line number, reason) of the first MAX_PROBLEMS invalid lines
+
+    @property
+    def progress(self):
+        return self.read_bytes / self.total_bytes if self.total_bytes else 1.0
+
+    def reject(self, reason):
+        self.invalid += 1
+        if len(self.problems) < MAX_PROBLEMS:
+            self.problems.append((self.lines, reason))
+
+    def summary(self):
+        return {
+            "language": self.language,
+            "lines": self.lines,
+            "imported": self.imported,
+            "renamed": self.renamed,
+            "replaced": self.replaced,
+            "skipped": self.skipped,
+            "invalid": self.invalid,
+        }
+
+
+def free_name(name, routines):
+    """`name`, or "name (2)", "name (3)", ... the first one not in `routines`."""
+    candidate, n = name, 1
+    while candidate in routines:
+        n += 1
+        candidate = f"{name} ({n})"
+    return candidate
+
+
+def iter_export(data, f, chunk=CHUNK):
+    """
+    Write the routines of loaded library `data` to text file `f`: a header line, then one routine per line.
+    Yields (written, total) after each chunk.
+    """
+    routines = data["routines"]
+    total = len(routines)
+    f.write(_dumps({"format": FORMAT, "version": VERSION, "language": data.get("language"), "routines": total}) + "\n")
+    written = 0
+    for name, routine in list(routines.items()):
+        line = routine.to_v3() if isinstance(routine, Routine) else dict(routine)
+        line["name"] = name
+        f.write(_dumps(line) + "\n")
+        written += 1
+        if written % chunk == 0:
+            yield written, total
+    if written % chunk or not written:
+        yield written, total
+
+
+def iter_export_file(data, path, chunk=CHUNK):
+    """iter_export into `path`, which is only replaced once the whole export is written."""
+    tmp_path = f"{path}.tmp"
+    done = False
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yield from iter_export(data, f, chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        done = True
+    finally:
+        if not done:  # Failed or abandoned half way
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+
+
+def export_file(data, path):
+    """Export the whole library; return the number of routines written."""
+    written = 0
+    for written, _ in iter_export_file(data, path):
+        pass
+    return written
+
+
+def _read_header(line):
+    try:
+        header = json.loads(line)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("format") != FORMAT:
+        raise ExchangeError("not a routine export file")
+    if not isinstance(header.get("version"), int) or header["version"] > VERSION:
+        raise ExchangeError(f"unsupported version {header.get('version')!r}")
+    return header
+
+
+def _merge_line(store, line, on_duplicate, report):
+    """Validate one routine line and put it into the store under a free name (or skip it)."""
+    try:
+        data = json.loads(line)
+    except ValueError:
+        report.reject("invalid JSON")
+        return
+    problem = check_routine(data)
+    if problem:
+        report.reject(problem)
+        return
+
+    routines = store.data["routines"]
+    name = data["name"].strip()
+    if name in routines:
+        if on_duplicate == "skip":
+            report.skipped += 1
+            return
+        if on_duplicate == "rename":
+            name = free_name(name, routines)
+            report.renamed += 1
+        else:
+            report.replaced += 1
+    else:
+        report.imported += 1
+    data["name"] = name
+    store.put_routine(name, Routine.from_v3(data))
+
+
+def iter_import(store, f, on_duplicate="rename", report=None, chunk=CHUNK, commit=False):
+    """
+    Merge the routines of binary file `f` into loaded `store`, one line at a time.
+    - Each line is validated on its own; invalid lines are counted and skipped.
+    - A name already in the library (including one imported earlier from the same file)
+      is renamed, skipped or replaced according to `on_duplicate`.
+    - Yields `report` after each chunk; with `commit`, the store is committed at each chunk too,
+      so nothing but the current line and the store itself is held in memory.
+    - A JournalStore is not compacted while importing; with `commit`, it is compacted once at the end.
+    Raises ExchangeError when the header is missing or from a newer version.
+    """
+    if on_duplicate not in DUPLICATE_POLICIES:
+        raise ValueError(f"on_duplicate must be one of {DUPLICATE_POLICIES}")
+    report = report or ImportReport()
+    header = None
+    # Compaction rewrites the whole snapshot: once at the end of a bulk import, not every few chunks
+    compact_every = getattr(store, "compact_every", None)
+    if compact_every is not None:
+        store.compact_every = float("inf")
+    try:
+        for raw in f:
+            report.read_bytes += len(raw)
+            report.lines += 1
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                pass
+            elif header is None:
+                header = _read_header(line)
+                report.language = header.get("language")
+            else:
+                _merge_line(store, line, on_duplicate, report)
+            if report.lines % chunk == 0:
+                if commit:
+                    store.commit()
+                yield report
+        if header is None:
+            raise ExchangeError("empty file")
+    finally:
+        if compact_every is not None:
+            store.compact_every = compact_every  # Without `commit`, the store's next commit compacts
+
+    if commit:
+        if compact_every is not None:
+            store.compact()
+        else:
+            store.commit()
+    yield report
+
+
+def iter_import_file(store, path, on_duplicate="rename", chunk=CHUNK, commit=False):
+    with open(path, "rb") as f:
+        report = ImportReport(os.fstat(f.fileno()).st_size)
+        yield from iter_import(store, f, on_duplicate, report, chunk, commit)
+
+
+def import_file(store, path, on_duplicate="rename", commit=False):
+    """Import a whole file; return its ImportReport."""
+    report = None
+    for report in iter_import_file(store, path, on_duplicate, commit=commit):
+        pass
+    return report
+
+
+def open_library(path):
+    """Store of a GUI library: routines.db-style SQLite files by extension, routinesV3.json otherwise."""
+    if path.endswith(".db"):
+        from routinedb import SQLiteStore
+        store = SQLiteStore(path, autocommit=False)
+    else:
+        from routinestore import JournalStore
+        store = JournalStore(path, autocommit=False)
+    store.load()
+    return store
+
+
+def _progress(text):
+    sys.stderr.write(f"\r{text}")
+    sys.stderr.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Share routines as newline-delimited JSON, one routine per line.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="write a library's routines to an .ndjson file")
+    export_parser.add_argument("library", help="routinesV3.json or routines.db")
+    export_parser.add_argument("output", help=".ndjson file to write")
+    import_parser = commands.add_parser("import", help="merge an .ndjson file into a library")
+    import_parser.add_argument("input", help=".ndjson file to read")
+    import_parser.add_argument("library", help="routinesV3.json or routines.db")
+    import_parser.add_argument("--on-duplicate", choices=DUPLICATE_POLICIES, default="rename")
+    args = parser.parse_args(argv)
+
+    store = open_library(args.library)
+    try:
+        if args.command == "export":
+            for written, total in iter_export_file(store.data, args.output):
+                _progress(f"{written}/{total} routines exported")
+        else:
+            try:
+                for report in iter_import_file(store, args.input, args.on_duplicate, commit=True):
+                    _progress(f"{report.progress:.0%} read, {report.lines} lines")
+            except ExchangeError as e:
+                sys.stderr.write(f"\n{args.input}: {e}\n")
+                return 1
+            sys.stderr.write("\n")
+            print(json.dumps(report.summary()))
+            for line, reason in report.problems:
+                sys.stderr.write(f"{args.input}:{line}: {reason}\n")
+            return 0
+        sys.stderr.write("\n")
+    finally:
+        if hasattr(store, "close"):
+            store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+from routinecache import load_json_cached
+
+
+def _escape(text):
+    """Protect braces of a translation before it is used in a format template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class Catalog:
+    """
+    Translations from language.json, read on first use (through its parse cache) instead of on import.
+    - Only the active language is prepared; other languages are prepared when selected.
+    - Hot strings (runner titles, repetition labels) are compiled once into format templates.
+    - validate() checks every language against English's keys and list lengths.
+    """
+
+    REFERENCE = "English"
+
+    def __init__(self, path, language=REFERENCE):
+        self.path = path
+        self.language = language
+        self._raw = None  # Parsed file, read lazily
+        self._texts = None  # Sections of the active language
+        self._templates = None  # Compiled templates of the active language
+        self.problems = []  # Filled by validate()
+
+    def _load(self):
+        if self._raw is None:
+            self._raw = load_json_cached(self.path)
+        return self._raw
+
+    @property
+    def languages(self):
+        return list(self._load())
+
+    def set_language(self, language):
+        """Switch language; its sections and templates are prepared on next use."""
+        if language != self.language:
+            self.language = language
+            self._texts = None
+            self._templates = None
+
+    def section(self, name):
+        """Return a whole section (list or string) of the active language."""
+        if self._texts is None:
+            raw = self._load()
+            self._texts = raw.get(self.language) or raw[self.REFERENCE]
+        return self._texts[name]
+
+    def text(self, name, index=None):
+        section = self.section(name)
+        return section if index is None else section[index]
+
+    def get(self, name, default=None):
+        """Return an optional section, or `default` when the language lacks it."""
+        try:
+            return self.section(name)
+        except KeyError:
+            return default
+
+    def format(self, key, **values):
+        """Fill one of the precompiled hot-path templates."""
+        if self._templates is None:
+            self._templates = self._compile()
+        return self._templates[key].format(**values)
+
+    def _compile(self):
+        u = [_escape(t) for t in self.section("update_routine")]
+        r = [_escape(t) for t in self.section("routine_page")]
+        return {
+            # Static part of the runner screen; the seconds are drawn by the glyph countdown
+            "work_title": "{name}\n" + u[3] + " {repetition}/{repetitions}",
+            "rest_title": u[1] + "\n -> {next}",
+            "units": "{name} - " + u[3] + " {repetition}/{repetitions} - {units} " + u[4],
+            "exercise_duration": "{name}\n{repetitions} " + r[1] + ", {duration}" + r[2],
+            "exercise_units": "{name}\n{repetitions} " + r[1] + ", {units} " + r[3],
+        }
+
+    def validate(self):
+        """
+        Compare every language with English's keys and list lengths.
+        - Missing keys or entries are filled with the English text, so lookups never fail later.
+        - Returns the list of problems found (also kept in self.problems).
+        """
+        raw = self._load()
+        reference = raw[self.REFERENCE]
+        problems = []
+        for language, sections in raw.items():
+            for key, expected in reference.items():
+                actual = sections.get(key)
+                if actual is None:
+                    problems.append(f"{language}: missing '{key}'")
+                    sections[key] = expected
+                elif type(actual) is not type(expected):
+                    problems.append(f"{language}: '{key}' should be a {type(expected).__name__}")
+                    sections[key] = expected
+                elif isinstance(expected, list) and len(actual) < len(expected):
+                    problems.append(f"{language}: '{key}' has {len(actual)} entries instead of {len(expected)}")
+                    actual.extend(expected[len(actual):])
+        self.problems = problems
+        return problems
@@ -0,0 +1,192 @@
+from collections.abc import Mapping, MutableMapping
+
+
+class Exercise:
+    """
+    One exercise, shared by the GUI and fonctionbase.
+    - Slotted: no per-instance __dict__, which matters for libraries of many thousands of exercises.
+    - A truthy duration makes it timed; otherwise it is counted in units.
+    """
+
+    __slots__ = ("name", "duration", "repetitions", "rest", "units")
+
+    def __init__(self, name, duration=0, repetitions=1, rest=0, units=None):
+        self.name = name
+        self.duration = duration
+        self.repetitions = repetitions
+        self.rest = rest
+        self.units = units
+
+    def __eq__(self, other):
+        if not isinstance(other, Exercise):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in Exercise.__slots__)
+
+    def __repr__(self):
+        return (f"Exercise({self.name!r}, duration={self.duration!r}, repetitions={self.repetitions!r}, "
+                f"rest={self.rest!r}, units={self.units!r})")
+
+    @property
+    def timed(self):
+        return bool(self.duration)
+
+    @classmethod
+    def from_v3(cls, data):
+        """Build from a routinesV3.json exercise dict."""
+        return cls(data["name"], data.get("duration", 0), data["repetitions"], data.get("rest", 0), data.get("units"))
+
+    def to_v3(self):
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "repetitions": self.repetitions,
+            "rest": self.rest,
+            "units": self.units,
+        }
+
+    @classmethod
+    def from_legacy(cls, data):
+        """Build from a fonctionbase routines.json exercise dict (dureetot is derived, so ignored)."""
+        return cls(data["nom"], data.get("duree"), data.get("repetitions", 1), data.get("repos", 0), data.get("unites"))
+
+    def to_legacy(self):
+        return {
+            "nom": self.name,
+            "duree": self.duration,
+            "repetitions": self.repetitions,
+            "repos": self.rest,
+            "unites": self.units,
+            "dureetot": ((self.duration or 0) + (self.rest or 0)) * self.repetitions,
+        }
+
+    def copy(self):
+        return type(self)(self.name, self.duration, self.repetitions, self.rest, self.units)
+
+
+class Routine:
+    """A named, ordered list of exercises."""
+
+    __slots__ = ("name", "exercises")
+
+    exercise_class = Exercise  # Class used by the from_* constructors for the exercises
+
+    def __init__(self, name, exercises=None):
+        self.name = name
+        self.exercises = [] if exercises is None else exercises
+
+    def __eq__(self, other):
+        if not isinstance(other, Routine):
+            return NotImplemented
+        return self.name == other.name and self.exercises == other.exercises
+
+    def __repr__(self):
+        return f"Routine({self.name!r}, {len(self.exercises)} exercises)"
+
+    @classmethod
+    def from_v3(cls, data):
+        """Build from a routinesV3.json routine dict."""
+        return cls(data["name"], [cls.exercise_class.from_v3(ex) for ex in data.get("fonctions", [])])
+
+    def to_v3(self):
+        return {"name": self.name, "fonctions": [ex.to_v3() for ex in self.exercises]}
+
+    @classmethod
+    def from_legacy(cls, data):
+        """Build from a fonctionbase routines.json routine dict."""
+        return cls(data["nom"], [cls.exercise_class.from_legacy(ex) for ex in data.get("fonctions", [])])
+
+    def to_legacy(self):
+        return {"nom": self.name, "fonctions": [ex.to_legacy() for ex in self.exercises]}
+
+    def copy(self, name=None):
+        """Return a copy with its own exercises, optionally under a new name."""
+        return type(self)(self.name if name is None else name, [ex.copy() for ex in self.exercises])
+
+
+class RoutineMap(MutableMapping):
+    """
+    Routines by name, in list order: the ordered dict of a loaded library.
+    - The order is an explicit list of names plus each name's position, so swapping or renaming
+      routines rewrites two slots instead of rebuilding the whole mapping.
+    - Deleting shifts the positions of the routines after it, like removing from a list.
+    """
+
+    __slots__ = ("_routines", "_order", "_positions")
+
+    def __init__(self, items=()):
+        self._routines = {}
+        self._order = []
+        self._positions = {}
+        for name, routine in (items.items() if isinstance(items, Mapping) else items):
+            self[name] = routine
+
+    def __getitem__(self, name):
+        return self._routines[name]
+
+    def __setitem__(self, name, routine):
+        """Replace a routine in place, or add it at the end."""
+        if name not in self._routines:
+            self._positions[name] = len(self._order)
+            self._order.append(name)
+        self._routines[name] = routine
+
+    def __delitem__(self, name):
+        del self._routines[name]
+        position = self._positions.pop(name)
+        del self._order[position]
+        for i in range(position, len(self._order)):
+            self._positions[self._order[i]] = i
+
+    def __contains__(self, name):
+        return name in self._routines
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __repr__(self):
+        return f"RoutineMap({self._order!r})"
+
+    def name_at(self, index):
+        return self._order[index]
+
+    def index(self, name):
+        return self._positions[name]
+
+    def swap(self, first, second):
+        """Exchange the positions of two routines."""
+        i, j = self._positions[first], self._positions[second]
+        self._order[i], self._order[j] = second, first
+        self._positions[first], self._positions[second] = j, i
+
+    def rename(self, old, new):
+        """Move the routine at `old` to key `new`, keeping its position."""
+        if new == old:
+            return
+        if new in self._routines:
+            del self[new]
+        position = self._positions.pop(old)
+        self._order[position] = new
+        self._positions[new] = position
+        self._routines[new] = self._routines.pop(old)
+
+
+def as_routine(routine):
+    """Return `routine` as a Routine, converting a routinesV3.json dict (e.g. read from a journal)."""
+    return routine if isinstance(routine, Routine) else Routine.from_v3(routine)
+
+
+def as_exercise(exercise):
+    """Return `exercise` as an Exercise, converting a routinesV3.json dict (e.g. read from a journal)."""
+    return exercise if isinstance(exercise, Exercise) else Exercise.from_v3(exercise)
+
+
+def to_json(obj):
+    """json.dump `default` hook: model objects are written in the routinesV3.json layout."""
+    if isinstance(obj, (Routine, Exercise)):
+        return obj.to_v3()
+    if isinstance(obj, RoutineMap):
+        return dict(obj.items())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
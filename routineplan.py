@@ -0,0 +1,102 @@
+from bisect import bisect_right
+from collections import namedtuple
+
+# Segment kinds
+WORK = "work"      # Timed repetition
+REST = "rest"      # Timed rest between repetitions
+MANUAL = "manual"  # Units-based repetition, ends when the user confirms
+
+# One step of a routine; start is the offset in seconds from the beginning of the routine
+Segment = namedtuple(
+    "Segment",
+    "kind exercise_index exercise_count repetition repetitions name duration units start",
+)
+
+
+def _exercise_fields(ex):
+    """Return (name, duration, repetitions, rest, units) for a routinesV3.json dict or a routinemodel.Exercise."""
+    if isinstance(ex, dict):
+        return ex["name"], ex.get("duration") or 0, ex["repetitions"], ex.get("rest") or 0, ex.get("units")
+    return ex.name, ex.duration or 0, ex.repetitions, ex.rest or 0, ex.units
+
+
+def _routine_fields(routine):
+    """Return (name, exercises) for a routinesV3.json dict or a routinemodel.Routine."""
+    if isinstance(routine, dict):
+        return routine["name"], routine["fonctions"]
+    return routine.name, routine.exercises
+
+
+class RoutinePlan:
+    """Immutable flat timeline of a routine, walked by index by the runners."""
+
+    def __init__(self, name, segments):
+        self.name = name
+        self.segments = tuple(segments)
+
+        # Prefix sums: ends[i] is the offset at which segment i ends
+        self.ends = tuple(s.start + s.duration for s in self.segments)
+        self.total_duration = self.ends[-1] if self.ends else 0
+        self.manual_count = sum(1 for s in self.segments if s.kind == MANUAL)
+
+        # next_work[i] is the index of the first work/manual segment after i (None at the end)
+        next_work = [None] * len(self.segments)
+        upcoming = None
+        for i in range(len(self.segments) - 1, -1, -1):
+            next_work[i] = upcoming
+            if self.segments[i].kind != REST:
+                upcoming = i
+        self.next_work = tuple(next_work)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __getitem__(self, index):
+        return self.segments[index]
+
+    def __iter__(self):
+        return iter(self.segments)
+
+    def time_to_finish(self, index, elapsed=0):
+        """Timed seconds left from `elapsed` seconds into segment `index` (manual steps count 0)."""
+        if index >= len(self.segments):
+            return 0
+        return self.total_duration - self.segments[index].start - elapsed
+
+    def next_up(self, index):
+        """Return the next work/manual segment after `index`, or None."""
+        if index >= len(self.segments):
+            return None
+        following = self.next_work[index]
+        return self.segments[following] if following is not None else None
+
+    def index_at(self, offset):
+        """Return the index of the segment running `offset` seconds into the routine."""
+        return bisect_right(self.ends, offset)
+
+
+def compile_plan(routine):
+    """
+    Compile a routine into a RoutinePlan.
+    - Accepts a routinesV3.json routine dict or a routinemodel.Routine (fonctionbase.Routine included).
+    - An exercise with a duration is timed, otherwise it waits for manual confirmation.
+    - Rest follows every repetition except the very last one; zero-second rests are dropped.
+    """
+    name, exercises = _routine_fields(routine)
+    segments = []
+    offset = 0
+    count = len(exercises)
+    for index, ex in enumerate(exercises):
+        ex_name, duration, repetitions, rest, units = _exercise_fields(ex)
+        for repetition in range(1, repetitions + 1):
+            if duration:
+                segments.append(Segment(WORK, index, count, repetition, repetitions, ex_name, duration, None, offset))
+                offset += duration
+            else:
+                segments.append(Segment(MANUAL, index, count, repetition, repetitions, ex_name, 0, units, offset))
+
+            last = index == count - 1 and repetition == repetitions
+            if rest and not last:
+                segments.append(Segment(REST, index, count, repetition, repetitions, ex_name, rest, None, offset))
+                offset += rest
+    return RoutinePlan(name, segments)
@@ -0,0 +1,154 @@
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+ENV_VAR = "ROUTINEAPP_PROFILE"  # "1", or the path of the trace file to write
+FLAG = "--profile"
+DEFAULT_TRACE_PATH = "routineapp-profile.json"
+
+
+class _NoSpan:
+    """Shared do-nothing context manager returned while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.category, self.start, self.profiler.clock() - self.start, self.args)
+        return False
+
+
+class Profiler:
+    """
+    In-memory recorder of timed spans and samples.
+    - Keeps the last `capacity` events in a ring buffer, so it can stay on for a whole session.
+    - Keeps running per-name statistics (count, total, max) for everything ever recorded.
+    - Exports the ring buffer as a Chrome trace (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self, capacity=20000, clock=time.perf_counter):
+        self.clock = clock
+        self.origin = clock()
+        self.events = collections.deque(maxlen=capacity)  # (name, category, start, duration, args, thread)
+        self.stats = {}  # name -> [count, total, max]
+        self._lock = threading.Lock()  # Saves are recorded from the SaveQueue thread
+
+    def span(self, name, category="app", **args):
+        return _Span(self, name, category, args)
+
+    def record(self, name, category, start, duration, args=None):
+        with self._lock:
+            self.events.append((name, category, start, duration, args, threading.get_ident()))
+            stat = self.stats.get(name)
+            if stat is None:
+                self.stats[name] = [1, duration, duration]
+            else:
+                stat[0] += 1
+                stat[1] += duration
+                stat[2] = max(stat[2], duration)
+
+    def sample(self, name, value, category="sample"):
+        """Record a measured value (e.g. tick jitter in seconds) as a zero-length event."""
+        self.record(name, category, self.clock(), value)
+
+    def summary(self):
+        """Per-name count, total and max, in milliseconds."""
+        with self._lock:
+            return {
+                name: {"count": count, "total_ms": round(total * 1000, 3), "max_ms": round(worst * 1000, 3)}
+                for name, (count, total, worst) in self.stats.items()
+            }
+
+    def chrome_trace(self):
+        with self._lock:
+            events = list(self.events)
+        trace = []
+        for name, category, start, duration, args, thread in events:
+            event = {"name": name, "cat": category, "pid": os.getpid(), "tid": thread,
+                     "ts": round((start - self.origin) * 1e6, 1)}
+            if category == "sample":
+                event.update(ph="C", args={name: duration * 1000})  # Counter track, in ms
+            else:
+                event.update(ph="X", dur=round(duration * 1e6, 1), args=args or {})
+            trace.append(event)
+        return {"traceEvents": trace, "otherData": {"summary": self.summary()}}
+
+    def export(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+
+profiler = None  # The active Profiler, None while profiling is off
+
+
+def enable(capacity=20000):
+    global profiler
+    if profiler is None:
+        profiler = Profiler(capacity)
+    return profiler
+
+
+def enable_from(argv, environ=os.environ):
+    """
+    Turn profiling on from the command line (--profile, removed from argv so Kivy does not
+    see it) or the environment; return the trace path to write, or None when off.
+    """
+    path = None
+    if FLAG in argv:
+        argv.remove(FLAG)
+        path = DEFAULT_TRACE_PATH
+    value = environ.get(ENV_VAR, "")
+    if value and value != "0":
+        path = value if value.endswith(".json") else DEFAULT_TRACE_PATH
+    if path:
+        enable()
+    return path
+
+
+def span(name, category="app", **args):
+    """Time a block; costs one attribute lookup while profiling is off."""
+    if profiler is None:
+        return _NO_SPAN
+    return profiler.span(name, category, **args)
+
+
+def sample(name, value):
+    if profiler is not None:
+        profiler.sample(name, value)
+
+
+def profiled(category):
+    """Decorator timing every call of a function under its qualified name."""
+    def decorate(function):
+        name = function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,215 @@
+import asyncio
+import heapq
+import itertools
+import json
+import sys
+import time
+
+from routineexchange import check_routine
+from routineplan import compile_plan
+from routinesession import RoutineSession
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_BUFFER = 256 * 1024  # Bytes a subscriber may leave unread before it is dropped
+
+
+class SessionScheduler:
+    """
+    Drives any number of RoutineSessions off a single heap of deadlines.
+    - Each session has at most one live heap entry: (deadline, session id, version).
+    - Entries whose version no longer matches the session (paused, skipped, stopped) are
+      dropped when they reach the top, so commands never search the heap.
+    - Finished sessions are forgotten once their last change has been reported.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.sessions = {}
+        self.heap = []
+        self.on_change = None  # Called with every session that changed (used by the server)
+        self._ids = itertools.count(1)
+
+    def add(self, plan, session_id=None, start=None):
+        """Create and start a session for `plan`; return it."""
+        if session_id is None:
+            session_id = str(next(self._ids))
+            while session_id in self.sessions:  # Taken by a client-chosen id
+                session_id = str(next(self._ids))
+        elif session_id in self.sessions:
+            raise ValueError(f"Session {session_id} already exists")
+        session = RoutineSession(plan, session_id, clock=self.clock)
+        session.listeners.append(self._session_changed)
+        self.sessions[session_id] = session
+        session.start(start)
+        return session
+
+    def get(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"Unknown session: {session_id}")
+        return session
+
+    def remove(self, session_id):
+        """Stop a session and forget it."""
+        self.get(session_id).stop()
+        self.sessions.pop(session_id, None)
+
+    def command(self, session_id, name):
+        """Run one of RoutineSession.COMMANDS on a session."""
+        if name not in RoutineSession.COMMANDS:
+            raise ValueError(f"Unknown command: {name}")
+        getattr(self.get(session_id), name)()
+
+    def _session_changed(self, session):
+        deadline = session.next_deadline()
+        if deadline is not None:
+            heapq.heappush(self.heap, (deadline, session.id, session.version))
+        if self.on_change:
+            self.on_change(session)
+        if session.finished and self.sessions.get(session.id) is session:
+            del self.sessions[session.id]
+
+    def run_due(self, now=None):
+        """Advance every session whose deadline has passed; return how many were advanced."""
+        now = self.clock() if now is None else now
+        heap = self.heap
+        advanced = 0
+        while heap and heap[0][0] <= now:
+            _, session_id, version = heapq.heappop(heap)
+            session = self.sessions.get(session_id)
+            if session is None or session.version != version:
+                continue  # Stale entry
+            if session.advance():
+                advanced += 1
+            elif session.next_deadline() is not None:
+                # Woken a hair early by clock granularity: keep the same entry
+                heapq.heappush(heap, (session.next_deadline(), session_id, session.version))
+                break
+        return advanced
+
+    def next_deadline(self):
+        """Earliest live deadline, or None when every session waits on a person."""
+        heap = self.heap
+        while heap:
+            _, session_id, version = heap[0]
+            session = self.sessions.get(session_id)
+            if session is not None and session.version == version:
+                return heap[0][0]
+            heapq.heappop(heap)
+        return None
+
+
+class SessionServer:
+    """
+    Local socket server hosting a SessionScheduler; one JSON object per line both ways.
+    Requests:
+      {"op": "start", "routine": <routinesV3.json routine>, "id": optional}
+      {"op": "subscribe", "id": <session id or "*">}
+      {"op": <RoutineSession.COMMANDS entry>, "id": <session id>}
+      {"op": "remove", "id": <session id>}
+      {"op": "list"}
+    Events: {"event": "state", ...RoutineSession.state()}, {"event": "started"/"removed"/"sessions"/"error", ...}
+    A session ends with a last "state" event (finished) and is then forgotten, subscriptions included.
+    A client that leaves more than MAX_BUFFER bytes of events unread is disconnected.
+    """
+
+    def __init__(self, scheduler=None, host=HOST, port=PORT):
+        self.scheduler = scheduler or SessionScheduler()
+        self.scheduler.on_change = self._publish
+        self.host = host
+        self.port = port
+        self.subscribers = {}  # session id or "*" -> set of StreamWriters
+        self._wake = None
+
+    async def serve(self):
+        self._wake = asyncio.Event()
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self._run())
+
+    async def _run(self):
+        """Sleep until the earliest deadline (or until a request changes it), then advance."""
+        scheduler = self.scheduler
+        while True:
+            scheduler.run_due()
+            deadline = scheduler.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - scheduler.clock())
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = self._request(json.loads(line), writer)
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {"event": "error", "message": str(e)}
+                if reply:
+                    self._send(writer, reply)
+                self._wake.set()  # The earliest deadline may have changed
+                if writer.is_closing():
+                    break  # Dropped as a slow subscriber
+                await writer.drain()  # Read no more requests than the client reads replies
+        finally:
+            self._drop(writer)
+
+    def _request(self, request, writer):
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        op = request["op"]
+        if op == "start":
+            problem = check_routine(request.get("routine"))
+            if problem:
+                raise ValueError(f"Invalid routine: {problem}")
+            session = self.scheduler.add(compile_plan(request["routine"]), request.get("id"))
+            return {"event": "started", "id": session.id}
+        if op == "subscribe":
+            session_id = request.get("id", "*")
+            sessions = list(self.scheduler.sessions.values()) if session_id == "*" else [self.scheduler.get(session_id)]
+            self.subscribers.setdefault(session_id, set()).add(writer)
+            for session in sessions:
+                self._send(writer, {"event": "state", **session.state()})
+            return None
+        if op == "remove":
+            self.scheduler.remove(request["id"])
+            return {"event": "removed", "id": request["id"]}
+        if op == "list":
+            return {"event": "sessions", "ids": list(self.scheduler.sessions)}
+        self.scheduler.command(request["id"], op)
+        return None
+
+    def _publish(self, session):
+        # A writer subscribed to the session and to "*" gets each event once
+        writers = self.subscribers.get(session.id, set()) | self.subscribers.get("*", set())
+        if writers:
+            message = {"event": "state", **session.state()}
+            for writer in writers:
+                self._send(writer, message)
+        if session.finished:
+            self.subscribers.pop(session.id, None)
+
+    def _send(self, writer, message):
+        """Queue a message; a writer with more than MAX_BUFFER bytes still unsent is dropped instead."""
+        if writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            self._drop(writer)
+            return
+        writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _drop(self, writer):
+        """Forget every subscription of a writer and close it."""
+        for writers in self.subscribers.values():
+            writers.discard(writer)
+        writer.close()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    print(f"Routine session server listening on {HOST}:{port}")
+    asyncio.run(SessionServer(port=port).serve())
@@ -0,0 +1,134 @@
+import time
+
+from routineplan import MANUAL, REST
+from routinetimer import Countdown
+
+
+class RoutineSession:
+    """
+    State of one running routine, independent of any window or process.
+    - Walks a RoutinePlan segment by segment; timed segments are deadline countdowns
+      chained on the previous deadline, so a late wakeup never loses time.
+    - advance() catches up on every deadline already passed; whoever drives the session
+      (Kivy clock, scheduler heap) only has to call it at next_deadline().
+    - Listeners are called with the session after every change (segment, pause, end).
+    """
+
+    COMMANDS = ("pause", "resume", "toggle_pause", "skip_rest", "mark_done", "stop")  # Callable remotely
+
+    def __init__(self, plan, session_id=None, clock=time.monotonic):
+        self.plan = plan
+        self.id = session_id
+        self.clock = clock
+        self.index = 0  # Current segment of the plan
+        self.countdown = None  # Countdown of the current timed segment, None while manual or finished
+        self.paused = False
+        self.finished = False
+        self.version = 0  # Bumped on every change, lets schedulers drop stale wakeups
+        self.listeners = []
+
+    @property
+    def segment(self):
+        return None if self.finished else self.plan[self.index]
+
+    def start(self, now=None):
+        self._enter(0, start=now)
+
+    def _enter(self, index, start=None):
+        self.index = index
+        self.countdown = None
+        if index >= len(self.plan):
+            self.finished = True
+        elif self.plan[index].kind != MANUAL:
+            self.countdown = Countdown(self.plan[index].duration, start=start, clock=self.clock)
+            if self.paused:
+                self.countdown.pause()  # A segment entered while paused waits for resume
+        self._changed()
+
+    def _changed(self):
+        self.version += 1
+        for listener in self.listeners:
+            listener(self)
+
+    def advance(self):
+        """Enter every segment whose predecessor's deadline has passed; return True if any."""
+        moved = False
+        while self.countdown is not None and self.countdown.expired():
+            self._enter(self.index + 1, start=self.countdown.deadline)
+            moved = True
+        return moved
+
+    def next_deadline(self):
+        """Monotonic time of the next segment change, or None when nothing is scheduled."""
+        if self.countdown is None or self.countdown.paused:
+            return None
+        return self.countdown.deadline
+
+    def next_wakeup(self, visible=True, step=1.0):
+        """
+        Seconds until the next event worth waking for, or None when nothing will happen
+        without a person (paused, manual confirmation, finished).
+        - Visible: the next change of the displayed value, every `step` seconds (which includes the segment end).
+        - Hidden: the segment end only.
+        """
+        if self.countdown is None or self.countdown.paused:
+            return None
+        return self.countdown.time_to_next_step(step) if visible else self.countdown.remaining()
+
+    def remaining_seconds(self):
+        return self.countdown.remaining_seconds() if self.countdown else 0
+
+    # --- Commands ---
+
+    def pause(self):
+        if not self.paused and not self.finished:
+            self.paused = True
+            if self.countdown:
+                self.countdown.pause()
+            self._changed()
+
+    def resume(self):
+        if self.paused:
+            self.paused = False
+            if self.countdown:
+                self.countdown.resume()
+            self._changed()
+
+    def toggle_pause(self):
+        if self.paused:
+            self.resume()
+        else:
+            self.pause()
+
+    def skip_rest(self):
+        """Leave the current rest segment now."""
+        if not self.finished and self.plan[self.index].kind == REST:
+            self._enter(self.index + 1)
+
+    def mark_done(self):
+        """Confirm the current units-based segment."""
+        if not self.finished and self.plan[self.index].kind == MANUAL:
+            self._enter(self.index + 1)
+
+    def stop(self):
+        if not self.finished:
+            self.finished = True
+            self.countdown = None
+            self._changed()
+
+    def state(self):
+        """Plain-data snapshot for remote clients (they count down `remaining` locally)."""
+        state = {"id": self.id, "index": self.index, "paused": self.paused, "finished": self.finished}
+        segment = self.segment
+        if segment is not None:
+            following = self.plan.next_up(self.index)
+            state.update(
+                kind=segment.kind,
+                name=segment.name,
+                repetition=segment.repetition,
+                repetitions=segment.repetitions,
+                units=segment.units,
+                remaining=self.countdown.remaining() if self.countdown else None,
+                next=following.name if following else None,
+            )
+        return state
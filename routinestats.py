@@ -0,0 +1,139 @@
+_numpy_module = False  # Not looked up yet
+
+
+def _numpy():
+    """Return numpy when installed (imported on first use), else None."""
+    global _numpy_module
+    if _numpy_module is False:
+        try:
+            import numpy
+        except ImportError:  # Optional: the pure-Python path gives the same results
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
+
+def format_duration(seconds):
+    """Format seconds as m:ss, or h:mm:ss from one hour."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class LibraryStats:
+    """
+    Duration figures for every routine of a library, computed column by column in one pass.
+    - Exercises of all routines are flattened into columns (duration, repetitions, rest).
+    - Uses NumPy when installed, plain lists otherwise; both give the same figures: integers,
+      or floats when an imported library has fractional durations or rests.
+    - Same rules as compile_plan: units-based work counts 0 seconds, and there is no rest
+      after the last repetition of the last exercise.
+    """
+
+    def __init__(self, routines, use_numpy=None):
+        """`routines` maps names to routinemodel.Routine objects (fonctionbase.Routine included)."""
+        self.names = list(routines)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+
+        durations, repetitions, rests, counts = [], [], [], []
+        for routine in routines.values():
+            exercises = routine.exercises
+            counts.append(len(exercises))
+            for ex in exercises:
+                durations.append(ex.duration or 0)
+                repetitions.append(ex.repetitions)
+                rests.append(ex.rest or 0)
+        self.durations = durations
+        self.rests = rests
+        self.repetitions = repetitions
+
+        # offsets[i] is the position of routine i's first exercise in the columns
+        self.offsets = [0]
+        for count in counts:
+            self.offsets.append(self.offsets[-1] + count)
+
+        np = _numpy() if use_numpy is not False else None
+        if np is not None:
+            self._compute_numpy(np, counts)
+        else:
+            self._compute_python(counts)
+
+    def _compute_python(self, counts):
+        self.work, self.rest, self.timed, self.starts = [], [], [], []
+        for i, count in enumerate(counts):
+            work = rest = timed = elapsed = 0
+            for j in range(self.offsets[i], self.offsets[i] + count):
+                duration, reps, pause = self.durations[j], self.repetitions[j], self.rests[j]
+                self.starts.append(elapsed)
+                elapsed += (duration + pause) * reps
+                work += duration * reps
+                rest += pause * reps
+                timed += duration > 0
+            if count:
+                rest -= self.rests[self.offsets[i] + count - 1]  # No rest after the very last repetition
+            self.work.append(work)
+            self.rest.append(rest)
+            self.timed.append(timed)
+        self.total = [w + r for w, r in zip(self.work, self.rest)]
+        self.units = [count - timed for count, timed in zip(counts, self.timed)]
+
+    def _compute_numpy(self, np, counts):
+        n = len(counts)
+        counts = np.asarray(counts, dtype=np.int64)
+        durations, rests = np.asarray(self.durations), np.asarray(self.rests)
+        # Integer seconds unless a duration or rest is fractional: then sums must not truncate
+        fractional = any(len(column) and column.dtype.kind == "f" for column in (durations, rests))
+        dtype = np.float64 if fractional else np.int64
+        durations, rests = durations.astype(dtype), rests.astype(dtype)
+        repetitions = np.asarray(self.repetitions, dtype=np.int64)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        owner = np.repeat(np.arange(n), counts)  # Routine index of each exercise
+
+        def per_routine(values, dtype=dtype):
+            return np.bincount(owner, weights=values, minlength=n).astype(dtype)
+
+        work = per_routine(durations * repetitions)
+        rest = per_routine(rests * repetitions)
+        filled = counts > 0
+        rest[filled] -= rests[offsets[1:][filled] - 1]  # No rest after the very last repetition
+        timed = per_routine((durations > 0).astype(np.int64), np.int64)
+
+        # Start offset of each exercise within its routine: exclusive prefix sum, rebased per routine
+        blocks = (durations + rests) * repetitions
+        before = np.cumsum(blocks) - blocks
+        starts = before - before[np.repeat(offsets[:-1], counts)] if len(blocks) else before
+
+        self.work = work.tolist()
+        self.rest = rest.tolist()
+        self.timed = timed.tolist()
+        self.starts = starts.tolist()
+        self.total = (work + rest).tolist()
+        self.units = (counts - timed).tolist()
+
+    def summary(self, name):
+        """Return total, work, rest, timed and units figures of one routine."""
+        i = self.positions[name]
+        return {
+            "total": self.total[i],
+            "work": self.work[i],
+            "rest": self.rest[i],
+            "timed": self.timed[i],
+            "units": self.units[i],
+        }
+
+    def remaining(self, name, exercise_index=0, repetition=1, elapsed=0):
+        """
+        Timed seconds left in a routine from a position.
+        - `elapsed` is the time spent since the repetition started, work then rest.
+        """
+        i = self.positions[name]
+        j = self.offsets[i] + exercise_index
+        if j >= self.offsets[i + 1]:
+            return 0
+        done = self.starts[j] + (repetition - 1) * (self.durations[j] + self.rests[j]) + elapsed
+        return max(self.total[i] - done, 0)
+
+    def library_total(self):
+        return sum(self.total)
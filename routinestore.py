@@ -0,0 +1,302 @@
+import copy
+import json
+import os
+import threading
+
+from routinecache import load_json_cached
+from routinemodel import Routine, RoutineMap, as_exercise, as_routine, to_json
+from routineprofile import span
+
+
+def atomic_write_text(path, text):
+    """Write text to a temporary file, fsync it, then atomically replace `path`."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _snapshot(data):
+    """
+    Copy of `data` that later mutations cannot reach, made without serialising anything.
+    Routines and their exercise lists are copied; exercises are shared, being replaced rather than edited.
+    """
+    snapshot = dict(data)
+    snapshot["routines"] = {name: Routine(r.name, list(r.exercises)) for name, r in data["routines"].items()}
+    return snapshot
+
+
+def apply_operation(data, op):
+    """Apply one journal operation to the routines data (a RoutineMap of routinemodel.Routine objects)."""
+    kind = op[0]
+    routines = data.setdefault("routines", RoutineMap())
+    if kind == "set":
+        _, key, value = op
+        data[key] = value
+    elif kind == "put":
+        _, name, routine = op
+        routines[name] = as_routine(routine)
+    elif kind == "delete":
+        routines.pop(op[1], None)
+    elif kind == "rename":
+        _, old, new = op
+        if old in routines:
+            routines[old].name = new
+            routines.rename(old, new)  # Keeps its position
+    elif kind == "swap":
+        _, first, second = op
+        if first in routines and second in routines:
+            routines.swap(first, second)
+    elif kind == "exercise":
+        _, name, index, exercise = op
+        exercises = routines[name].exercises
+        if index == len(exercises):
+            exercises.append(as_exercise(exercise))
+        else:
+            exercises[index] = as_exercise(exercise)
+    elif kind == "swap_exercises":
+        _, name, first, second = op
+        exercises = routines[name].exercises
+        exercises[first], exercises[second] = exercises[second], exercises[first]
+    else:
+        raise ValueError(f"Unknown journal operation: {kind}")
+
+
+class RoutineStore:
+    """
+    Mutation surface shared by the storage backends.
+    - Each mutation is applied to `data` in memory at once and queued as an operation.
+    - Backends implement load(), commit() (write queued operations) and compact().
+    """
+
+    DEFAULT_DATA = {"first_time": True, "language": "English", "routines": {}}
+
+    def __init__(self, autocommit=True):
+        self.autocommit = autocommit
+        self.data = None
+        self.pending = []  # Operations applied in memory but not yet written
+        self.on_record = None  # Called after each mutation (used by SaveQueue)
+        self.lock = threading.RLock()  # Guards data and pending
+        self._io_lock = threading.Lock()  # Serialises writes to disk
+
+    def set_value(self, key, value):
+        self._record(["set", key, value])
+
+    def put_routine(self, name, routine):
+        """Add a routine at the end, or replace it in place if the name exists."""
+        self._record(["put", name, routine])
+
+    def delete_routine(self, name):
+        self._record(["delete", name])
+
+    def rename_routine(self, old, new):
+        self._record(["rename", old, new])
+
+    def move_routine(self, index, new_index):
+        """Swap the routines at `index` and `new_index`."""
+        routines = self.data["routines"]
+        self._record(["swap", routines.name_at(index), routines.name_at(new_index)])
+
+    def put_exercise(self, name, index, exercise):
+        """Replace exercise `index` of a routine, or add it at the end when `index` is the exercise count."""
+        self._record(["exercise", name, index, exercise])
+
+    def move_exercise(self, name, index, new_index):
+        """Swap the exercises at `index` and `new_index` of a routine."""
+        self._record(["swap_exercises", name, index, new_index])
+
+    def _record(self, op):
+        with self.lock:
+            apply_operation(self.data, op)
+            self.pending.append(op)
+        if self.autocommit:
+            self.commit()
+        elif self.on_record:
+            self.on_record()
+
+
+class JournalStore(RoutineStore):
+    """
+    routinesV3.json snapshot plus an append-only journal of mutations.
+    - Each mutation appends one short line to the journal instead of rewriting the whole file.
+    - After `compact_every` journal entries, the snapshot is rewritten atomically and the journal reset.
+    - Snapshot and journal share a generation number, so a journal already folded into the
+      snapshot (crash between the two steps) is never replayed twice.
+    """
+
+    def __init__(self, path, compact_every=500, autocommit=True):
+        super().__init__(autocommit)
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self.compact_every = compact_every
+        self.generation = 0
+        self.journal_length = 0  # Entries in the journal file since the last compaction
+
+    def load(self):
+        """Load the snapshot (through its parse cache), then replay the journal on top of it."""
+        if os.path.exists(self.path):
+            self.data = load_json_cached(self.path)
+        else:
+            self.data = copy.deepcopy(self.DEFAULT_DATA)
+        self.data["routines"] = RoutineMap((name, as_routine(r)) for name, r in self.data.get("routines", {}).items())
+        self.generation = self.data.get("generation", 0)
+        self.journal_length = self._replay()
+        return self.data
+
+    def _replay(self):
+        """
+        Apply journal entries of the current generation; return how many were applied.
+        - A stale journal (already part of the snapshot) or one without a readable header is removed.
+        - A last line cut by a crash is truncated away, so the next commit appends after intact entries.
+        """
+        if not os.path.exists(self.journal_path):
+            return 0
+        applied = 0
+        with open(self.journal_path, "rb+") as f:
+            header = f.readline()
+            try:
+                current = header.endswith(b"\n") and json.loads(header).get("generation") == self.generation
+            except (ValueError, AttributeError):
+                current = False
+            if current:
+                good = f.tell()  # End of the last intact line
+                for line in f:
+                    try:
+                        op = json.loads(line) if line.endswith(b"\n") else None
+                    except ValueError:
+                        op = None
+                    if op is None:
+                        break  # Cut by a crash: everything before it is intact
+                    apply_operation(self.data, op)
+                    applied += 1
+                    good += len(line)
+                if good < os.fstat(f.fileno()).st_size:
+                    f.truncate(good)
+                    f.flush()
+                    os.fsync(f.fileno())
+        if not current:
+            os.remove(self.journal_path)  # The next commit starts a journal with the right header
+        return applied
+
+    def commit(self):
+        """
+        Append pending operations to the journal; compact when it grows too long.
+        Returns the number of operations made durable.
+        """
+        with self._io_lock:
+            with self.lock:
+                if not self.pending:
+                    return 0
+                count = len(self.pending)
+                compact = self.journal_length + count >= self.compact_every
+                if not compact:
+                    # Serialise under the lock; the file write happens without blocking mutations
+                    lines = [json.dumps(op, ensure_ascii=False, separators=(",", ":"), default=to_json) for op in self.pending]
+                    self.pending = []
+                    header = json.dumps({"generation": self.generation})
+                    self.journal_length += count
+
+            if compact:
+                self._compact_locked()
+                return count
+
+            new_file = not os.path.exists(self.journal_path)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                if new_file:
+                    f.write(header + "\n")
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            return count
+
+    def compact(self):
+        """Fold everything into a new snapshot and start an empty journal."""
+        with self._io_lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        """
+        Compaction body; the caller holds the I/O lock.
+        Only the snapshot copy is made under the data lock: mutations are not blocked while it is
+        serialised and written, and stay pending for the journal of the new generation.
+        """
+        with self.lock:
+            self.pending = []
+            generation = self.generation + 1
+            snapshot = _snapshot(self.data)
+            snapshot["generation"] = generation
+        atomic_write_text(self.path, json.dumps(snapshot, indent=4, default=to_json))
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        with self.lock:
+            self.generation = generation
+            self.data["generation"] = generation
+            self.journal_length = 0
+
+
+class SaveQueue:
+    """
+    Write-behind persistence for a RoutineStore.
+    - Mutations only mark the store dirty; the UI thread never waits on the disk.
+    - A worker thread waits `window` seconds after the first mutation of a burst,
+      then makes the whole burst durable in one write.
+    """
+
+    def __init__(self, store, window=0.5):
+        self.store = store
+        self.window = window
+        self.mutations = 0  # Mutations recorded
+        self.operations_written = 0  # Mutations made durable
+        self.writes = 0  # Durable writes issued
+        self._dirty = threading.Event()
+        self._stop = threading.Event()  # Set by close(); also cuts the debounce wait short
+        self._counters_lock = threading.Lock()
+
+        store.autocommit = False
+        store.on_record = self.mark_dirty
+
+        self._thread = threading.Thread(target=self._run, name="routine-save-queue", daemon=True)
+        self._thread.start()
+
+    @property
+    def coalesced(self):
+        """Mutations that shared a write with an earlier mutation."""
+        return self.operations_written - self.writes
+
+    def stats(self):
+        return {"mutations": self.mutations, "writes": self.writes, "coalesced": self.coalesced}
+
+    def mark_dirty(self):
+        self.mutations += 1
+        self._dirty.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._dirty.wait()
+            if self._stop.wait(self.window):  # Let the rest of the burst arrive
+                return  # Closed: close() writes what is pending
+            self._dirty.clear()
+            self._write()
+
+    def _write(self):
+        with span("save", "store"):
+            written = self.store.commit()
+        if written:
+            with self._counters_lock:
+                self.writes += 1
+                self.operations_written += written
+
+    def flush(self):
+        """Make every pending mutation durable now (app pause/stop)."""
+        self._write()
+
+    def close(self, timeout=5.0):
+        """Stop the worker thread and flush."""
+        self._stop.set()
+        self._dirty.set()
+        self._thread.join(timeout)
+        self._write()
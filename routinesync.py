@@ -0,0 +1,300 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from routinedb import est_format_legacy
+from routinemodel import Routine
+from routinestore import JournalStore, atomic_write_text
+
+LEGACY_NAME = "routines.json"  # File read and written by fonctionbase
+V3_NAME = "routinesV3.json"  # File read and written by routineapp
+BATCH_STATE_NAME = ".routinesync.json"
+STATE_VERSION = 1
+
+
+def content_hash(routine):
+    """
+    Hash of what a routine means, not how it is written: the same routine gives the same
+    hash from routines.json and routinesV3.json (derived dureetot and None/0 spellings ignored).
+    """
+    exercises = [[ex.name, ex.duration or 0, ex.repetitions, ex.rest or 0, ex.units or None] for ex in routine.exercises]
+    text = json.dumps([routine.name, exercises], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _v3_stat(path):
+    """The snapshot and its journal both carry edits of a routinesV3.json library."""
+    return [_stat(path), _stat(f"{path}.journal")]
+
+
+class SyncResult:
+    """What one sync changed on each side."""
+
+    def __init__(self, legacy_path, v3_path):
+        self.legacy_path = legacy_path
+        self.v3_path = v3_path
+        self.unchanged = False  # Neither file changed since the last sync: nothing was read
+        self.to_v3 = 0  # Routines written or deleted in routinesV3.json
+        self.to_legacy = 0  # Routines written or deleted in routines.json
+        self.conflicts = 0  # Changed on both sides; the preferred side won
+
+    def summary(self):
+        return {
+            "legacy": self.legacy_path,
+            "v3": self.v3_path,
+            "unchanged": self.unchanged,
+            "to_v3": self.to_v3,
+            "to_legacy": self.to_legacy,
+            "conflicts": self.conflicts,
+        }
+
+
+class _LegacySide:
+    """routines.json, read only when its hashes are not known or it must be written."""
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.dirty = False
+
+    def load(self):
+        if self.data is None:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            else:
+                self.data = {}
+        return self.data
+
+    def routines(self):
+        return {name: _named(Routine.from_legacy(r), name) for name, r in self.load().items()}
+
+    def routine(self, name):
+        """One routine, spelled as routineapp expects (no None duration or rest)."""
+        routine = _named(Routine.from_legacy(self.load()[name]), name)
+        for ex in routine.exercises:
+            ex.duration = ex.duration or 0
+            ex.rest = ex.rest or 0
+        return routine
+
+    def put(self, name, routine):
+        self.load()[name] = routine.to_legacy()
+        self.dirty = True
+
+    def delete(self, name):
+        self.load().pop(name, None)
+        self.dirty = True
+
+    def save(self):
+        if self.dirty:
+            # Same layout as fonctionbase.sauvegarder_routines
+            atomic_write_text(self.path, json.dumps(self.data, indent=4))
+
+
+class _V3Side:
+    """routinesV3.json through its JournalStore, so changed routines are appended to the journal."""
+
+    def __init__(self, path):
+        self.path = path
+        self.store = None
+        self.dirty = False
+
+    def load(self):
+        if self.store is None:
+            self.store = JournalStore(self.path, autocommit=False)
+            self.store.load()
+        return self.store
+
+    def routines(self):
+        return self.load().data["routines"]
+
+    def put(self, name, routine):
+        self.load().put_routine(name, routine)
+        self.dirty = True
+
+    def delete(self, name):
+        self.load().delete_routine(name)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        if os.path.exists(self.path):
+            self.store.commit()
+        else:
+            self.store.compact()  # New library: write a snapshot rather than a bare journal
+
+
+def _named(routine, name):
+    routine.name = name  # The mapping key is authoritative
+    return routine
+
+
+def sync_pair(legacy_path, v3_path, entry=None, prefer="v3"):
+    """
+    Bring routines.json and routinesV3.json to the same routines.
+    - `entry` is the state left by the previous sync of this pair (updated in place):
+      the file stats then and the content hash of every routine.
+    - A side whose file stats did not change is not read; its hashes are the recorded ones.
+    - A routine changed (added, edited or deleted) on one side only is copied to the other;
+      changed on both sides differently, the `prefer` side ("v3" or "legacy") wins.
+    - Only sides with changes are written; routinesV3.json only gets journal entries for them.
+    """
+    entry = {} if entry is None else entry
+    result = SyncResult(legacy_path, v3_path)
+    legacy_stat, v3_stat = _stat(legacy_path), _v3_stat(v3_path)
+    if entry.get("legacy") == legacy_stat and entry.get("v3") == v3_stat:
+        result.unchanged = True
+        return result
+
+    base = entry.get("hashes", {})
+    legacy, v3 = _LegacySide(legacy_path), _V3Side(v3_path)
+    if entry.get("legacy") == legacy_stat:
+        legacy_hashes = base
+    else:
+        legacy_hashes = {name: content_hash(r) for name, r in legacy.routines().items()}
+    if entry.get("v3") == v3_stat:
+        v3_hashes = base
+    else:
+        v3_hashes = {name: content_hash(r) for name, r in v3.routines().items()}
+
+    hashes = {}
+    for name in {**v3_hashes, **legacy_hashes, **base}:
+        ours, theirs, before = legacy_hashes.get(name), v3_hashes.get(name), base.get(name)
+        if ours == theirs:
+            winner = ours
+        elif ours == before:
+            winner = theirs
+        elif theirs == before:
+            winner = ours
+        else:
+            result.conflicts += 1
+            winner = theirs if prefer == "v3" else ours
+
+        if winner != theirs:
+            if winner is None:
+                v3.delete(name)
+            else:
+                v3.put(name, legacy.routine(name))
+            result.to_v3 += 1
+        if winner != ours:
+            if winner is None:
+                legacy.delete(name)
+            else:
+                legacy.put(name, v3.routines()[name])
+            result.to_legacy += 1
+        if winner is not None:
+            hashes[name] = winner
+
+    legacy.save()
+    v3.save()
+    entry.update(legacy=_stat(legacy_path), v3=_v3_stat(v3_path), hashes=hashes)
+    return result
+
+
+def load_state(path):
+    """Sync state file: {"version", "pairs": {legacy path: entry}}; empty when missing or from another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        state = None
+    if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+        state = {"version": STATE_VERSION, "pairs": {}}
+    return state
+
+
+def save_state(path, state):
+    atomic_write_text(path, json.dumps(state, separators=(",", ":")))
+
+
+def find_legacy_files(root, name=LEGACY_NAME):
+    """Every fonctionbase file under `root`, in a stable order."""
+    for folder, dirs, files in os.walk(root):
+        dirs.sort()
+        if name in files:
+            yield os.path.join(folder, name)
+
+
+def sync_directory(root, prefer="v3", legacy_name=LEGACY_NAME, v3_name=V3_NAME, on_result=None):
+    """
+    Sync every routines.json under `root` with the routinesV3.json next to it.
+    - One state file at the root holds the stats and hashes of every pair, so a re-run over
+      unchanged files only stats them.
+    - Files that are not in the fonctionbase layout are left alone.
+    Returns the list of SyncResults.
+    """
+    state_path = os.path.join(root, BATCH_STATE_NAME)
+    state = load_state(state_path)
+    pairs = state["pairs"]
+    results = []
+    try:
+        for legacy_path in find_legacy_files(root, legacy_name):
+            key = os.path.relpath(legacy_path, root)
+            v3_path = os.path.join(os.path.dirname(legacy_path), v3_name)
+            if key not in pairs and not _is_legacy_file(legacy_path):
+                continue
+            result = sync_pair(legacy_path, v3_path, pairs.setdefault(key, {}), prefer)
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        save_state(state_path, state)  # Pairs synced before a failure are not redone
+    return results
+
+
+def _is_legacy_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return data == {} or (isinstance(data, dict) and est_format_legacy(data))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep fonctionbase routines.json and routineapp routinesV3.json in sync.")
+    parser.add_argument("--prefer", choices=("v3", "legacy"), default="v3",
+                        help="side that wins when a routine changed on both (default: v3)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pair_parser = commands.add_parser("pair", help="sync one routines.json with one routinesV3.json")
+    pair_parser.add_argument("legacy", help="fonctionbase routines.json")
+    pair_parser.add_argument("v3", help="routineapp routinesV3.json")
+    batch_parser = commands.add_parser("batch", help="sync every routines.json under a directory")
+    batch_parser.add_argument("root")
+    args = parser.parse_args(argv)
+
+    if args.command == "pair":
+        state_path = f"{args.v3}.sync"
+        state = load_state(state_path)
+        result = sync_pair(args.legacy, args.v3, state["pairs"].setdefault(os.path.abspath(args.legacy), {}), args.prefer)
+        save_state(state_path, state)
+        print(json.dumps(result.summary()))
+    else:
+        totals = {"pairs": 0, "unchanged": 0, "to_v3": 0, "to_legacy": 0, "conflicts": 0}
+
+        def count(result):
+            totals["pairs"] += 1
+            totals["unchanged"] += result.unchanged
+            totals["to_v3"] += result.to_v3
+            totals["to_legacy"] += result.to_legacy
+            totals["conflicts"] += result.conflicts
+            if result.conflicts:
+                sys.stderr.write(f"{result.legacy_path}: {result.conflicts} conflict(s), kept {args.prefer}\n")
+        sync_directory(args.root, args.prefer, on_result=count)
+        print(json.dumps(totals))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import json
+import time
+
+# Columns of one segment row, times in seconds since the run started
+SEGMENT_FIELDS = ("index", "kind", "duration", "scheduled_start", "actual_start", "actual_end", "paused", "interrupted")
+
+
+class SessionTelemetry:
+    """
+    Per-segment timing log of one RoutineSession run.
+    - For every work/rest segment: when it was due to start (the deadline it is chained on),
+      when it actually started and ended, and how long it was paused.
+    - Drift accumulates (actual length - planned length - pauses) over segments that ran to
+      their deadline; with chained deadlines it should stay within one wakeup's lateness.
+    - Appended as one compact JSON line per run by save().
+    """
+
+    def __init__(self, session, routine_name, clock=None):
+        self.session = session
+        self.routine_name = routine_name
+        self.clock = clock or session.clock
+        self.origin = self.clock()
+        self.started_at = time.time()  # Wall clock, to place the run in a day's schedule
+        self.rows = []
+        self.saved = False
+        self._open = None  # [row, countdown] of the segment being timed
+        self._index = None
+        self._paused_at = None
+        session.listeners.append(self.on_change)
+
+    def _now(self):
+        return self.clock() - self.origin
+
+    def on_change(self, session):
+        """Session listener: close the previous segment and open the new one, track pauses."""
+        now = self._now()
+        if session.index != self._index or session.finished:
+            self._close(now)
+            self._index = session.index
+            if session.countdown is not None and not session.finished:
+                segment = session.segment
+                row = [session.index, segment.kind, segment.duration,
+                       round(session.countdown.start - self.origin, 4), round(now, 4), None, 0.0, False]
+                self._open = [row, session.countdown]
+                self.rows.append(row)
+                if session.paused:
+                    self._paused_at = now
+
+        if self._open is not None:
+            if session.paused and self._paused_at is None:
+                self._paused_at = now
+            elif not session.paused and self._paused_at is not None:
+                self._open[0][6] = round(self._open[0][6] + now - self._paused_at, 4)
+                self._paused_at = None
+
+    def _close(self, now):
+        if self._open is None:
+            return
+        row, countdown = self._open
+        if self._paused_at is not None:
+            row[6] = round(row[6] + now - self._paused_at, 4)
+            self._paused_at = None
+        row[5] = round(now, 4)
+        # Left before its deadline: skipped or stopped, so not counted as drift
+        row[7] = countdown.paused or self.clock() < countdown.deadline
+        self._open = None
+
+    def summary(self):
+        completed = [row for row in self.rows if row[5] is not None and not row[7]]
+        lags = [row[4] - row[3] for row in self.rows]
+        drift = sum(row[5] - row[4] - row[6] - row[2] for row in completed)
+        return {
+            "segments": len(self.rows),
+            "completed": len(completed),
+            "max_lag_ms": round(max(lags, default=0.0) * 1000, 1),
+            "total_drift_ms": round(drift * 1000, 1),
+        }
+
+    def record(self):
+        self._close(self._now())
+        return {
+            "routine": self.routine_name,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "finished": self.session.finished,
+            "summary": self.summary(),
+            "fields": SEGMENT_FIELDS,
+            "segments": self.rows,
+        }
+
+    def save(self, path):
+        """Append this run to the NDJSON log at `path` (once)."""
+        if self.saved:
+            return
+        self.saved = True
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.record(), ensure_ascii=False, separators=(",", ":")) + "\n")
@@ -0,0 +1,146 @@
+import math
+import time
+
+
+class Countdown:
+    """Countdown towards a deadline measured with time.monotonic()."""
+
+    def __init__(self, duration, start=None, clock=time.monotonic):
+        self.duration = duration
+        self._clock = clock
+        # Chaining on the previous deadline keeps consecutive segments drift-free
+        self.start = clock() if start is None else start
+        self.deadline = self.start + duration
+        self._paused_remaining = None
+
+    @property
+    def paused(self):
+        return self._paused_remaining is not None
+
+    def remaining(self):
+        """Return the remaining time in seconds (never negative)."""
+        if self.paused:
+            return self._paused_remaining
+        return max(0.0, self.deadline - self._clock())
+
+    def remaining_seconds(self):
+        """Return the remaining time rounded up to whole seconds, as displayed."""
+        return math.ceil(self.remaining())
+
+    def overrun(self):
+        """Return how late we are past the deadline (0 if not expired)."""
+        if self.paused:
+            return 0.0
+        return max(0.0, self._clock() - self.deadline)
+
+    def expired(self):
+        """Return True once the deadline has passed."""
+        return not self.paused and self._clock() >= self.deadline
+
+    def time_to_next_second(self):
+        """Return the delay until the displayed second changes."""
+        return self.time_to_next_step(1.0)
+
+    def time_to_next_step(self, step):
+        """Return the delay until a display rounded up to `step` seconds (1.0 or 0.1) changes."""
+        remaining = self.remaining()
+        fraction = remaining - math.floor(remaining / step) * step
+        return fraction if fraction > 1e-9 else min(step, remaining)
+
+    def pause(self):
+        """Freeze the countdown."""
+        if not self.paused:
+            self._paused_remaining = self.remaining()
+
+    def resume(self):
+        """Restart the countdown from where it was frozen."""
+        if self.paused:
+            self.deadline = self._clock() + self._paused_remaining
+            self._paused_remaining = None
+
+
+class TimerEngine:
+    """
+    Wakeup source of a running session.
+    - Wakes once, at the next event the caller asks for; there is no fixed interval,
+      so paused or manual-confirm states cost no wakeups at all.
+    - Arming again replaces the pending wakeup, so callbacks never stack.
+    - Counts wakeups to report a per-minute rate.
+    """
+
+    def __init__(self, schedule_once, clock=time.monotonic):
+        self._schedule_once = schedule_once  # e.g. kivy Clock.schedule_once
+        self.clock = clock
+        self.wakeups = 0
+        self.started_at = None
+        self.lateness = 0.0  # Seconds between the last wakeup's due time and when it actually ran
+        self._on_wake = None
+        self._event = None
+        self._due = None
+
+    @property
+    def running(self):
+        return self._on_wake is not None
+
+    @property
+    def armed(self):
+        return self._event is not None
+
+    def start(self, on_wake):
+        """Route wakeups to on_wake(dt), replacing any previous owner, and reset the counters."""
+        self.stop()
+        self._on_wake = on_wake
+        self.wakeups = 0
+        self.started_at = self.clock()
+
+    def arm(self, delay):
+        """Wake once after `delay` seconds; None leaves nothing scheduled."""
+        self.disarm()
+        if delay is not None and self.running:
+            delay = max(0.0, delay)
+            self._due = self.clock() + delay
+            self._event = self._schedule_once(self._fire, delay)
+
+    def disarm(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _fire(self, dt):
+        self._event = None
+        self.wakeups += 1
+        self.lateness = self.clock() - self._due
+        if self._on_wake:
+            self._on_wake(dt)
+
+    def stop(self):
+        """Cancel the pending wakeup and release the owner."""
+        self.disarm()
+        self._on_wake = None
+
+    def wakeups_per_minute(self):
+        if self.started_at is None:
+            return 0.0
+        elapsed = self.clock() - self.started_at
+        return self.wakeups * 60 / elapsed if elapsed > 0 else 0.0
+
+
+def countdown_text(remaining, step=1.0):
+    """Remaining time as displayed: whole seconds rounded up, or tenths when `step` is 0.1."""
+    if step >= 1:
+        return str(math.ceil(remaining))
+    return f"{math.ceil(remaining * 10 - 1e-9) / 10:.1f}"
+
+
+def run_countdown(duration, on_second=None, start=None, clock=time.monotonic, sleep=time.sleep):
+    """
+    Blocking countdown for the command-line version.
+    - Sleeps until each displayed second changes instead of sleeping a fixed 1s.
+    - Returns the deadline so the next segment can be chained on it.
+    """
+    countdown = Countdown(duration, start=start, clock=clock)
+    while not countdown.expired():
+        if on_second:
+            on_second(countdown.remaining_seconds())
+        sleep(countdown.time_to_next_second())
+    return countdown.deadline
@@ -0,0 +1,16 @@
+import asyncio
+import io
+
+from fonctionasync import Seance, executer_seances
+from routinemodel import Exercise, Routine
+
+
+def test_end_of_input_ends_a_session_waiting_for_done():
+    lignes = []
+    routine = Routine("r", [Exercise("pompes", 0, 2, 0, 10)])
+    seance = Seance(routine, afficher=lignes.append)
+
+    asyncio.run(asyncio.wait_for(executer_seances([seance], flux=io.StringIO(""), afficher=lignes.append), 2))
+
+    assert seance.terminee
+    assert lignes[-1] == "[r] Routine arrêtée."
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+import routinecache
+from routinecache import load_json_cached
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "language.json"
+    path.write_text(json.dumps({"English": {"title": "Routines"}}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count the JSON parses made by the cache."""
+    calls = []
+    loads = json.loads
+
+    def counting_loads(text, **kwargs):
+        calls.append(text)
+        return loads(text, **kwargs)
+
+    monkeypatch.setattr(routinecache.json, "loads", counting_loads)
+    return calls
+
+
+def test_unchanged_source_is_read_from_the_snapshot(source, parses):
+    assert load_json_cached(str(source)) == {"English": {"title": "Routines"}}
+    assert (source.parent / "language.json.cache").exists()
+    assert load_json_cached(str(source)) == {"English": {"title": "Routines"}}
+    assert len(parses) == 1
+
+
+def test_changed_source_is_parsed_again(source, parses):
+    load_json_cached(str(source))
+    stat = source.stat()
+    source.write_text(json.dumps({"English": {"title": "Routinez"}}), encoding="utf-8")
+    routinecache.os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Same size and mtime: only the hash differs
+
+    assert load_json_cached(str(source)) == {"English": {"title": "Routinez"}}
+    assert len(parses) == 2
+
+
+@pytest.mark.parametrize("snapshot", [b"", b"\xff\xff\xff\xff", b"\x04\x00\x00\x00garbage"])
+def test_corrupt_snapshot_falls_back_to_json_and_is_rebuilt(source, parses, snapshot):
+    cache = source.parent / "language.json.cache"
+    cache.write_bytes(snapshot)
+
+    assert load_json_cached(str(source)) == {"English": {"title": "Routines"}}
+    assert cache.read_bytes() != snapshot
+    assert load_json_cached(str(source)) == {"English": {"title": "Routines"}}
+    assert len(parses) == 1
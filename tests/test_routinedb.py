@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from routinedb import SQLiteStore, convertir_legacy, importer_donnees, migrer_json
+from routinemodel import Exercise, Routine
+from routinestore import JournalStore
+
+
+def open_store(path, **kwargs):
+    store = SQLiteStore(str(path), **kwargs)
+    store.load()
+    return store
+
+
+def routine(name, *exercises):
+    return Routine(name, list(exercises) or [Exercise("plank", 30, 3, 10)])
+
+
+def exercise_rows(store, name):
+    return store.connection.execute(
+        "SELECT e.position, e.name FROM exercises e JOIN routines r ON r.id = e.routine_id "
+        "WHERE r.name = ? ORDER BY e.position", (name,)
+    ).fetchall()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = open_store(tmp_path / "routines.db")
+    for name in "abc":
+        store.put_routine(name, routine(name))
+    yield store
+    store.close()
+
+
+def test_mutations_survive_reload(tmp_path, store):
+    store.set_value("language", "Français")
+    store.put_routine("b", routine("b", Exercise("pompes", 0, 2, 5, 12)))
+    store.move_routine(0, 2)
+    store.rename_routine("b", "d")
+    store.delete_routine("a")
+
+    reloaded = open_store(tmp_path / "routines.db")
+    assert list(reloaded.data["routines"]) == ["c", "d"]
+    assert reloaded.data["routines"]["d"] == Routine("d", [Exercise("pompes", 0, 2, 5, 12)])
+    assert reloaded.data["language"] == "Français"
+
+
+def test_swap_only_exchanges_two_positions(store):
+    before = dict(store.connection.execute("SELECT name, position FROM routines"))
+    changes = store.connection.total_changes
+    store.move_routine(0, 2)
+    assert store.connection.total_changes - changes == 2
+    after = dict(store.connection.execute("SELECT name, position FROM routines"))
+    assert after == {"a": before["c"], "b": before["b"], "c": before["a"]}
+    assert list(store.data["routines"]) == ["c", "b", "a"]
+
+
+def test_exercise_edits_touch_only_their_rows(tmp_path, store):
+    store.put_routine("a", routine("a", Exercise("plank", 30, 1, 0), Exercise("pompes", 0, 2, 5, 12)))
+    changes = store.connection.total_changes
+    store.move_exercise("a", 0, 1)
+    assert store.connection.total_changes - changes == 3  # Through a free position
+    store.put_exercise("a", 0, Exercise("squats", 20, 1, 0))
+    store.put_exercise("a", 2, Exercise("lunges", 20, 1, 0))
+    assert store.connection.total_changes - changes == 5
+
+    assert exercise_rows(store, "a") == [(0, "squats"), (1, "plank"), (2, "lunges")]
+    reloaded = open_store(tmp_path / "routines.db")
+    assert reloaded.data["routines"]["a"] == store.data["routines"]["a"]
+
+
+def test_convertir_legacy():
+    legacy = {"r": {"nom": "r", "fonctions": [
+        {"nom": "pompes", "duree": None, "repetitions": 2, "repos": 5, "unites": 12, "dureetot": 10},
+        {"nom": "plank", "duree": 30, "repetitions": 1, "repos": None, "unites": None, "dureetot": 30},
+    ]}}
+    assert convertir_legacy(legacy) == {"routines": {"r": {"name": "r", "fonctions": [
+        {"name": "pompes", "duration": 0, "repetitions": 2, "rest": 5, "units": 12},
+        {"name": "plank", "duration": 30, "repetitions": 1, "rest": 0, "units": None},
+    ]}}}
+
+
+def test_importer_donnees_accepts_both_layouts(tmp_path):
+    v3 = {"language": "Deutsch", "generation": 4, "routines": {"r": routine("r").to_v3()}}
+    importer_donnees(v3, str(tmp_path / "v3.db"))
+    store = open_store(tmp_path / "v3.db")
+    assert store.data["routines"]["r"] == routine("r")
+    assert store.data["language"] == "Deutsch"
+    assert "generation" not in store.data
+
+    importer_donnees({"r": routine("r").to_legacy()}, str(tmp_path / "legacy.db"))
+    assert open_store(tmp_path / "legacy.db").data["routines"]["r"] == routine("r")
+
+
+def test_migrer_json_includes_the_uncompacted_journal(tmp_path):
+    json_path = tmp_path / "routinesV3.json"
+    library = JournalStore(str(json_path))
+    library.load()
+    library.put_routine("a", routine("a"))
+    library.compact()
+    library.put_routine("b", routine("b"))
+    library.rename_routine("a", "z")
+    assert (tmp_path / "routinesV3.json.journal").exists()
+
+    migrer_json(str(json_path), str(tmp_path / "routines.db"))
+    assert list(open_store(tmp_path / "routines.db").data["routines"]) == ["z", "b"]
+
+
+def test_migrer_json_reads_legacy_files(tmp_path):
+    json_path = tmp_path / "routines.json"
+    json_path.write_text(json.dumps({"r": routine("r").to_legacy()}))
+    migrer_json(str(json_path), str(tmp_path / "routines.db"))
+    assert list(open_store(tmp_path / "routines.db").data["routines"]) == ["r"]
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from routineexchange import VERSION, ExchangeError, export_file, import_file
+from routinemodel import Exercise, Routine
+from routinestore import JournalStore
+
+
+def routine(name, repetitions=3):
+    return Routine(name, [Exercise("plank", 30, repetitions, 10)])
+
+
+def open_store(path, routines=(), **kwargs):
+    store = JournalStore(str(path), autocommit=False, **kwargs)
+    store.load()
+    for r in routines:
+        store.put_routine(r.name, r)
+    store.compact()
+    return store
+
+
+def write_export(path, *lines, version=VERSION):
+    header = {"format": "routineapp-routines", "version": version, "language": "Français"}
+    path.write_text("\n".join(json.dumps(line) for line in (header, *lines)) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def library(tmp_path):
+    return open_store(tmp_path / "routinesV3.json", [routine("a"), routine("b")])
+
+
+def test_export_then_import_round_trip(tmp_path, library):
+    path = tmp_path / "export.ndjson"
+    assert export_file(library.data, str(path)) == 2
+
+    target = open_store(tmp_path / "other.json")
+    report = import_file(target, str(path), commit=True)
+    assert report.imported == 2
+    assert open_store(tmp_path / "other.json").data["routines"] == library.data["routines"]
+
+
+@pytest.mark.parametrize("policy, names, count", [
+    ("rename", ["a", "b", "a (2)", "c", "a (3)"], {"imported": 1, "renamed": 2}),
+    ("skip", ["a", "b", "c"], {"imported": 1, "skipped": 2}),
+    ("replace", ["a", "b", "c"], {"imported": 1, "replaced": 2}),
+])
+def test_duplicate_policies(tmp_path, library, policy, names, count):
+    path = tmp_path / "export.ndjson"
+    write_export(path, routine("a", 9).to_v3(), routine("c").to_v3(), routine("a", 8).to_v3())
+
+    report = import_file(library, str(path), on_duplicate=policy, commit=True)
+    routines = open_store(library.path).data["routines"]
+    assert list(routines) == names
+    assert {key: value for key, value in report.summary().items() if value and key in count} == count
+    if policy == "replace":
+        assert routines["a"].exercises[0].repetitions == 8  # The last one in the file wins
+    if policy == "skip":
+        assert routines["a"].exercises[0].repetitions == 3
+
+
+def test_invalid_lines_are_reported_and_skipped(tmp_path, library):
+    path = tmp_path / "export.ndjson"
+    bad_repetitions = routine("x").to_v3()
+    bad_repetitions["fonctions"][0]["repetitions"] = 0
+    write_export(path, bad_repetitions, {"name": "", "fonctions": []}, routine("c").to_v3())
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    report = import_file(library, str(path), commit=True)
+    assert report.imported == 1
+    assert report.invalid == 3
+    assert report.problems == [(2, "exercise 1: invalid repetitions"), (3, "missing name"), (5, "invalid JSON")]
+    assert report.language == "Français"
+
+
+def test_header_is_required_and_version_checked(tmp_path, library):
+    path = tmp_path / "export.ndjson"
+    write_export(path, routine("c").to_v3(), version=VERSION + 1)
+    with pytest.raises(ExchangeError):
+        import_file(library, str(path))
+
+    path.write_text(json.dumps(routine("c").to_v3()) + "\n", encoding="utf-8")
+    with pytest.raises(ExchangeError):
+        import_file(library, str(path))
+
+    path.write_text("", encoding="utf-8")
+    with pytest.raises(ExchangeError):
+        import_file(library, str(path))
+    assert list(library.data["routines"]) == ["a", "b"]
+
+
+def test_bulk_import_compacts_once_at_the_end(tmp_path, library):
+    library.compact_every = 5
+    path = tmp_path / "export.ndjson"
+    write_export(path, *(routine(f"r{i}").to_v3() for i in range(20)))
+    generation = library.generation
+
+    import_file(library, str(path), commit=True)
+    assert library.generation == generation + 1
+    assert library.compact_every == 5
+    assert len(open_store(library.path).data["routines"]) == 22
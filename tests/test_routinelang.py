@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from routinelang import Catalog
+
+LANGUAGES = {
+    "English": {
+        "home_page": ["Add a routine", "Delete", "Rename"],
+        "update_routine": ["", "Rest", "", "Rep", "units"],
+        "routine_page": ["", "reps", "s", "units"],
+        "title": "Routines",
+    },
+    "Français": {
+        "home_page": ["Ajouter une routine"],
+        "update_routine": ["", "Repos {x}", "", "Rép", "unités"],
+        "routine_page": ["", "rép", "s", "unités"],
+        "title": ["not", "a", "string"],
+    },
+}
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "language.json"
+    path.write_text(json.dumps(LANGUAGES, ensure_ascii=False), encoding="utf-8")
+    return Catalog(str(path), "Français")
+
+
+def test_validate_fills_gaps_from_the_reference_language(catalog):
+    problems = catalog.validate()
+    assert problems == [
+        "Français: 'home_page' has 1 entries instead of 3",
+        "Français: 'title' should be a str",
+    ]
+    assert catalog.section("home_page") == ["Ajouter une routine", "Delete", "Rename"]
+    assert catalog.text("title") == "Routines"
+
+
+def test_missing_keys(catalog):
+    assert catalog.get("exchange") is None
+    assert catalog.get("exchange", ["Import"]) == ["Import"]
+    with pytest.raises(KeyError):
+        catalog.text("exchange")
+
+
+def test_unknown_language_falls_back_to_english(catalog):
+    catalog.set_language("Klingon")
+    assert catalog.text("home_page", 0) == "Add a routine"
+    assert catalog.languages == ["English", "Français"]
+
+
+def test_templates_follow_the_language_and_keep_braces(catalog):
+    assert catalog.format("rest_title", next="plank") == "Repos {x}\n -> plank"
+    catalog.set_language("English")
+    assert catalog.format("work_title", name="plank", repetition=1, repetitions=3) == "plank\nRep 1/3"
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from routinemodel import Exercise, Routine, RoutineMap, to_json
+
+
+def routines(*names):
+    return RoutineMap((name, Routine(name)) for name in names)
+
+
+def test_routine_map_keeps_list_order():
+    library = routines("a", "b", "c")
+    library["a"] = Routine("a2")  # Replaced in place
+    library["d"] = Routine("d")
+    assert list(library) == ["a", "b", "c", "d"]
+    assert library["a"].name == "a2"
+    assert [library.index(name) for name in library] == [0, 1, 2, 3]
+
+
+def test_routine_map_swap_rename_and_delete():
+    library = routines("a", "b", "c", "d")
+    library.swap("a", "c")
+    library.rename("b", "x")
+    assert list(library) == ["c", "x", "a", "d"]
+    assert library.name_at(1) == "x" and "b" not in library
+
+    del library["x"]
+    assert list(library) == ["c", "a", "d"]
+    assert [library.index(name) for name in library] == [0, 1, 2]
+    assert library.pop("missing", None) is None
+    assert library == {"c": Routine("c"), "a": Routine("a"), "d": Routine("d")}
+
+
+EXERCISES = [
+    Exercise("plank", 30, 3, 10),  # Timed, no units
+    Exercise("pompes", None, 2, 0, 12),  # Counted in units, as fonctionbase writes it: no duration, zero rest
+    Exercise("squats", 0, 1, 5, 20),
+    Exercise("stretch", 45, 1, None),
+]
+
+
+@pytest.mark.parametrize("exercise", EXERCISES, ids=lambda ex: ex.name)
+def test_exercise_round_trips(exercise):
+    assert Exercise.from_v3(exercise.to_v3()) == exercise
+    assert Exercise.from_legacy(exercise.to_legacy()) == exercise
+
+
+def test_routine_round_trips_keep_exercise_order():
+    routine = Routine("r", [ex.copy() for ex in EXERCISES])
+    assert Routine.from_v3(routine.to_v3()) == routine
+    assert Routine.from_legacy(routine.to_legacy()) == routine
+    assert [ex.name for ex in Routine.from_legacy(routine.to_legacy()).exercises] == ["plank", "pompes", "squats", "stretch"]
+
+
+def test_legacy_layout():
+    legacy = Routine("r", [Exercise("pompes", None, 2, 0, 12), Exercise("plank", 30, 3, 10)]).to_legacy()
+    assert legacy == {"nom": "r", "fonctions": [
+        {"nom": "pompes", "duree": None, "repetitions": 2, "repos": 0, "unites": 12, "dureetot": 0},
+        {"nom": "plank", "duree": 30, "repetitions": 3, "repos": 10, "unites": None, "dureetot": 120},
+    ]}
+    # dureetot is derived, and missing keys take the fonctionbase defaults
+    assert Exercise.from_legacy({"nom": "plank", "duree": 30, "dureetot": 999}) == Exercise("plank", 30, 1, 0, None)
+
+
+def test_v3_defaults():
+    assert Exercise.from_v3({"name": "plank", "repetitions": 2}) == Exercise("plank", 0, 2, 0, None)
+    assert Routine.from_v3({"name": "r"}) == Routine("r")
+
+
+def test_library_order_survives_a_json_round_trip():
+    library = routines("c", "a", "b")
+    text = json.dumps(library, default=to_json)
+    assert list(json.loads(text)) == ["c", "a", "b"]
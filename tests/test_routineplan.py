@@ -0,0 +1,62 @@
+from routineplan import MANUAL, REST, WORK, compile_plan
+from routinemodel import Exercise, Routine
+
+ROUTINE = Routine("r", [
+    Exercise("plank", 30, 2, 10),
+    Exercise("pompes", 0, 1, 5, 12),
+    Exercise("squats", 20, 2, 15),
+])
+
+# (kind, exercise index, repetition, duration, units, start), worked out by hand
+EXPECTED = [
+    (WORK, 0, 1, 30, None, 0),
+    (REST, 0, 1, 10, None, 30),
+    (WORK, 0, 2, 30, None, 40),
+    (REST, 0, 2, 10, None, 70),
+    (MANUAL, 1, 1, 0, 12, 80),
+    (REST, 1, 1, 5, None, 80),
+    (WORK, 2, 1, 20, None, 85),
+    (REST, 2, 1, 15, None, 105),
+    (WORK, 2, 2, 20, None, 120),  # No rest after the very last repetition
+]
+
+
+def test_segments_of_a_known_routine():
+    plan = compile_plan(ROUTINE)
+    assert [(s.kind, s.exercise_index, s.repetition, s.duration, s.units, s.start) for s in plan] == EXPECTED
+    assert plan.total_duration == 140
+    assert plan.manual_count == 1
+
+
+def test_dict_and_model_routines_compile_alike():
+    assert compile_plan(ROUTINE.to_v3()).segments == compile_plan(ROUTINE).segments
+
+
+def test_zero_rest_is_dropped():
+    plan = compile_plan(Routine("r", [Exercise("plank", 30, 3, 0)]))
+    assert [s.kind for s in plan] == [WORK, WORK, WORK]
+    assert plan.total_duration == 90
+
+
+def test_time_to_finish():
+    plan = compile_plan(ROUTINE)
+    assert plan.time_to_finish(0) == 140
+    assert plan.time_to_finish(0, 12) == 128
+    assert plan.time_to_finish(4) == 60  # Manual steps count 0 seconds
+    assert plan.time_to_finish(8, 5) == 15
+    assert plan.time_to_finish(len(plan)) == 0
+
+
+def test_index_at_and_next_up():
+    plan = compile_plan(ROUTINE)
+    assert [plan.index_at(offset) for offset in (0, 29, 30, 80, 119, 139)] == [0, 0, 1, 5, 7, 8]
+    assert plan.next_up(1).exercise_index == 0 and plan.next_up(1).repetition == 2
+    assert plan.next_up(3).kind == MANUAL
+    assert plan.next_up(8) is None
+
+
+def test_empty_routine():
+    plan = compile_plan(Routine("r"))
+    assert len(plan) == 0
+    assert plan.total_duration == 0
+    assert plan.time_to_finish(0) == 0
@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+import pytest
+
+from routineplan import compile_plan
+from routineserver import MAX_BUFFER, SessionScheduler, SessionServer
+
+ROUTINE = {"name": "r", "fonctions": [{"name": "plank", "duration": 5, "repetitions": 1, "rest": 0, "units": None}]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTransport:
+    def __init__(self):
+        self.buffered = 0
+
+    def get_write_buffer_size(self):
+        return self.buffered
+
+
+class FakeWriter:
+    def __init__(self):
+        self.messages = []
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def write(self, data):
+        self.messages.append(json.loads(data))
+
+    def close(self):
+        self.closed = True
+
+
+def test_duplicate_id_is_rejected_and_the_first_session_kept():
+    scheduler = SessionScheduler(clock=FakeClock())
+    first = scheduler.add(compile_plan(ROUTINE), "a")
+    with pytest.raises(ValueError):
+        scheduler.add(compile_plan(ROUTINE), "a")
+    assert scheduler.sessions == {"a": first}
+
+
+def test_generated_ids_skip_client_chosen_ones():
+    scheduler = SessionScheduler(clock=FakeClock())
+    scheduler.add(compile_plan(ROUTINE), "1")
+    assert scheduler.add(compile_plan(ROUTINE)).id == "2"
+
+
+def test_finished_sessions_are_forgotten():
+    clock = FakeClock()
+    scheduler = SessionScheduler(clock=clock)
+    scheduler.add(compile_plan(ROUTINE), "a")
+    clock.now = 10.0
+    scheduler.run_due()
+    assert scheduler.sessions == {}
+    assert scheduler.next_deadline() is None
+
+
+def test_remove_stops_and_forgets_a_session():
+    scheduler = SessionScheduler(clock=FakeClock())
+    session = scheduler.add(compile_plan(ROUTINE), "a")
+    scheduler.remove("a")
+    assert session.finished
+    assert scheduler.sessions == {}
+    with pytest.raises(ValueError):
+        scheduler.remove("a")
+
+
+def test_subscribe_to_unknown_session_is_an_error_and_not_recorded():
+    server = SessionServer(SessionScheduler(clock=FakeClock()))
+    writer = FakeWriter()
+    with pytest.raises(ValueError):
+        server._request({"op": "subscribe", "id": "missing"}, writer)
+    assert server.subscribers == {}
+
+
+def test_subscribers_get_the_final_state_then_are_dropped():
+    clock = FakeClock()
+    server = SessionServer(SessionScheduler(clock=clock))
+    writer = FakeWriter()
+    server._request({"op": "start", "routine": ROUTINE, "id": "a"}, writer)
+    server._request({"op": "subscribe", "id": "a"}, writer)
+    clock.now = 10.0
+    server.scheduler.run_due()
+    assert writer.messages[-1]["finished"] is True
+    assert server.subscribers == {}
+
+
+def test_subscribed_to_a_session_and_to_all_gets_each_event_once():
+    clock = FakeClock()
+    server = SessionServer(SessionScheduler(clock=clock))
+    writer = FakeWriter()
+    server._request({"op": "start", "routine": ROUTINE, "id": "a"}, writer)
+    server._request({"op": "subscribe", "id": "a"}, writer)
+    server._request({"op": "subscribe", "id": "*"}, writer)
+    del writer.messages[:]
+    server._request({"op": "pause", "id": "a"}, writer)
+    assert len(writer.messages) == 1
+
+
+def test_slow_subscriber_is_dropped():
+    server = SessionServer(SessionScheduler(clock=FakeClock()))
+    slow, reader = FakeWriter(), FakeWriter()
+    server._request({"op": "start", "routine": ROUTINE, "id": "a"}, slow)
+    for writer in (slow, reader):
+        server._request({"op": "subscribe", "id": "*"}, writer)
+    slow.transport.buffered = MAX_BUFFER + 1
+    server._request({"op": "pause", "id": "a"}, reader)
+
+    assert slow.closed and not reader.closed
+    assert server.subscribers == {"*": {reader}}
+    assert reader.messages[-1]["paused"] is True
+
+
+@pytest.mark.parametrize("request_line", [
+    b"[1]",
+    b'"start"',
+    b'{"op": "start", "routine": [1]}',
+    b'{"op": "start", "routine": {"name": "r", "fonctions": [1]}}',
+    b"not json",
+])
+def test_malformed_requests_get_an_error_and_keep_the_connection(request_line):
+    async def exchange():
+        server = SessionServer(SessionScheduler(clock=FakeClock()))
+        server._wake = asyncio.Event()
+        listener = await asyncio.start_server(server._handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request_line + b"\n" + b'{"op": "list"}\n')
+        replies = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return replies
+
+    error, listing = asyncio.run(asyncio.wait_for(exchange(), 5))
+    assert error["event"] == "error"
+    assert listing == {"event": "sessions", "ids": []}
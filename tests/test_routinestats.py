@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from routineplan import compile_plan
+from routinemodel import Exercise, Routine
+from routinestats import LibraryStats, format_duration
+
+
+def random_library(seed, fractional=False):
+    """Routines of every shape: empty, timed, units-based, zero rests, and imported fractional seconds."""
+    rng = random.Random(seed)
+    library = {}
+    for i in range(200):
+        exercises = []
+        for j in range(rng.randint(0, 8)):
+            duration = rng.choice([0, 0, rng.randint(1, 120)])
+            rest = rng.choice([0, rng.randint(1, 60)])
+            if fractional and rng.random() < 0.3:
+                duration, rest = duration + rng.choice([0.5, 0.25, 0.1]), rest + 0.5
+            exercises.append(Exercise(f"e{j}", duration, rng.randint(1, 5), rest, None if duration else rng.randint(1, 30)))
+        library[f"r{i}"] = Routine(f"r{i}", exercises)
+    return library
+
+
+@pytest.mark.parametrize("fractional", [False, True])
+def test_python_totals_match_the_compiled_plans(fractional):
+    library = random_library(1, fractional)
+    stats = LibraryStats(library, use_numpy=False)
+    for name, routine in library.items():
+        assert stats.summary(name)["total"] == pytest.approx(compile_plan(routine).total_duration)
+
+
+@pytest.mark.parametrize("fractional", [False, True])
+def test_numpy_and_python_agree(fractional):
+    pytest.importorskip("numpy")
+    library = random_library(2, fractional)
+    python, numpy = LibraryStats(library, use_numpy=False), LibraryStats(library)
+    for column in ("work", "rest", "total", "timed", "units", "starts"):
+        assert getattr(numpy, column) == pytest.approx(getattr(python, column)), column
+    if not fractional:
+        assert all(type(value) is int for value in numpy.total)
+
+
+def test_remaining():
+    library = {"r": Routine("r", [Exercise("plank", 30, 2, 10), Exercise("squats", 20, 1, 5)])}
+    stats = LibraryStats(library, use_numpy=False)
+    assert stats.summary("r")["total"] == 100  # 30 + 10 + 30 + 10 + 20, no rest at the very end
+    assert stats.remaining("r") == 100
+    assert stats.remaining("r", 0, 2, 15) == 45
+    assert stats.remaining("r", 1) == 20
+    assert stats.remaining("r", 2) == 0
+
+
+def test_format_duration():
+    assert [format_duration(s) for s in (0, 59, 61, 3600, 3725.5)] == ["0:00", "0:59", "1:01", "1:00:00", "1:02:05"]
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+
+from routinemodel import Exercise, Routine
+from routinestore import JournalStore, SaveQueue
+
+
+def open_store(path, **kwargs):
+    store = JournalStore(str(path), **kwargs)
+    store.load()
+    return store
+
+
+def names(path):
+    return list(open_store(path).data["routines"])
+
+
+def test_edits_survive_reload(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path)
+    store.put_routine("a", Routine("a", [Exercise("push-ups", 30, 3, 10)]))
+    store.put_routine("b", Routine("b"))
+    store.rename_routine("b", "c")
+    store.move_routine(0, 1)
+
+    reloaded = open_store(path)
+    assert list(reloaded.data["routines"]) == ["c", "a"]
+    assert reloaded.data["routines"]["a"].exercises == [Exercise("push-ups", 30, 3, 10)]
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path, compact_every=3)
+    for name in "abcd":
+        store.put_routine(name, Routine(name))
+    assert names(path) == ["a", "b", "c", "d"]
+    assert json.loads(path.read_text())["generation"] == 1
+
+
+def test_mutations_are_not_blocked_while_compaction_serialises(tmp_path, monkeypatch):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path, autocommit=False)
+    store.put_routine("a", Routine("a", [Exercise("push-ups", 30, 3, 10)]))
+    dumps = json.dumps
+    edits = []
+
+    def edit():  # As the app does: change the routine in place, then record it
+        routine = store.data["routines"]["a"]
+        routine.exercises.append(Exercise("squats", 20, 1, 0))
+        store.put_routine("a", routine)
+        store.put_routine("b", Routine("b"))
+
+    def slow_dumps(obj, **kwargs):
+        if kwargs.get("indent"):  # The snapshot: edit the library from another thread meanwhile
+            thread = threading.Thread(target=edit)
+            thread.start()
+            thread.join(1)
+            edits.append(not thread.is_alive())
+        return dumps(obj, **kwargs)
+
+    monkeypatch.setattr("routinestore.json.dumps", slow_dumps)
+    store.compact()
+    monkeypatch.undo()
+    assert edits == [True]
+    assert open_store(path).data["routines"]["a"].exercises == [Exercise("push-ups", 30, 3, 10)]
+
+    store.commit()  # The edits made during compaction go to the new generation's journal
+    reloaded = open_store(path)
+    assert list(reloaded.data["routines"]) == ["a", "b"]
+    assert len(reloaded.data["routines"]["a"].exercises) == 2
+    assert reloaded.generation == store.generation == 1
+
+
+def test_torn_last_line_is_truncated_before_new_edits(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path)
+    store.put_routine("a", Routine("a"))
+    journal = tmp_path / "routinesV3.json.journal"
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('["put","b",{"name":"b","fonc')  # Crash in the middle of a write
+
+    store = open_store(path)
+    assert list(store.data["routines"]) == ["a"]
+    store.put_routine("c", Routine("c"))
+    assert names(path) == ["a", "c"]
+
+
+def test_valid_line_without_newline_is_not_appended_to(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    open_store(path).put_routine("a", Routine("a"))
+    journal = tmp_path / "routinesV3.json.journal"
+    journal.write_text(journal.read_text() + '["delete","a"]')
+
+    store = open_store(path)
+    store.put_routine("c", Routine("c"))
+    assert names(path) == ["a", "c"]
+
+
+def test_stale_journal_is_dropped_and_new_edits_kept(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path)
+    store.put_routine("a", Routine("a"))
+    journal = tmp_path / "routinesV3.json.journal"
+    stale = journal.read_text()
+    store.compact()
+    journal.write_text(stale)  # Crash between the snapshot rewrite and the journal removal
+
+    store = open_store(path)
+    assert list(store.data["routines"]) == ["a"]
+    store.put_routine("z", Routine("z"))
+    assert names(path) == ["a", "z"]
+
+
+def test_unreadable_header_is_dropped(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    journal = tmp_path / "routinesV3.json.journal"
+    journal.write_text('{"genera')
+
+    store = open_store(path)
+    store.put_routine("a", Routine("a"))
+    assert names(path) == ["a"]
+
+
+def test_save_queue_close_during_debounce_window(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path)
+    queue = SaveQueue(store, window=0.5)
+    store.put_routine("a", Routine("a"))
+    time.sleep(0.05)  # The worker is now waiting for the rest of the burst
+
+    started = time.monotonic()
+    queue.close()
+    assert time.monotonic() - started < 0.5
+    assert not queue._thread.is_alive()
+    assert names(path) == ["a"]
+
+
+def test_save_queue_coalesces_a_burst(tmp_path):
+    path = tmp_path / "routinesV3.json"
+    store = open_store(path)
+    queue = SaveQueue(store, window=0.05)
+    for name in "abc":
+        store.put_routine(name, Routine(name))
+    time.sleep(0.3)
+    assert queue.stats() == {"mutations": 3, "writes": 1, "coalesced": 2}
+    queue.close()
+    assert names(path) == ["a", "b", "c"]
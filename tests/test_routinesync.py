@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from routinemodel import Exercise, Routine
+from routinestore import JournalStore
+from routinesync import content_hash, sync_directory, sync_pair
+
+
+def legacy_routine(name, repetitions=3):
+    return Routine(name, [Exercise("pompes", None, repetitions, 10, 12)]).to_legacy()
+
+
+def write_legacy(path, routines):
+    path.write_text(json.dumps(routines, indent=4))
+    bump(path)
+
+
+def read_legacy(path):
+    return json.loads(path.read_text())
+
+
+def v3_store(path):
+    store = JournalStore(str(path), autocommit=False)
+    store.load()
+    return store
+
+
+def edit_v3(path, edit):
+    store = v3_store(path)
+    edit(store)
+    store.commit()
+    bump(f"{path}.journal")
+
+
+def bump(path):
+    """Move the mtime forward, so a rewrite within the clock's resolution is still seen."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def pair(tmp_path):
+    legacy, v3 = tmp_path / "routines.json", tmp_path / "routinesV3.json"
+    write_legacy(legacy, {"a": legacy_routine("a"), "b": legacy_routine("b")})
+    entry = {}
+    sync_pair(str(legacy), str(v3), entry)
+    return legacy, v3, entry
+
+
+def test_same_routine_hashes_alike_in_both_layouts():
+    legacy = Routine.from_legacy(legacy_routine("a"))
+    v3 = Routine("a", [Exercise("pompes", 0, 3, 10, 12)])
+    assert content_hash(legacy) == content_hash(v3)
+
+
+def test_first_sync_copies_legacy_routines(pair):
+    legacy, v3, entry = pair
+    assert list(v3_store(v3).data["routines"]) == ["a", "b"]
+    assert v3_store(v3).data["routines"]["a"].exercises == [Exercise("pompes", 0, 3, 10, 12)]
+
+
+def test_unchanged_files_are_not_read(pair):
+    legacy, v3, entry = pair
+    result = sync_pair(str(legacy), str(v3), entry)
+    assert result.unchanged
+    assert (result.to_v3, result.to_legacy) == (0, 0)
+
+
+def test_change_on_one_side_is_copied_to_the_other(pair):
+    legacy, v3, entry = pair
+    edit_v3(v3, lambda store: store.put_routine("c", Routine("c", [Exercise("plank", 30, 1, 0)])))
+    write_legacy(legacy, {"a": legacy_routine("a", 5)})  # Edit "a", delete "b"
+
+    result = sync_pair(str(legacy), str(v3), entry)
+    assert (result.to_v3, result.to_legacy, result.conflicts) == (2, 1, 0)
+    assert sorted(read_legacy(legacy)) == ["a", "c"]
+    routines = v3_store(v3).data["routines"]
+    assert sorted(routines) == ["a", "c"]
+    assert routines["a"].exercises[0].repetitions == 5
+
+
+def test_v3_side_is_only_journaled(pair):
+    legacy, v3, entry = pair
+    snapshot = v3.read_text()
+    write_legacy(legacy, {"a": legacy_routine("a", 5), "b": legacy_routine("b")})
+    sync_pair(str(legacy), str(v3), entry)
+    assert v3.read_text() == snapshot
+    assert len((v3.parent / "routinesV3.json.journal").read_text().splitlines()) == 2  # Header and one put
+
+
+@pytest.mark.parametrize("prefer, repetitions", [("v3", 7), ("legacy", 5)])
+def test_conflict_goes_to_the_preferred_side(pair, prefer, repetitions):
+    legacy, v3, entry = pair
+    write_legacy(legacy, {"a": legacy_routine("a", 5), "b": legacy_routine("b")})
+    edit_v3(v3, lambda store: store.put_routine("a", Routine("a", [Exercise("pompes", 0, 7, 10, 12)])))
+
+    result = sync_pair(str(legacy), str(v3), entry, prefer=prefer)
+    assert result.conflicts == 1
+    assert read_legacy(legacy)["a"]["fonctions"][0]["repetitions"] == repetitions
+    assert v3_store(v3).data["routines"]["a"].exercises[0].repetitions == repetitions
+
+
+def test_edit_against_delete_keeps_the_edit_only_if_preferred(pair):
+    legacy, v3, entry = pair
+    write_legacy(legacy, {"a": legacy_routine("a", 5), "b": legacy_routine("b")})
+    edit_v3(v3, lambda store: store.delete_routine("a"))
+
+    result = sync_pair(str(legacy), str(v3), entry)
+    assert result.conflicts == 1
+    assert "a" not in read_legacy(legacy)
+
+
+def test_same_change_on_both_sides_is_not_a_conflict(pair):
+    legacy, v3, entry = pair
+    write_legacy(legacy, {"a": legacy_routine("a", 5), "b": legacy_routine("b")})
+    edit_v3(v3, lambda store: store.put_routine("a", Routine("a", [Exercise("pompes", 0, 5, 10, 12)])))
+
+    result = sync_pair(str(legacy), str(v3), entry)
+    assert (result.to_v3, result.to_legacy, result.conflicts) == (0, 0, 0)
+
+
+def test_batch_skips_files_in_another_layout(tmp_path):
+    (tmp_path / "site1").mkdir()
+    (tmp_path / "site2").mkdir()
+    write_legacy(tmp_path / "site1" / "routines.json", {"a": legacy_routine("a")})
+    (tmp_path / "site2" / "routines.json").write_text(json.dumps({"routines": {}}))
+
+    results = sync_directory(str(tmp_path))
+    assert [os.path.basename(os.path.dirname(r.legacy_path)) for r in results] == ["site1"]
+    assert all(r.unchanged for r in sync_directory(str(tmp_path)))
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from routinemodel import Exercise, Routine
+from routineplan import compile_plan
+from routinesession import RoutineSession
+from routinetelemetry import SEGMENT_FIELDS, SessionTelemetry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(clock, session, *steps):
+    """Move the clock to each time, then advance the session or run a command on it."""
+    for now, action in steps:
+        clock.now = now
+        getattr(session, action)()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def session(clock):
+    # Work 0-10, rest 10-15, work 15-25 when every wakeup is on time
+    return RoutineSession(compile_plan(Routine("r", [Exercise("plank", 10, 2, 5)])), clock=clock)
+
+
+def test_late_wakeups_and_pauses(clock, session):
+    telemetry = SessionTelemetry(session, "r")
+    session.start()
+    run(clock, session, (10.5, "advance"), (15.2, "advance"), (20.0, "pause"), (23.0, "resume"), (28.1, "advance"))
+
+    assert telemetry.rows == [
+        [0, "work", 10, 0.0, 0.0, 10.5, 0.0, False],
+        [1, "rest", 5, 10.0, 10.5, 15.2, 0.0, False],
+        [2, "work", 10, 15.0, 15.2, 28.1, 3.0, False],  # Resumed at 23 with 5 s left
+    ]
+    summary = telemetry.summary()
+    assert summary["segments"] == summary["completed"] == 3
+    assert summary["max_lag_ms"] == 500.0
+    assert summary["total_drift_ms"] == pytest.approx(100.0)  # 0.5 - 0.3 - 0.1: late wakeups do not add up
+
+
+def test_skipped_segments_are_not_drift(clock, session):
+    telemetry = SessionTelemetry(session, "r")
+    session.start()
+    run(clock, session, (10.0, "advance"), (12.0, "skip_rest"), (20.0, "stop"))
+
+    assert [row[7] for row in telemetry.rows] == [False, True, True]
+    assert telemetry.summary()["completed"] == 1
+    assert telemetry.summary()["total_drift_ms"] == 0.0
+
+
+def test_save_appends_one_line_per_run(tmp_path, clock, session):
+    path = tmp_path / "routinesV3.json.timing"
+    telemetry = SessionTelemetry(session, "r")
+    session.start()
+    run(clock, session, (10.0, "advance"), (15.0, "advance"), (25.0, "advance"))
+    telemetry.save(str(path))
+    telemetry.save(str(path))  # A second save of the same run writes nothing
+    SessionTelemetry(RoutineSession(compile_plan(Routine("s")), clock=clock), "s").save(str(path))
+
+    first, second = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(first) == ["fields", "finished", "routine", "segments", "started_at", "summary"]
+    assert first["routine"] == "r" and first["finished"] is True
+    assert first["fields"] == list(SEGMENT_FIELDS)
+    assert all(len(row) == len(SEGMENT_FIELDS) for row in first["segments"])
+    assert first["summary"] == {"segments": 3, "completed": 3, "max_lag_ms": 0.0, "total_drift_ms": 0.0}
+    assert second["routine"] == "s" and second["segments"] == []
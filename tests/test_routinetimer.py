@@ -0,0 +1,40 @@
+from routinetimer import Countdown, TimerEngine, countdown_text
+
+
+class FakeEvent:
+    def __init__(self, callback, delay):
+        self.callback = callback
+        self.delay = delay
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, callback, delay):
+        event = FakeEvent(callback, delay)
+        self.events.append(event)
+        return event
+
+
+def test_arming_again_cancels_the_pending_wakeup():
+    schedule = FakeScheduler()
+    engine = TimerEngine(schedule, clock=lambda: 0.0)
+    engine.start(lambda dt: None)
+    engine.arm(1.0)
+    engine.arm(0.5)
+    assert [event.cancelled for event in schedule.events] == [True, False]
+
+
+def test_time_to_next_step_follows_the_display():
+    now = [0.0]
+    countdown = Countdown(5, clock=lambda: now[0])
+    now[0] = 0.25
+    assert abs(countdown.time_to_next_second() - 0.75) < 1e-9
+    assert abs(countdown.time_to_next_step(0.1) - 0.05) < 1e-9
+    assert countdown_text(countdown.remaining()) == "5"
+    assert countdown_text(countdown.remaining(), 0.1) == "4.8"